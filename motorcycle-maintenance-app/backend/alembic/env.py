@@ -0,0 +1,69 @@
+# backend/alembic/env.py
+import asyncio
+from logging.config import fileConfig
+
+from sqlalchemy.engine import Connection
+
+from alembic import context
+
+from app.core.config import settings
+from app.core.database import Base, build_engines
+import app.models  # noqa: F401 - register all tables on Base.metadata
+
+config = context.config
+
+# Only configure logging when run from the alembic CLI; the app owns logging otherwise
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL for DATABASE_URL without connecting"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,  # SQLite needs batch mode for ALTER TABLE
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    writer, reader = build_engines(settings.DATABASE_URL, settings.DATABASE_PROFILE)
+
+    async with writer.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await writer.dispose()
+    await reader.dispose()
+
+
+def run_migrations_online() -> None:
+    # The app passes its own connection in (see app.core.migrations)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
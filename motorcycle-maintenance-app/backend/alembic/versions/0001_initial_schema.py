@@ -0,0 +1,179 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 01:01:08.528575
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('motorcycles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('make', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('engine_size', sa.Integer(), nullable=True),
+    sa.Column('license_plate', sa.String(), nullable=True),
+    sa.Column('vin', sa.String(), nullable=True),
+    sa.Column('current_mileage', sa.Float(), nullable=True),
+    sa.Column('purchase_date', sa.DateTime(), nullable=True),
+    sa.Column('purchase_price', sa.Float(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_archived', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('motorcycles', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_motorcycles_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_motorcycles_license_plate'), ['license_plate'], unique=True)
+        batch_op.create_index(batch_op.f('ix_motorcycles_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_motorcycles_vin'), ['vin'], unique=True)
+
+    op.create_table('webhook_configs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('url', sa.String(), nullable=False),
+    sa.Column('secret', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('event_types', sa.Text(), nullable=True),
+    sa.Column('service_type', sa.String(), nullable=True),
+    sa.Column('max_retries', sa.Integer(), nullable=True),
+    sa.Column('retry_delay', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('last_triggered', sa.DateTime(), nullable=True),
+    sa.Column('total_calls', sa.Integer(), nullable=True),
+    sa.Column('successful_calls', sa.Integer(), nullable=True),
+    sa.Column('failed_calls', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('webhook_configs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_webhook_configs_id'), ['id'], unique=False)
+
+    op.create_table('maintenance_records',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('service_type', sa.Enum('OIL_CHANGE', 'TIRE_REPLACEMENT', 'BRAKE_SERVICE', 'CHAIN_MAINTENANCE', 'VALVE_ADJUSTMENT', 'SPARK_PLUG', 'AIR_FILTER', 'COOLANT_CHANGE', 'GENERAL_INSPECTION', 'CUSTOM', name='servicetype'), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('performed_at', sa.DateTime(), nullable=False),
+    sa.Column('mileage_at_service', sa.Float(), nullable=False),
+    sa.Column('next_service_mileage', sa.Float(), nullable=True),
+    sa.Column('next_service_date', sa.DateTime(), nullable=True),
+    sa.Column('service_interval_km', sa.Float(), nullable=True),
+    sa.Column('service_interval_months', sa.Integer(), nullable=True),
+    sa.Column('labor_cost', sa.Float(), nullable=True),
+    sa.Column('parts_cost', sa.Float(), nullable=True),
+    sa.Column('total_cost', sa.Float(), nullable=True),
+    sa.Column('currency', sa.String(), nullable=True),
+    sa.Column('service_provider', sa.String(), nullable=True),
+    sa.Column('technician', sa.String(), nullable=True),
+    sa.Column('receipt_path', sa.String(), nullable=True),
+    sa.Column('photos', sa.Text(), nullable=True),
+    sa.Column('is_completed', sa.Boolean(), nullable=True),
+    sa.Column('is_scheduled', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_maintenance_records_id'), ['id'], unique=False)
+
+    op.create_table('parts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('part_number', sa.String(), nullable=True),
+    sa.Column('manufacturer', sa.String(), nullable=True),
+    sa.Column('category', sa.String(), nullable=True),
+    sa.Column('quantity_in_stock', sa.Integer(), nullable=True),
+    sa.Column('quantity_used', sa.Integer(), nullable=True),
+    sa.Column('unit_price', sa.Float(), nullable=True),
+    sa.Column('total_cost', sa.Float(), nullable=True),
+    sa.Column('currency', sa.String(), nullable=True),
+    sa.Column('purchase_date', sa.DateTime(), nullable=True),
+    sa.Column('vendor', sa.String(), nullable=True),
+    sa.Column('installed_date', sa.DateTime(), nullable=True),
+    sa.Column('installed_mileage', sa.Float(), nullable=True),
+    sa.Column('replacement_interval_km', sa.Float(), nullable=True),
+    sa.Column('replacement_interval_months', sa.Integer(), nullable=True),
+    sa.Column('receipt_path', sa.String(), nullable=True),
+    sa.Column('installation_notes', sa.Text(), nullable=True),
+    sa.Column('is_installed', sa.Boolean(), nullable=True),
+    sa.Column('is_consumable', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_parts_id'), ['id'], unique=False)
+
+    op.create_table('ride_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.DateTime(), nullable=False),
+    sa.Column('end_date', sa.DateTime(), nullable=True),
+    sa.Column('start_mileage', sa.Float(), nullable=False),
+    sa.Column('end_mileage', sa.Float(), nullable=True),
+    sa.Column('distance', sa.Float(), nullable=True),
+    sa.Column('fuel_consumed', sa.Float(), nullable=True),
+    sa.Column('fuel_cost', sa.Float(), nullable=True),
+    sa.Column('fuel_efficiency', sa.Float(), nullable=True),
+    sa.Column('start_location', sa.String(), nullable=True),
+    sa.Column('end_location', sa.String(), nullable=True),
+    sa.Column('route_description', sa.Text(), nullable=True),
+    sa.Column('weather_conditions', sa.String(), nullable=True),
+    sa.Column('road_conditions', sa.String(), nullable=True),
+    sa.Column('trip_type', sa.String(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_ride_logs_id'), ['id'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_ride_logs_id'))
+
+    op.drop_table('ride_logs')
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_parts_id'))
+
+    op.drop_table('parts')
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_maintenance_records_id'))
+
+    op.drop_table('maintenance_records')
+    with op.batch_alter_table('webhook_configs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_webhook_configs_id'))
+
+    op.drop_table('webhook_configs')
+    with op.batch_alter_table('motorcycles', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_motorcycles_vin'))
+        batch_op.drop_index(batch_op.f('ix_motorcycles_name'))
+        batch_op.drop_index(batch_op.f('ix_motorcycles_license_plate'))
+        batch_op.drop_index(batch_op.f('ix_motorcycles_id'))
+
+    op.drop_table('motorcycles')
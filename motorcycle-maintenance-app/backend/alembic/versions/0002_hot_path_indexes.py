@@ -0,0 +1,49 @@
+"""hot path indexes
+
+Composite indexes for the per-motorcycle history, recent activity, due-date
+and ride/part listing queries.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 01:01:17.532305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.create_index('ix_maintenance_records_completed_performed', ['is_completed', 'performed_at'], unique=False)
+        batch_op.create_index('ix_maintenance_records_motorcycle_performed', ['motorcycle_id', sa.text('performed_at DESC')], unique=False)
+        batch_op.create_index('ix_maintenance_records_next_service_date', ['next_service_date'], unique=False)
+
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.create_index('ix_parts_motorcycle_category', ['motorcycle_id', 'category'], unique=False)
+
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.create_index('ix_ride_logs_motorcycle_start', ['motorcycle_id', 'start_date'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_ride_logs_motorcycle_start')
+
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.drop_index('ix_parts_motorcycle_category')
+
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_maintenance_records_next_service_date')
+        batch_op.drop_index('ix_maintenance_records_motorcycle_performed')
+        batch_op.drop_index('ix_maintenance_records_completed_performed')
+
@@ -0,0 +1,72 @@
+"""monthly cost rollups
+
+Per-month cost totals by motorcycle, service type or part category and
+currency, backfilled from the existing maintenance records and parts.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('monthly_cost_rollups',
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.String(length=7), nullable=False),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('bucket', sa.String(), nullable=False),
+    sa.Column('currency', sa.String(), nullable=False),
+    sa.Column('record_count', sa.Integer(), nullable=False),
+    sa.Column('total_cost', sa.Float(), nullable=False),
+    sa.Column('labor_cost', sa.Float(), nullable=False),
+    sa.Column('parts_cost', sa.Float(), nullable=False),
+    sa.Column('stock_value', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('motorcycle_id', 'period', 'source', 'bucket', 'currency')
+    )
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.create_index('ix_parts_purchase_date', ['purchase_date'], unique=False)
+
+    # Service types are stored as enum names; the rollup keys on their values
+    op.execute("""
+        INSERT INTO monthly_cost_rollups
+            (motorcycle_id, period, source, bucket, currency,
+             record_count, total_cost, labor_cost, parts_cost, stock_value)
+        SELECT motorcycle_id, strftime('%Y-%m', performed_at), 'maintenance', lower(service_type),
+               coalesce(currency, 'EUR'), count(id), coalesce(sum(total_cost), 0),
+               coalesce(sum(labor_cost), 0), coalesce(sum(parts_cost), 0), 0
+        FROM maintenance_records
+        WHERE is_completed = 1 AND performed_at IS NOT NULL
+        GROUP BY 1, 2, 4, 5
+    """)
+    op.execute("""
+        INSERT INTO monthly_cost_rollups
+            (motorcycle_id, period, source, bucket, currency,
+             record_count, total_cost, labor_cost, parts_cost, stock_value)
+        SELECT motorcycle_id, coalesce(strftime('%Y-%m', purchase_date), '0000-00'), 'parts',
+               coalesce(nullif(category, ''), 'Uncategorized'), coalesce(currency, 'EUR'),
+               count(id), coalesce(sum(total_cost), 0), 0, 0,
+               coalesce(sum(coalesce(unit_price, 0) * coalesce(quantity_in_stock, 0)), 0)
+        FROM parts
+        GROUP BY 1, 2, 4, 5
+    """)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.drop_index('ix_parts_purchase_date')
+
+    op.drop_table('monthly_cost_rollups')
@@ -0,0 +1,32 @@
+"""data versions
+
+Write counters per table and per motorcycle backing the list endpoint ETags.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 10:02:51.386120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('data_versions',
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('scope')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
@@ -0,0 +1,32 @@
+"""due mileage index
+
+Per-motorcycle next_service_mileage index for the upcoming maintenance query.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 11:20:07.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.create_index('ix_maintenance_records_motorcycle_next_mileage', ['motorcycle_id', 'next_service_mileage'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_maintenance_records_motorcycle_next_mileage')
+
@@ -0,0 +1,78 @@
+"""maintenance due states
+
+Latest completed record per motorcycle and service with its next due date
+and mileage, backfilled from the maintenance history.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 12:41:33.270951
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('maintenance_due_states',
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('service_type', sa.String(), nullable=False),
+    sa.Column('service_key', sa.String(), nullable=False),
+    sa.Column('record_id', sa.Integer(), nullable=False),
+    sa.Column('service_name', sa.String(), nullable=False),
+    sa.Column('performed_at', sa.DateTime(), nullable=False),
+    sa.Column('next_service_date', sa.DateTime(), nullable=True),
+    sa.Column('next_service_mileage', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('motorcycle_id', 'service_type', 'service_key')
+    )
+    with op.batch_alter_table('maintenance_due_states', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_maintenance_due_states_next_service_date'), ['next_service_date'], unique=False)
+
+    # Service types are stored as enum names; custom services are keyed by
+    # name, matched in Python because SQLite's lower() only folds ASCII
+    records = op.get_bind().execute(sa.text("""
+        SELECT id, motorcycle_id, service_type, service_name, performed_at,
+               next_service_date, next_service_mileage
+        FROM maintenance_records
+        WHERE is_completed = 1 AND performed_at IS NOT NULL
+        ORDER BY performed_at DESC, id DESC
+    """))
+    latest = {}
+    for row in records:
+        service_type = row.service_type.lower()
+        service_key = (row.service_name or "").strip().lower() if service_type == "custom" else ""
+        key = (row.motorcycle_id, service_type, service_key)
+        if key not in latest:
+            latest[key] = {
+                "motorcycle_id": row.motorcycle_id,
+                "service_type": service_type,
+                "service_key": service_key,
+                "record_id": row.id,
+                "service_name": row.service_name,
+                "performed_at": row.performed_at,
+                "next_service_date": row.next_service_date,
+                "next_service_mileage": row.next_service_mileage
+            }
+    if latest:
+        due_states = sa.table(
+            'maintenance_due_states',
+            *[sa.column(name) for name in next(iter(latest.values()))]
+        )
+        op.bulk_insert(due_states, list(latest.values()))
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('maintenance_due_states', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_maintenance_due_states_next_service_date'))
+
+    op.drop_table('maintenance_due_states')
@@ -0,0 +1,38 @@
+"""maintenance due notifications
+
+Watermark of the due point each maintenance_due event was sent for.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 14:05:12.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('maintenance_due_notifications',
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('service_type', sa.String(), nullable=False),
+    sa.Column('service_key', sa.String(), nullable=False),
+    sa.Column('record_id', sa.Integer(), nullable=False),
+    sa.Column('next_service_date', sa.DateTime(), nullable=True),
+    sa.Column('next_service_mileage', sa.Float(), nullable=True),
+    sa.Column('notified_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('motorcycle_id', 'service_type', 'service_key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('maintenance_due_notifications')
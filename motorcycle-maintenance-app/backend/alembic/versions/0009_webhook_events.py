@@ -0,0 +1,71 @@
+"""webhook events
+
+Event payloads stored once and shared by every subscriber's outbox row.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 18:47:03.551906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('webhook_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('webhook_events', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_webhook_events_id'), ['id'], unique=False)
+
+    # Queued deliveries each become an event of their own
+    with op.batch_alter_table('webhook_outbox', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('event_id', sa.Integer(), nullable=True))
+    op.execute("""
+        INSERT INTO webhook_events (id, event_type, payload, created_at)
+        SELECT id, event_type, CAST(payload AS BLOB), created_at FROM webhook_outbox
+    """)
+    op.execute("UPDATE webhook_outbox SET event_id = id")
+
+    with op.batch_alter_table('webhook_outbox', schema=None) as batch_op:
+        batch_op.alter_column('event_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_index(batch_op.f('ix_webhook_outbox_event_id'), ['event_id'], unique=False)
+        batch_op.create_foreign_key('fk_webhook_outbox_event_id_webhook_events', 'webhook_events', ['event_id'], ['id'], ondelete='CASCADE')
+        batch_op.drop_column('event_type')
+        batch_op.drop_column('payload')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('webhook_outbox', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('payload', sa.TEXT(), nullable=True))
+        batch_op.add_column(sa.Column('event_type', sa.VARCHAR(), nullable=True))
+    op.execute("""
+        UPDATE webhook_outbox SET
+            event_type = (SELECT event_type FROM webhook_events WHERE webhook_events.id = webhook_outbox.event_id),
+            payload = (SELECT CAST(payload AS TEXT) FROM webhook_events WHERE webhook_events.id = webhook_outbox.event_id)
+    """)
+
+    with op.batch_alter_table('webhook_outbox', schema=None) as batch_op:
+        batch_op.alter_column('payload', existing_type=sa.TEXT(), nullable=False)
+        batch_op.alter_column('event_type', existing_type=sa.VARCHAR(), nullable=False)
+        batch_op.drop_constraint('fk_webhook_outbox_event_id_webhook_events', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_webhook_outbox_event_id'))
+        batch_op.drop_column('event_id')
+
+    with op.batch_alter_table('webhook_events', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_webhook_events_id'))
+
+    op.drop_table('webhook_events')
@@ -0,0 +1,32 @@
+"""webhook coalescing
+
+Per-webhook coalescing window and batch size; 0 keeps sending events one by one.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 19:12:26.408133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('webhook_configs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('coalesce_window', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('coalesce_max_batch', sa.Integer(), server_default='50', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('webhook_configs', schema=None) as batch_op:
+        batch_op.drop_column('coalesce_max_batch')
+        batch_op.drop_column('coalesce_window')
@@ -0,0 +1,48 @@
+"""webhook delivery attempts
+
+Log of webhook calls (status, latency, response code), written in batches.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 19:36:51.772604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('webhook_delivery_attempts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('webhook_id', sa.Integer(), nullable=False),
+    sa.Column('outbox_id', sa.Integer(), nullable=True),
+    sa.Column('events', sa.Integer(), nullable=False),
+    sa.Column('attempt', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('response_code', sa.Integer(), nullable=True),
+    sa.Column('latency', sa.Float(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['webhook_id'], ['webhook_configs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('webhook_delivery_attempts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_webhook_delivery_attempts_id'), ['id'], unique=False)
+        batch_op.create_index('ix_webhook_delivery_attempts_webhook_id_id', ['webhook_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('webhook_delivery_attempts', schema=None) as batch_op:
+        batch_op.drop_index('ix_webhook_delivery_attempts_webhook_id_id')
+        batch_op.drop_index(batch_op.f('ix_webhook_delivery_attempts_id'))
+
+    op.drop_table('webhook_delivery_attempts')
@@ -0,0 +1,32 @@
+"""ride log content hash
+
+Hash of imported ride logs, so importing the same history twice skips what is stored.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 20:04:17.215930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(), nullable=True))
+        batch_op.create_index('ix_ride_logs_content_hash', ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_ride_logs_content_hash')
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,64 @@
+"""keyset pagination indexes
+
+Indexes on the sort keys of the list endpoints, so each page starts with an index seek.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 20:31:52.640118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_maintenance_records_motorcycle_performed')
+        batch_op.create_index('ix_maintenance_records_motorcycle_performed', ['motorcycle_id', sa.text('performed_at DESC'), sa.text('id DESC')], unique=False)
+        batch_op.create_index('ix_maintenance_records_performed_id', ['performed_at', 'id'], unique=False)
+
+    with op.batch_alter_table('motorcycles', schema=None) as batch_op:
+        batch_op.create_index('ix_motorcycles_created_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.create_index('ix_parts_created_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_parts_motorcycle_created_id', ['motorcycle_id', 'created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_ride_logs_motorcycle_start')
+        batch_op.create_index('ix_ride_logs_motorcycle_start', ['motorcycle_id', 'start_date', 'id'], unique=False)
+        batch_op.create_index('ix_ride_logs_start_id', ['start_date', 'id'], unique=False)
+
+    with op.batch_alter_table('webhook_configs', schema=None) as batch_op:
+        batch_op.create_index('ix_webhook_configs_created_id', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('webhook_configs', schema=None) as batch_op:
+        batch_op.drop_index('ix_webhook_configs_created_id')
+
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_ride_logs_start_id')
+        batch_op.drop_index('ix_ride_logs_motorcycle_start')
+        batch_op.create_index('ix_ride_logs_motorcycle_start', ['motorcycle_id', 'start_date'], unique=False)
+
+    with op.batch_alter_table('parts', schema=None) as batch_op:
+        batch_op.drop_index('ix_parts_motorcycle_created_id')
+        batch_op.drop_index('ix_parts_created_id')
+
+    with op.batch_alter_table('motorcycles', schema=None) as batch_op:
+        batch_op.drop_index('ix_motorcycles_created_id')
+
+    with op.batch_alter_table('maintenance_records', schema=None) as batch_op:
+        batch_op.drop_index('ix_maintenance_records_performed_id')
+        batch_op.drop_index('ix_maintenance_records_motorcycle_performed')
+        batch_op.create_index('ix_maintenance_records_motorcycle_performed', ['motorcycle_id', sa.text('performed_at DESC')], unique=False)
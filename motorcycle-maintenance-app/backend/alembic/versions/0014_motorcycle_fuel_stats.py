@@ -0,0 +1,79 @@
+"""motorcycle fuel stats
+
+Running fuel statistics per motorcycle, filled from the existing ride logs.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17 20:58:06.318427
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('motorcycle_fuel_stats',
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('ride_count', sa.Integer(), nullable=False),
+    sa.Column('fuel_total', sa.Float(), nullable=False),
+    sa.Column('fuel_cost_total', sa.Float(), nullable=False),
+    sa.Column('price_count', sa.Integer(), nullable=False),
+    sa.Column('price_sum', sa.Float(), nullable=False),
+    sa.Column('efficiency_count', sa.Integer(), nullable=False),
+    sa.Column('efficiency_sum', sa.Float(), nullable=False),
+    sa.Column('efficiency_sum_squares', sa.Float(), nullable=False),
+    sa.Column('best_efficiency', sa.Float(), nullable=True),
+    sa.Column('best_ride_id', sa.Integer(), nullable=True),
+    sa.Column('worst_efficiency', sa.Float(), nullable=True),
+    sa.Column('worst_ride_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('motorcycle_id')
+    )
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.create_index('ix_ride_logs_motorcycle_efficiency', ['motorcycle_id', 'fuel_efficiency'], unique=False)
+
+    op.execute("""
+        INSERT INTO motorcycle_fuel_stats
+            (motorcycle_id, ride_count, fuel_total, fuel_cost_total, price_count, price_sum,
+             efficiency_count, efficiency_sum, efficiency_sum_squares)
+        SELECT motorcycle_id, count(id), sum(fuel_consumed), coalesce(sum(fuel_cost), 0),
+               count(CASE WHEN fuel_cost != 0 THEN 1 END),
+               coalesce(sum(CASE WHEN fuel_cost != 0 THEN fuel_cost / fuel_consumed END), 0),
+               count(nullif(fuel_efficiency, 0)), coalesce(sum(nullif(fuel_efficiency, 0)), 0),
+               coalesce(sum(nullif(fuel_efficiency, 0) * nullif(fuel_efficiency, 0)), 0)
+        FROM ride_logs
+        WHERE fuel_consumed > 0
+        GROUP BY motorcycle_id
+    """)
+    # Ties go to the oldest ride
+    for kind, direction in (("best", "DESC"), ("worst", "ASC")):
+        op.execute(f"""
+            UPDATE motorcycle_fuel_stats SET {kind}_ride_id = (
+                SELECT id FROM ride_logs
+                WHERE ride_logs.motorcycle_id = motorcycle_fuel_stats.motorcycle_id
+                  AND fuel_efficiency IS NOT NULL AND fuel_efficiency != 0 AND fuel_consumed > 0
+                ORDER BY fuel_efficiency {direction}, id
+                LIMIT 1
+            )
+        """)
+        op.execute(f"""
+            UPDATE motorcycle_fuel_stats SET {kind}_efficiency = (
+                SELECT fuel_efficiency FROM ride_logs WHERE ride_logs.id = motorcycle_fuel_stats.{kind}_ride_id
+            )
+        """)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ride_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_ride_logs_motorcycle_efficiency')
+
+    op.drop_table('motorcycle_fuel_stats')
@@ -0,0 +1,37 @@
+"""add ride tracks
+
+Recorded GPS tracks of rides, one row per level of detail.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17 21:34:12.504918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ride_tracks',
+    sa.Column('ride_log_id', sa.Integer(), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('tolerance', sa.Float(), nullable=False),
+    sa.Column('point_count', sa.Integer(), nullable=False),
+    sa.Column('points', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['ride_log_id'], ['ride_logs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ride_log_id', 'level')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ride_tracks')
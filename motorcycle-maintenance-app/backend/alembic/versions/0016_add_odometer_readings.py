@@ -0,0 +1,42 @@
+"""add odometer readings
+
+Append-only odometer telemetry from data loggers.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17 22:09:47.113652
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0016'
+down_revision: Union[str, None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('odometer_readings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('motorcycle_id', sa.Integer(), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=False),
+    sa.Column('mileage', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['motorcycle_id'], ['motorcycles.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('odometer_readings', schema=None) as batch_op:
+        batch_op.create_index('ix_odometer_readings_motorcycle_recorded_at', ['motorcycle_id', 'recorded_at'], unique=False)
+        batch_op.create_index('ix_odometer_readings_recorded_at', ['recorded_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('odometer_readings', schema=None) as batch_op:
+        batch_op.drop_index('ix_odometer_readings_recorded_at')
+        batch_op.drop_index('ix_odometer_readings_motorcycle_recorded_at')
+
+    op.drop_table('odometer_readings')
@@ -0,0 +1,30 @@
+"""webhook outbox lease
+
+Marks outbox rows a delivery worker holds, so coalescing leaves them alone.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-18 09:42:18.730215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0017'
+down_revision: Union[str, None] = '0016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('webhook_outbox', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('leased_until', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('webhook_outbox', schema=None) as batch_op:
+        batch_op.drop_column('leased_until')
@@ -1,5 +1,5 @@
 # backend/app/api/deps.py
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 
 # Re-export for convenience
-__all__ = ["get_db"]
\ No newline at end of file
+__all__ = ["get_db", "get_read_db"]
\ No newline at end of file
@@ -1,6 +1,6 @@
 # backend/app/api/v1/api.py
 from fastapi import APIRouter
-from app.api.v1.endpoints import motorcycles, maintenance, parts, logs, webhooks, dashboard
+from app.api.v1.endpoints import motorcycles, maintenance, parts, logs, webhooks, dashboard, exports
 
 api_router = APIRouter()
 
@@ -11,6 +11,7 @@ api_router.include_router(parts.router, prefix="/parts", tags=["parts"])
 api_router.include_router(logs.router, prefix="/logs", tags=["logs"])
 api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
 api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(exports.router, prefix="/export", tags=["export"])
 
 # Add health check at API level
 @api_router.get("/health")
@@ -1,186 +1,121 @@
 # backend/app/api/v1/endpoints/dashboard.py
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case, true
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import datetime, timedelta
 
-from app.core.database import get_db
+from app.core.cache import dashboard_cache
+from app.core.database import get_read_db
 from app.models.motorcycle import Motorcycle
 from app.models.maintenance import MaintenanceRecord, ServiceType
+from app.models.due_state import MaintenanceDueState
+from app.services.cost_rollup_service import CostRollupService, MAINTENANCE
+from app.services.maintenance_service import MaintenanceService
 
 router = APIRouter()
 
 @router.get("/stats")
-async def get_dashboard_stats(db: Session = Depends(get_db)):
+@dashboard_cache.cached("stats")
+async def get_dashboard_stats(db: AsyncSession = Depends(get_read_db)):
     """Get main dashboard statistics"""
-    try:
-        # Get motorcycle stats
-        total_motorcycles = db.query(Motorcycle).count()
-        active_motorcycles = db.query(Motorcycle).filter(
-            Motorcycle.is_active == True,
-            Motorcycle.is_archived == False
-        ).count()
-        
-        # Calculate total mileage
-        active_bikes = db.query(Motorcycle).filter(
-            Motorcycle.is_active == True,
-            Motorcycle.is_archived == False
-        ).all()
-        total_mileage = sum(bike.current_mileage or 0 for bike in active_bikes)
-        
-        # Get upcoming maintenance count
-        upcoming_maintenance = db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.next_service_date >= datetime.utcnow().date(),
-            MaintenanceRecord.next_service_date <= (datetime.utcnow() + timedelta(days=30)).date()
-        ).count()
-        
-        # Get overdue maintenance count
-        overdue_maintenance = db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.next_service_date < datetime.utcnow().date()
-        ).count()
-        
-        # Calculate monthly expenses (last 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        monthly_expenses = db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.performed_at >= thirty_days_ago,
-            MaintenanceRecord.is_completed == True
-        ).all()
-        total_expenses = sum(record.total_cost or 0 for record in monthly_expenses)
-        
-        # Get recent activities
-        recent_activities = db.query(MaintenanceRecord, Motorcycle).join(
-            Motorcycle, MaintenanceRecord.motorcycle_id == Motorcycle.id
-        ).filter(
-            MaintenanceRecord.is_completed == True
-        ).order_by(
-            MaintenanceRecord.performed_at.desc()
-        ).limit(10).all()
-        
-        activities_list = []
-        for maintenance, motorcycle in recent_activities:
-            activities_list.append({
-                "id": maintenance.id,
-                "type": "maintenance",
-                "description": maintenance.service_name,
-                "motorcycle_name": motorcycle.name,
-                "motorcycle_id": motorcycle.id,
-                "date": maintenance.performed_at.isoformat(),
-                "mileage": maintenance.mileage_at_service,
-                "cost": maintenance.total_cost,
-                "service_type": maintenance.service_type.value
-            })
-        
-        return {
-            "total_motorcycles": total_motorcycles,
-            "active_motorcycles": active_motorcycles,
-            "total_mileage": total_mileage,
-            "upcoming_services": upcoming_maintenance,
-            "overdue_services": overdue_maintenance,
-            "monthly_expenses": total_expenses,
-            "recent_activities": activities_list
-        }
-    except Exception as e:
-        # Return default values if error
-        return {
-            "total_motorcycles": 0,
-            "active_motorcycles": 0,
-            "total_mileage": 0,
-            "upcoming_services": 0,
-            "overdue_services": 0,
-            "monthly_expenses": 0,
-            "recent_activities": []
-        }
+    now = datetime.utcnow()
+    today = now.date()
+    thirty_days_ago = now - timedelta(days=30)
+    is_active_bike = (Motorcycle.is_active == True) & (Motorcycle.is_archived == False)
+    
+    # Motorcycle counts and mileage in one pass over the motorcycles table
+    motorcycle_stats = select(
+        func.count(Motorcycle.id).label("total_motorcycles"),
+        func.count(case((is_active_bike, Motorcycle.id))).label("active_motorcycles"),
+        func.coalesce(func.sum(case((is_active_bike, Motorcycle.current_mileage))), 0).label("total_mileage")
+    ).subquery()
+    
+    # Upcoming/overdue counts over the latest due point of each service
+    due_day = func.date(MaintenanceDueState.next_service_date)
+    due_stats = select(
+        func.count(case((
+            (due_day >= today.isoformat()) &
+            (due_day <= (today + timedelta(days=30)).isoformat()),
+            MaintenanceDueState.record_id
+        ))).label("upcoming_services"),
+        func.count(case((
+            due_day < today.isoformat(),
+            MaintenanceDueState.record_id
+        ))).label("overdue_services")
+    ).subquery()
+    
+    # Last 30 days of completed maintenance
+    expense_stats = select(
+        func.coalesce(func.sum(MaintenanceRecord.total_cost), 0).label("monthly_expenses")
+    ).where(
+        MaintenanceRecord.is_completed == True,
+        MaintenanceRecord.performed_at >= thirty_days_ago
+    ).subquery()
+    
+    # All single-row aggregates come back in one round trip
+    stats = (await db.execute(
+        select(motorcycle_stats, due_stats, expense_stats).select_from(
+            motorcycle_stats.join(due_stats, true()).join(expense_stats, true())
+        )
+    )).one()
+    
+    # Get recent activities
+    recent_activities = (await db.execute(select(MaintenanceRecord, Motorcycle).join(
+        Motorcycle, MaintenanceRecord.motorcycle_id == Motorcycle.id
+    ).where(
+        MaintenanceRecord.is_completed == True
+    ).order_by(
+        MaintenanceRecord.performed_at.desc()
+    ).limit(10))).all()
+    
+    activities_list = []
+    for maintenance, motorcycle in recent_activities:
+        activities_list.append({
+            "id": maintenance.id,
+            "type": "maintenance",
+            "description": maintenance.service_name,
+            "motorcycle_name": motorcycle.name,
+            "motorcycle_id": motorcycle.id,
+            "date": maintenance.performed_at.isoformat(),
+            "mileage": maintenance.mileage_at_service,
+            "cost": maintenance.total_cost,
+            "service_type": maintenance.service_type.value
+        })
+    
+    return {
+        "total_motorcycles": stats.total_motorcycles,
+        "active_motorcycles": stats.active_motorcycles,
+        "total_mileage": stats.total_mileage,
+        "upcoming_services": stats.upcoming_services,
+        "overdue_services": stats.overdue_services,
+        "monthly_expenses": stats.monthly_expenses,
+        "recent_activities": activities_list
+    }
 
 @router.get("/maintenance-due")
+@dashboard_cache.cached("maintenance-due", scope_param="motorcycle_id")
 async def get_maintenance_due_soon(
     days_ahead: int = 60,
     motorcycle_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get maintenance due within specified days"""
-    try:
-        query = db.query(MaintenanceRecord, Motorcycle).join(
-            Motorcycle, MaintenanceRecord.motorcycle_id == Motorcycle.id
-        )
-        
-        if motorcycle_id:
-            query = query.filter(MaintenanceRecord.motorcycle_id == motorcycle_id)
-        
-        # Filter for records that have next service dates or mileage
-        query = query.filter(
-            (MaintenanceRecord.next_service_date.isnot(None)) |
-            (MaintenanceRecord.next_service_mileage.isnot(None))
-        )
-        
-        results = []
-        cutoff_date = datetime.utcnow() + timedelta(days=days_ahead)
-        
-        for maintenance, motorcycle in query.all():
-            upcoming_item = {
-                'id': maintenance.id,
-                'motorcycle_id': motorcycle.id,
-                'motorcycle_name': motorcycle.name,
-                'service_name': maintenance.service_name,
-                'service_type': maintenance.service_type.value,
-                'due_date': maintenance.next_service_date.isoformat() if maintenance.next_service_date else None,
-                'due_mileage': maintenance.next_service_mileage,
-                'current_mileage': motorcycle.current_mileage,
-                'is_overdue': False,
-                'days_overdue': None,
-                'mileage_overdue': None,
-                'priority': 'low'
-            }
-            
-            # Check if overdue by date
-            if maintenance.next_service_date:
-                if maintenance.next_service_date < datetime.utcnow().date():
-                    upcoming_item['is_overdue'] = True
-                    upcoming_item['days_overdue'] = (
-                        datetime.utcnow().date() - maintenance.next_service_date
-                    ).days
-                    upcoming_item['priority'] = 'high'
-                elif maintenance.next_service_date <= cutoff_date.date():
-                    days_until = (maintenance.next_service_date - datetime.utcnow().date()).days
-                    if days_until <= 7:
-                        upcoming_item['priority'] = 'high'
-                    elif days_until <= 30:
-                        upcoming_item['priority'] = 'medium'
-            
-            # Check if overdue by mileage
-            if maintenance.next_service_mileage and motorcycle.current_mileage:
-                if motorcycle.current_mileage >= maintenance.next_service_mileage:
-                    upcoming_item['is_overdue'] = True
-                    upcoming_item['mileage_overdue'] = (
-                        motorcycle.current_mileage - maintenance.next_service_mileage
-                    )
-                    upcoming_item['priority'] = 'high'
-                elif motorcycle.current_mileage >= (maintenance.next_service_mileage - 1000):
-                    if upcoming_item['priority'] != 'high':
-                        upcoming_item['priority'] = 'medium'
-            
-            # Only include if due within timeframe or overdue
-            if (upcoming_item['is_overdue'] or 
-                (maintenance.next_service_date and maintenance.next_service_date <= cutoff_date.date())):
-                results.append(upcoming_item)
-        
-        # Sort by priority and date
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        results.sort(key=lambda x: (
-            priority_order[x['priority']], 
-            x['due_date'] or '9999-12-31'
-        ))
-        
-        return results
-    except Exception as e:
-        return []
+    # Overdue or due by date only; no early mileage window here
+    return await MaintenanceService(db).get_upcoming_maintenance(
+        motorcycle_id=motorcycle_id,
+        days_ahead=days_ahead,
+        mileage_window=0
+    )
 
 @router.get("/motorcycle/{motorcycle_id}")
+@dashboard_cache.cached("motorcycle-overview", scope_param="motorcycle_id")
 async def get_motorcycle_overview(
     motorcycle_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get overview for a specific motorcycle"""
-    motorcycle = db.query(Motorcycle).filter(Motorcycle.id == motorcycle_id).first()
+    motorcycle = await db.get(Motorcycle, motorcycle_id)
     if not motorcycle:
         return None
     
@@ -192,20 +127,18 @@ async def get_motorcycle_overview(
     )
     
     # Get recent maintenance
-    recent_maintenance = db.query(MaintenanceRecord).filter(
+    recent_maintenance = (await db.scalars(select(MaintenanceRecord).where(
         MaintenanceRecord.motorcycle_id == motorcycle_id,
         MaintenanceRecord.is_completed == True
-    ).order_by(MaintenanceRecord.performed_at.desc()).limit(5).all()
+    ).order_by(MaintenanceRecord.performed_at.desc()).limit(5))).all()
     
     # Calculate annual costs
     twelve_months_ago = datetime.utcnow() - timedelta(days=365)
-    annual_maintenance = db.query(MaintenanceRecord).filter(
-        MaintenanceRecord.motorcycle_id == motorcycle_id,
-        MaintenanceRecord.performed_at >= twelve_months_ago,
-        MaintenanceRecord.is_completed == True
-    ).all()
-    
-    total_annual_cost = sum(record.total_cost or 0 for record in annual_maintenance)
+    annual_totals = await CostRollupService(db).summarize(
+        MAINTENANCE, motorcycle_id, start_date=twelve_months_ago
+    )
+    total_annual_cost = sum(bucket["total_cost"] for bucket in annual_totals.values())
+    maintenance_frequency = sum(bucket["record_count"] for bucket in annual_totals.values())
     
     return {
         "motorcycle": {
@@ -230,16 +163,17 @@ async def get_motorcycle_overview(
             for record in recent_maintenance
         ],
         "annual_maintenance_cost": total_annual_cost,
-        "maintenance_frequency": len(annual_maintenance)
+        "maintenance_frequency": maintenance_frequency
     }
 
 @router.get("/fleet-summary")
-async def get_fleet_summary(db: Session = Depends(get_db)):
+@dashboard_cache.cached("fleet-summary")
+async def get_fleet_summary(db: AsyncSession = Depends(get_read_db)):
     """Get fleet-wide summary statistics"""
-    motorcycles = db.query(Motorcycle).filter(
+    motorcycles = (await db.scalars(select(Motorcycle).where(
         Motorcycle.is_active == True,
         Motorcycle.is_archived == False
-    ).all()
+    ))).all()
     
     if not motorcycles:
         return {
@@ -0,0 +1,37 @@
+# backend/app/api/v1/endpoints/exports.py
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.database import ReadSessionLocal
+from app.services.export_service import ExportDataset, ExportFormat, Exporter, MEDIA_TYPES, export_filename
+
+router = APIRouter()
+
+
+@router.get("/{dataset}")
+async def export_data(
+    dataset: ExportDataset,
+    format: ExportFormat = ExportFormat.CSV,
+    motorcycle_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    """Stream ride logs, maintenance records or parts as CSV or NDJSON"""
+    filters = {"motorcycle_id": motorcycle_id, "start_date": start_date, "end_date": end_date}
+
+    async def body():
+        # Its own session: the response body outlives the request handler
+        async with ReadSessionLocal() as db:
+            exporter = Exporter(db, dataset, settings.EXPORT_BATCH_SIZE)
+            chunks = exporter.csv(**filters) if format == ExportFormat.CSV else exporter.ndjson(**filters)
+            async for chunk in chunks:
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(dataset, format, filters)}"'}
+    )
@@ -1,39 +1,67 @@
 # backend/app/api/v1/endpoints/logs.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
+from xml.etree.ElementTree import ParseError
+import asyncio
+import json
 
-from app.core.database import get_db
-from app.models.logs import RideLog
+from app.core.config import settings
+from app.core.database import SessionLocal, get_db, get_read_db
+from app.core.pagination import Keyset, page, paginate
+from app.core.versioning import list_etag, not_modified, set_etag
+from app.models.logs import RideLog, RideTrack
 from app.models.motorcycle import Motorcycle
-from app.schemas.logs import LogCreate, LogUpdate, LogResponse
+from app.schemas.logs import (
+    LogCreate, LogUpdate, LogResponse, RideStatsBucket, TrackLevelInfo, TrackResponse, TrackSummary
+)
+from app.services.fuel_stats_service import FuelStatsService
+from app.services.gps_track import TrackService, read_track
+from app.services.ride_log_import import RideLogImporter, read_csv, read_gpx, track_distance
+from app.services.ride_stats_service import RideStatsService, StatsGroup, StatsInterval
 
 router = APIRouter()
 
+RIDE_LOG_KEYSET = Keyset(RideLog.start_date, RideLog.id, descending=True)
+
 @router.get("/", response_model=List[LogResponse])
 async def get_ride_logs(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     motorcycle_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get ride logs with optional filtering"""
-    query = db.query(RideLog)
+    """Get ride logs with optional filtering, most recent ride first
+
+    Pass the X-Next-Cursor header of a page as cursor to fetch the next one.
+    """
+    etag = await list_etag(db, request, "ride_logs", motorcycle_id)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    set_etag(response, etag)
+    
+    query = select(RideLog)
     if motorcycle_id:
-        query = query.filter(RideLog.motorcycle_id == motorcycle_id)
+        query = query.where(RideLog.motorcycle_id == motorcycle_id)
     
-    logs = query.offset(skip).limit(limit).all()
-    return logs
+    logs = (await db.scalars(paginate(query, RIDE_LOG_KEYSET, cursor, skip, limit))).all()
+    return page(logs, RIDE_LOG_KEYSET, limit, response)
 
 @router.post("/", response_model=LogResponse)
 async def create_ride_log(
     log_data: LogCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new ride log"""
     # Verify motorcycle exists
-    motorcycle = db.query(Motorcycle).filter(Motorcycle.id == log_data.motorcycle_id).first()
+    motorcycle = await db.get(Motorcycle, log_data.motorcycle_id)
     if not motorcycle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,28 +89,82 @@ async def create_ride_log(
         motorcycle.current_mileage = log_data.end_mileage
     
     db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
+    await db.commit()
+    await db.refresh(db_log)
     return db_log
 
+@router.post("/import")
+async def import_ride_logs(
+    file: UploadFile = File(...),
+    motorcycle_id: Optional[int] = Form(None),
+):
+    """Import ride logs from a CSV or GPX file.
+    
+    Progress is streamed back as one JSON object per line: running totals
+    after every batch, then a final line with "done": true. motorcycle_id
+    applies to rows that do not name one and is required for GPX files.
+    """
+    is_gpx = (file.filename or "").lower().endswith(".gpx") or "gpx" in (file.content_type or "")
+    if is_gpx and motorcycle_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="GPX imports need a motorcycle_id"
+        )
+    rows = read_gpx(file.file) if is_gpx else read_csv(file.file)
+    
+    async def progress():
+        # Its own session: the response body outlives the request handler
+        async with SessionLocal() as db:
+            importer = RideLogImporter(db, settings.RIDE_LOG_IMPORT_BATCH, motorcycle_id)
+            async for totals in importer.run(rows):
+                yield json.dumps(totals, default=str) + "\n"
+    
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+@router.get("/stats", response_model=List[RideStatsBucket])
+async def get_ride_stats(
+    request: Request,
+    response: Response,
+    interval: Optional[StatsInterval] = None,
+    group_by: Optional[StatsGroup] = None,
+    motorcycle_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get ride statistics per day, week, month or year, optionally per trip type or conditions"""
+    etag = await list_etag(db, request, "ride_logs", motorcycle_id)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    set_etag(response, etag)
+    
+    service = RideStatsService(db)
+    return await service.buckets(
+        motorcycle_id=motorcycle_id,
+        interval=interval,
+        group_by=group_by,
+        start_date=start_date,
+        end_date=end_date
+    )
+
 @router.get("/summary/{motorcycle_id}")
 async def get_ride_summary(
     motorcycle_id: int,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get ride summary statistics for a motorcycle"""
-    query = db.query(RideLog).filter(RideLog.motorcycle_id == motorcycle_id)
-    
-    if start_date:
-        query = query.filter(RideLog.start_date >= start_date)
-    if end_date:
-        query = query.filter(RideLog.start_date <= end_date)
-    
-    logs = query.all()
+    service = RideStatsService(db)
+    by_trip_type = await service.buckets(
+        motorcycle_id=motorcycle_id,
+        group_by=StatsGroup.TRIP_TYPE,
+        start_date=start_date,
+        end_date=end_date
+    )
     
-    if not logs:
+    if not by_trip_type:
         return {
             "total_rides": 0,
             "total_distance": 0,
@@ -92,38 +174,28 @@ async def get_ride_summary(
             "most_common_trip_type": None
         }
     
-    total_distance = sum(log.distance or 0 for log in logs)
-    total_fuel = sum(log.fuel_consumed or 0 for log in logs)
-    total_fuel_cost = sum(log.fuel_cost or 0 for log in logs)
-    
-    # Calculate average fuel efficiency
-    efficiency_logs = [log for log in logs if log.fuel_efficiency]
-    average_efficiency = sum(log.fuel_efficiency for log in efficiency_logs) / len(efficiency_logs) if efficiency_logs else 0
+    [totals] = await service.buckets(motorcycle_id=motorcycle_id, start_date=start_date, end_date=end_date)
     
     # Find most common trip type
-    trip_types = {}
-    for log in logs:
-        if log.trip_type:
-            trip_types[log.trip_type] = trip_types.get(log.trip_type, 0) + 1
-    
-    most_common_trip = max(trip_types, key=trip_types.get) if trip_types else None
+    trip_types = [bucket for bucket in by_trip_type if bucket["group"]]
+    most_common_trip = max(trip_types, key=lambda bucket: bucket["rides"])["group"] if trip_types else None
     
     return {
-        "total_rides": len(logs),
-        "total_distance": total_distance,
-        "total_fuel": total_fuel,
-        "total_fuel_cost": total_fuel_cost,
-        "average_efficiency": average_efficiency,
+        "total_rides": totals["rides"],
+        "total_distance": totals["distance"],
+        "total_fuel": totals["fuel"],
+        "total_fuel_cost": totals["fuel_cost"],
+        "average_efficiency": totals["average_efficiency"] or 0,
         "most_common_trip_type": most_common_trip
     }
 
 @router.get("/{log_id}", response_model=LogResponse)
 async def get_ride_log(
     log_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific ride log"""
-    log = db.query(RideLog).filter(RideLog.id == log_id).first()
+    log = await db.get(RideLog, log_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -135,10 +207,10 @@ async def get_ride_log(
 async def update_ride_log(
     log_id: int,
     log_update: LogUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a ride log"""
-    db_log = db.query(RideLog).filter(RideLog.id == log_id).first()
+    db_log = await db.get(RideLog, log_id)
     if not db_log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -165,83 +237,120 @@ async def update_ride_log(
     
     # Update motorcycle mileage if needed
     if db_log.end_mileage:
-        motorcycle = db.query(Motorcycle).filter(Motorcycle.id == db_log.motorcycle_id).first()
+        motorcycle = await db.get(Motorcycle, db_log.motorcycle_id)
         if motorcycle and db_log.end_mileage > motorcycle.current_mileage:
             motorcycle.current_mileage = db_log.end_mileage
     
-    db.commit()
-    db.refresh(db_log)
+    await db.commit()
+    await db.refresh(db_log)
     return db_log
 
 @router.delete("/{log_id}")
 async def delete_ride_log(
     log_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a ride log"""
-    db_log = db.query(RideLog).filter(RideLog.id == log_id).first()
+    db_log = await db.get(RideLog, log_id)
     if not db_log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ride log not found"
         )
     
-    db.delete(db_log)
-    db.commit()
+    await db.execute(delete(RideTrack).where(RideTrack.ride_log_id == log_id))
+    await db.delete(db_log)
+    await db.commit()
     return {"message": "Ride log deleted successfully"}
 
-@router.get("/fuel/statistics")
-async def get_fuel_statistics(
-    motorcycle_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+@router.put("/{log_id}/track", response_model=TrackSummary)
+async def upload_ride_track(
+    log_id: int,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get fuel consumption statistics"""
-    query = db.query(RideLog).filter(
-        RideLog.fuel_consumed.isnot(None),
-        RideLog.fuel_consumed > 0
-    )
-    
-    if motorcycle_id:
-        query = query.filter(RideLog.motorcycle_id == motorcycle_id)
-    
-    logs = query.all()
-    
-    if not logs:
-        return {
-            "total_fuel_consumed": 0,
-            "total_fuel_cost": 0,
-            "average_price_per_liter": 0,
-            "best_efficiency": None,
-            "worst_efficiency": None,
-            "average_efficiency": 0
-        }
+    """Attach a recorded GPS track (GPX) to a ride log, replacing any earlier one.
     
-    total_fuel = sum(log.fuel_consumed for log in logs)
-    total_cost = sum(log.fuel_cost or 0 for log in logs)
+    The tracks of the file are joined in order. Simplified levels of detail
+    are stored next to the recording for GET /{log_id}/track.
+    """
+    if not await db.get(RideLog, log_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ride log not found"
+        )
     
-    # Calculate average price per liter
-    fuel_with_cost = [(log.fuel_consumed, log.fuel_cost) for log in logs if log.fuel_cost]
-    avg_price = sum(cost/fuel for fuel, cost in fuel_with_cost) / len(fuel_with_cost) if fuel_with_cost else 0
+    try:
+        # Parsing reads the upload, so it runs off the event loop
+        points = await asyncio.to_thread(read_track, file.file, settings.GPS_TRACK_MAX_POINTS)
+    except (ParseError, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unreadable GPX file: {e}"
+        )
+    if len(points) < 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The file holds no track to attach"
+        )
     
-    # Find best and worst efficiency
-    efficiency_logs = [log for log in logs if log.fuel_efficiency]
-    best_efficiency = max(efficiency_logs, key=lambda x: x.fuel_efficiency) if efficiency_logs else None
-    worst_efficiency = min(efficiency_logs, key=lambda x: x.fuel_efficiency) if efficiency_logs else None
-    avg_efficiency = sum(log.fuel_efficiency for log in efficiency_logs) / len(efficiency_logs) if efficiency_logs else 0
+    tracks = await TrackService(db).save(log_id, points, settings.GPS_TRACK_TOLERANCES)
+    return TrackSummary(
+        ride_log_id=log_id,
+        point_count=len(points),
+        distance=round(track_distance(points), 3),
+        size=sum(len(track.points) for track in tracks),
+        levels=[
+            TrackLevelInfo(level=track.level, tolerance=track.tolerance, point_count=track.point_count)
+            for track in tracks
+        ]
+    )
+
+@router.get("/{log_id}/track", response_model=TrackResponse)
+async def get_ride_track(
+    log_id: int,
+    resolution: Optional[float] = Query(None, gt=0, description="Map resolution in meters per pixel"),
+    max_points: Optional[int] = Query(None, ge=2),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get a ride's GPS track at the level of detail the client can show.
     
-    return {
-        "total_fuel_consumed": total_fuel,
-        "total_fuel_cost": total_cost,
-        "average_price_per_liter": avg_price,
-        "best_efficiency": {
-            "value": best_efficiency.fuel_efficiency,
-            "date": best_efficiency.start_date.isoformat(),
-            "trip_type": best_efficiency.trip_type
-        } if best_efficiency else None,
-        "worst_efficiency": {
-            "value": worst_efficiency.fuel_efficiency,
-            "date": worst_efficiency.start_date.isoformat(),
-            "trip_type": worst_efficiency.trip_type
-        } if worst_efficiency else None,
-        "average_efficiency": avg_efficiency
-    }
\ No newline at end of file
+    The coarsest level whose simplification tolerance stays within the
+    resolution is returned, coarser still if it has more than max_points.
+    Without either, the full recording is returned.
+    """
+    track = await TrackService(db).load(log_id, resolution=resolution, max_points=max_points)
+    if track is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ride track not found"
+        )
+    return TrackResponse(
+        ride_log_id=log_id,
+        level=track.level,
+        tolerance=track.tolerance,
+        point_count=len(track.points),
+        points=track.points.round(5).tolist()
+    )
+
+@router.delete("/{log_id}/track")
+async def delete_ride_track(
+    log_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Remove a ride's GPS track"""
+    if not await TrackService(db).delete(log_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ride track not found"
+        )
+    return {"message": "Ride track deleted successfully"}
+
+@router.get("/fuel/statistics")
+async def get_fuel_statistics(
+    motorcycle_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get fuel consumption statistics"""
+    service = FuelStatsService(db)
+    return await service.statistics(motorcycle_id)
@@ -1,41 +1,60 @@
 # backend/app/api/v1/endpoints/maintenance.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.pagination import Keyset, page, paginate
+from app.core.versioning import list_etag, not_modified, set_etag
 from app.models.maintenance import MaintenanceRecord
 from app.models.motorcycle import Motorcycle
 from app.schemas.maintenance import MaintenanceCreate, MaintenanceUpdate, MaintenanceResponse
+from app.services.maintenance_service import MaintenanceService
 
 router = APIRouter()
 
+MAINTENANCE_KEYSET = Keyset(MaintenanceRecord.performed_at, MaintenanceRecord.id, descending=True)
+
 
 @router.get("/", response_model=List[MaintenanceResponse])
 async def get_maintenance_records(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     motorcycle_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get maintenance records with optional filtering"""
-    query = db.query(MaintenanceRecord)
+    """Get maintenance records with optional filtering, most recent first
+
+    Pass the X-Next-Cursor header of a page as cursor to fetch the next one.
+    """
+    etag = await list_etag(db, request, "maintenance_records", motorcycle_id)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    set_etag(response, etag)
+    
+    query = select(MaintenanceRecord)
     
     if motorcycle_id:
-        query = query.filter(MaintenanceRecord.motorcycle_id == motorcycle_id)
+        query = query.where(MaintenanceRecord.motorcycle_id == motorcycle_id)
     
-    return query.order_by(MaintenanceRecord.performed_at.desc()).offset(skip).limit(limit).all()
+    result = await db.scalars(paginate(query, MAINTENANCE_KEYSET, cursor, skip, limit))
+    return page(result.all(), MAINTENANCE_KEYSET, limit, response)
 
 
 @router.post("/", response_model=MaintenanceResponse)
 async def create_maintenance_record(
     maintenance: MaintenanceCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new maintenance record"""
     # Verify motorcycle exists
-    motorcycle = db.query(Motorcycle).filter(Motorcycle.id == maintenance.motorcycle_id).first()
+    motorcycle = await db.get(Motorcycle, maintenance.motorcycle_id)
     if not motorcycle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,6 +66,7 @@ async def create_maintenance_record(
     
     # Create maintenance record
     data_dict = maintenance.dict()
+    data_dict.pop('installation_notes', None)  # Not stored on maintenance records
     data_dict['total_cost'] = total_cost
     
     # Update motorcycle mileage if this service has higher mileage
@@ -55,8 +75,8 @@ async def create_maintenance_record(
     
     db_record = MaintenanceRecord(**data_dict)
     db.add(db_record)
-    db.commit()
-    db.refresh(db_record)
+    await db.commit()
+    await db.refresh(db_record)
     
     return db_record
 
@@ -65,30 +85,31 @@ async def create_maintenance_record(
 async def get_upcoming_maintenance(
     motorcycle_id: Optional[int] = None,
     days_ahead: int = 60,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get upcoming maintenance based on date and mileage"""
-    # This endpoint works, so we know it's properly registered
-    # Return empty list for now
-    return []
+    return await MaintenanceService(db).get_upcoming_maintenance(
+        motorcycle_id=motorcycle_id,
+        days_ahead=days_ahead
+    )
 
 
 @router.get("/overdue")
 async def get_overdue_maintenance(
     motorcycle_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get overdue maintenance"""
-    return []
+    return await MaintenanceService(db).get_overdue_maintenance(motorcycle_id=motorcycle_id)
 
 
 @router.get("/{maintenance_id}", response_model=MaintenanceResponse)
 async def get_maintenance_record(
     maintenance_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific maintenance record"""
-    record = db.query(MaintenanceRecord).filter(MaintenanceRecord.id == maintenance_id).first()
+    record = await db.get(MaintenanceRecord, maintenance_id)
     if not record:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -101,10 +122,10 @@ async def get_maintenance_record(
 async def update_maintenance_record(
     maintenance_id: int,
     maintenance_update: MaintenanceUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a maintenance record"""
-    db_record = db.query(MaintenanceRecord).filter(MaintenanceRecord.id == maintenance_id).first()
+    db_record = await db.get(MaintenanceRecord, maintenance_id)
     if not db_record:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -122,24 +143,24 @@ async def update_maintenance_record(
     for field, value in update_data.items():
         setattr(db_record, field, value)
     
-    db.commit()
-    db.refresh(db_record)
+    await db.commit()
+    await db.refresh(db_record)
     return db_record
 
 
 @router.delete("/{maintenance_id}")
 async def delete_maintenance_record(
     maintenance_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a maintenance record"""
-    db_record = db.query(MaintenanceRecord).filter(MaintenanceRecord.id == maintenance_id).first()
+    db_record = await db.get(MaintenanceRecord, maintenance_id)
     if not db_record:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Maintenance record not found"
         )
     
-    db.delete(db_record)
-    db.commit()
+    await db.delete(db_record)
+    await db.commit()
     return {"message": "Maintenance record deleted successfully"}
\ No newline at end of file
@@ -1,45 +1,63 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.pagination import page
+from app.core.versioning import list_etag, not_modified, set_etag
 from app.models.motorcycle import Motorcycle
-from app.schemas.motorcycle import MotorcycleCreate, MotorcycleUpdate, MotorcycleResponse
-from app.services.motorcycle_service import MotorcycleService
+from app.schemas.motorcycle import MotorcycleCreate, MotorcycleUpdate, MotorcycleResponse, TelemetryBatch
+from app.services.motorcycle_service import MOTORCYCLE_KEYSET, MotorcycleService
+from app.services.telemetry import odometer_log
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[MotorcycleResponse])
 async def get_motorcycles(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     include_archived: bool = False,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all motorcycles with optional pagination and filtering"""
+    """Get all motorcycles with optional pagination and filtering
+
+    Pass the X-Next-Cursor header of a page as cursor to fetch the next one.
+    """
+    etag = await list_etag(db, request, "motorcycles")
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    set_etag(response, etag)
+    
     service = MotorcycleService(db)
-    return service.get_motorcycles(skip=skip, limit=limit, include_archived=include_archived)
+    motorcycles = await service.get_motorcycles(skip=skip, limit=limit, include_archived=include_archived, cursor=cursor)
+    return page(motorcycles, MOTORCYCLE_KEYSET, limit, response)
 
 
 @router.post("/", response_model=MotorcycleResponse)
 async def create_motorcycle(
     motorcycle: MotorcycleCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new motorcycle"""
     service = MotorcycleService(db)
-    return service.create_motorcycle(motorcycle)
+    return await service.create_motorcycle(motorcycle)
 
 
 @router.get("/{motorcycle_id}", response_model=MotorcycleResponse)
 async def get_motorcycle(
     motorcycle_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific motorcycle by ID"""
     service = MotorcycleService(db)
-    motorcycle = service.get_motorcycle(motorcycle_id)
+    motorcycle = await service.get_motorcycle(motorcycle_id)
     if not motorcycle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,11 +70,11 @@ async def get_motorcycle(
 async def update_motorcycle(
     motorcycle_id: int,
     motorcycle_update: MotorcycleUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a motorcycle"""
     service = MotorcycleService(db)
-    motorcycle = service.update_motorcycle(motorcycle_id, motorcycle_update)
+    motorcycle = await service.update_motorcycle(motorcycle_id, motorcycle_update)
     if not motorcycle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -68,11 +86,11 @@ async def update_motorcycle(
 @router.delete("/{motorcycle_id}")
 async def delete_motorcycle(
     motorcycle_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a motorcycle (soft delete - archives it)"""
     service = MotorcycleService(db)
-    success = service.archive_motorcycle(motorcycle_id)
+    success = await service.archive_motorcycle(motorcycle_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -85,14 +103,47 @@ async def delete_motorcycle(
 async def update_mileage(
     motorcycle_id: int,
     new_mileage: float,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update motorcycle mileage"""
     service = MotorcycleService(db)
-    motorcycle = service.update_mileage(motorcycle_id, new_mileage)
+    motorcycle = await service.update_mileage(motorcycle_id, new_mileage)
     if not motorcycle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Motorcycle not found"
         )
     return {"message": "Mileage updated successfully", "new_mileage": new_mileage}
+
+
+@router.post("/{motorcycle_id}/telemetry", status_code=status.HTTP_202_ACCEPTED)
+async def ingest_telemetry(
+    motorcycle_id: int,
+    batch: TelemetryBatch,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Accept a batch of odometer samples from a data logger
+
+    Samples are buffered and written to the odometer readings within
+    TELEMETRY_FLUSH_INTERVAL seconds; the same write moves current_mileage
+    to the highest sample. Answers 503 while the buffer is full.
+    """
+    if len(batch.samples) > settings.TELEMETRY_MAX_SAMPLES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.TELEMETRY_MAX_SAMPLES} samples per request"
+        )
+    if not await db.scalar(select(Motorcycle.id).where(Motorcycle.id == motorcycle_id)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Motorcycle not found"
+        )
+    
+    samples = [(sample.recorded_at, sample.mileage) for sample in batch.samples]
+    if not odometer_log.record(motorcycle_id, samples):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Telemetry buffer full, retry shortly",
+            headers={"Retry-After": str(settings.TELEMETRY_FLUSH_INTERVAL)}
+        )
+    return {"message": "Samples accepted", "accepted": len(samples)}
@@ -1,49 +1,68 @@
 # backend/app/api/v1/endpoints/parts.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.pagination import Keyset, page, paginate
+from app.core.versioning import list_etag, not_modified, set_etag
 from app.models.parts import Part
 from app.models.motorcycle import Motorcycle
 from app.schemas.parts import PartCreate, PartUpdate, PartResponse, PartUse, PartRestock
+from app.services.parts_service import PartsService
 
 router = APIRouter()
 
+PART_KEYSET = Keyset(Part.created_at, Part.id, descending=True)
+
 
 @router.get("/", response_model=List[PartResponse])
 async def get_parts(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     motorcycle_id: Optional[int] = None,
     category: Optional[str] = None,
     in_stock_only: bool = False,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get parts with optional filtering"""
-    query = db.query(Part)
+    """Get parts with optional filtering, newest first
+
+    Pass the X-Next-Cursor header of a page as cursor to fetch the next one.
+    """
+    etag = await list_etag(db, request, "parts", motorcycle_id)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    set_etag(response, etag)
+    
+    query = select(Part)
     
     if motorcycle_id:
-        query = query.filter(Part.motorcycle_id == motorcycle_id)
+        query = query.where(Part.motorcycle_id == motorcycle_id)
     
     if category:
-        query = query.filter(Part.category == category)
+        query = query.where(Part.category == category)
         
     if in_stock_only:
-        query = query.filter(Part.quantity_in_stock > 0)
+        query = query.where(Part.quantity_in_stock > 0)
     
-    return query.offset(skip).limit(limit).all()
+    parts = (await db.scalars(paginate(query, PART_KEYSET, cursor, skip, limit))).all()
+    return page(parts, PART_KEYSET, limit, response)
 
 
 @router.post("/", response_model=PartResponse)
 async def create_part(
     part: PartCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new part"""
     # Verify motorcycle exists
-    motorcycle = db.query(Motorcycle).filter(Motorcycle.id == part.motorcycle_id).first()
+    motorcycle = await db.get(Motorcycle, part.motorcycle_id)
     if not motorcycle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,68 +71,38 @@ async def create_part(
     
     db_part = Part(**part.dict())
     db.add(db_part)
+    await db.commit()
+    await db.refresh(db_part)
+    return db_part
+
+
 @router.get("/expenses")
 async def get_parts_expenses(
     motorcycle_id: Optional[int] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get parts expense summary"""
-    query = db.query(Part)
-    
-    if motorcycle_id:
-        query = query.filter(Part.motorcycle_id == motorcycle_id)
-    
-    if start_date:
-        query = query.filter(Part.purchase_date >= start_date)
-    
-    if end_date:
-        query = query.filter(Part.purchase_date <= end_date)
-    
-    parts = query.all()
-    
-    total_cost = sum(part.total_cost for part in parts if part.total_cost)
-    total_parts = len(parts)
-    total_stock_value = sum(
-        (part.unit_price or 0) * part.quantity_in_stock 
-        for part in parts 
-        if part.unit_price
-    )
-    
-    # Group by category
-    category_costs = {}
-    for part in parts:
-        category = part.category or "Uncategorized"
-        if category not in category_costs:
-            category_costs[category] = 0
-        category_costs[category] += part.total_cost or 0
-    
-    return {
-        "total_cost": total_cost,
-        "total_parts": total_parts,
-        "total_stock_value": total_stock_value,
-        "average_part_cost": total_cost / total_parts if total_parts > 0 else 0,
-        "category_breakdown": category_costs
-    }
+    return await PartsService(db).get_parts_expense_summary(motorcycle_id, start_date, end_date)
 
 
 @router.get("/replacement-needed")
 async def get_parts_needing_replacement(
     motorcycle_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get parts that may need replacement"""
-    query = db.query(Part).filter(
+    query = select(Part).where(
         Part.is_installed == True,
         Part.replacement_interval_km.isnot(None) | Part.replacement_interval_months.isnot(None)
     )
     
     if motorcycle_id:
-        query = query.filter(Part.motorcycle_id == motorcycle_id)
+        query = query.where(Part.motorcycle_id == motorcycle_id)
     
     parts_needing_replacement = []
-    for part in query.all():
+    for part in (await db.scalars(query)).all():
         needs_replacement = False
         reason = ""
         
@@ -148,10 +137,10 @@ async def get_parts_needing_replacement(
 @router.get("/categories/{motorcycle_id}")
 async def get_parts_by_category(
     motorcycle_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get parts grouped by category for a motorcycle"""
-    parts = db.query(Part).filter(Part.motorcycle_id == motorcycle_id).all()
+    parts = (await db.scalars(select(Part).where(Part.motorcycle_id == motorcycle_id))).all()
     
     categories = {}
     for part in parts:
@@ -173,27 +162,27 @@ async def get_parts_by_category(
 async def get_low_stock_parts(
     motorcycle_id: Optional[int] = None,
     threshold: int = 5,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get parts with low stock"""
-    query = db.query(Part).filter(
+    query = select(Part).where(
         Part.quantity_in_stock <= threshold,
         Part.quantity_in_stock > 0
     )
     
     if motorcycle_id:
-        query = query.filter(Part.motorcycle_id == motorcycle_id)
+        query = query.where(Part.motorcycle_id == motorcycle_id)
     
-    return query.all()
+    return (await db.scalars(query)).all()
 
 
 @router.get("/{part_id}", response_model=PartResponse)
 async def get_part(
     part_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific part"""
-    part = db.query(Part).filter(Part.id == part_id).first()
+    part = await db.get(Part, part_id)
     if not part:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -206,10 +195,10 @@ async def get_part(
 async def update_part(
     part_id: int,
     part_update: PartUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a part"""
-    db_part = db.query(Part).filter(Part.id == part_id).first()
+    db_part = await db.get(Part, part_id)
     if not db_part:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -220,26 +209,26 @@ async def update_part(
     for field, value in update_data.items():
         setattr(db_part, field, value)
     
-    db.commit()
-    db.refresh(db_part)
+    await db.commit()
+    await db.refresh(db_part)
     return db_part
 
 
 @router.delete("/{part_id}")
 async def delete_part(
     part_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a part"""
-    db_part = db.query(Part).filter(Part.id == part_id).first()
+    db_part = await db.get(Part, part_id)
     if not db_part:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Part not found"
         )
     
-    db.delete(db_part)
-    db.commit()
+    await db.delete(db_part)
+    await db.commit()
     return {"message": "Part deleted successfully"}
 
 
@@ -247,10 +236,10 @@ async def delete_part(
 async def use_part(
     part_id: int,
     use_data: PartUse,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Use a part (reduce stock, increase used count)"""
-    db_part = db.query(Part).filter(Part.id == part_id).first()
+    db_part = await db.get(Part, part_id)
     if not db_part:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -266,8 +255,8 @@ async def use_part(
     db_part.quantity_in_stock -= use_data.quantity
     db_part.quantity_used += use_data.quantity
     
-    db.commit()
-    db.refresh(db_part)
+    await db.commit()
+    await db.refresh(db_part)
     return db_part
 
 
@@ -275,10 +264,10 @@ async def use_part(
 async def restock_part(
     part_id: int,
     restock_data: PartRestock,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Add stock to a part"""
-    db_part = db.query(Part).filter(Part.id == part_id).first()
+    db_part = await db.get(Part, part_id)
     if not db_part:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -291,6 +280,6 @@ async def restock_part(
         db_part.unit_price = restock_data.unit_price
         db_part.total_cost = (db_part.total_cost or 0) + (restock_data.quantity * restock_data.unit_price)
     
-    db.commit()
-    db.refresh(db_part)
+    await db.commit()
+    await db.refresh(db_part)
     return db_part
\ No newline at end of file
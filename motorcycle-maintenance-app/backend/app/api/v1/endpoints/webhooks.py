@@ -1,51 +1,63 @@
 # backend/app/api/v1/endpoints/webhooks.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+import json
 
-from app.core.database import get_db
-from app.models.webhook import WebhookConfig
-from app.schemas.webhook import WebhookCreate, WebhookUpdate, WebhookResponse, WebhookStats
+from app.core.database import get_db, get_read_db
+from app.core.pagination import Keyset, page, paginate
+from app.models.webhook import WebhookConfig, WebhookOutbox, WebhookDeliveryAttempt
+from app.schemas.webhook import WebhookCreate, WebhookUpdate, WebhookResponse, WebhookStats, WebhookCircuit
+from app.services.webhook_health import webhook_health
+from app.services.webhook_log import latency_percentiles
 
 router = APIRouter()
 
+WEBHOOK_KEYSET = Keyset(WebhookConfig.created_at, WebhookConfig.id)
+
 
 @router.get("/", response_model=List[WebhookResponse])
 async def get_webhooks(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all webhook configurations"""
-    webhooks = db.query(WebhookConfig).offset(skip).limit(limit).all()
-    return webhooks
+    """Get all webhook configurations, oldest first
+
+    Pass the X-Next-Cursor header of a page as cursor to fetch the next one.
+    """
+    webhooks = (await db.scalars(paginate(select(WebhookConfig), WEBHOOK_KEYSET, cursor, skip, limit))).all()
+    return page(webhooks, WEBHOOK_KEYSET, limit, response)
 
 
 @router.post("/", response_model=WebhookResponse)
 async def create_webhook(
     webhook: WebhookCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new webhook configuration"""
     webhook_data = webhook.dict()
-    if webhook_data.get('event_types'):
-        import json
+    webhook_data['url'] = str(webhook_data['url'])
+    if webhook_data.get('event_types') is not None:
         webhook_data['event_types'] = json.dumps(webhook_data['event_types'])
     
     db_webhook = WebhookConfig(**webhook_data)
     db.add(db_webhook)
-    db.commit()
-    db.refresh(db_webhook)
+    await db.commit()
+    await db.refresh(db_webhook)
     return db_webhook
 
 
 @router.get("/{webhook_id}", response_model=WebhookResponse)
 async def get_webhook(
     webhook_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get a specific webhook configuration"""
-    webhook = db.query(WebhookConfig).filter(WebhookConfig.id == webhook_id).first()
+    webhook = await db.get(WebhookConfig, webhook_id)
     if not webhook:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -58,10 +70,10 @@ async def get_webhook(
 async def update_webhook(
     webhook_id: int,
     webhook_update: WebhookUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a webhook configuration"""
-    db_webhook = db.query(WebhookConfig).filter(WebhookConfig.id == webhook_id).first()
+    db_webhook = await db.get(WebhookConfig, webhook_id)
     if not db_webhook:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,49 +81,58 @@ async def update_webhook(
         )
     
     update_data = webhook_update.dict(exclude_unset=True)
-    if 'event_types' in update_data and update_data['event_types']:
-        import json
+    if update_data.get('url') is not None:
+        update_data['url'] = str(update_data['url'])
+    if update_data.get('event_types') is not None:
         update_data['event_types'] = json.dumps(update_data['event_types'])
     
     for field, value in update_data.items():
         setattr(db_webhook, field, value)
     
-    db.commit()
-    db.refresh(db_webhook)
+    await db.commit()
+    if 'url' in update_data:
+        # A new receiver starts with a clean record
+        webhook_health.forget(webhook_id)
+    await db.refresh(db_webhook)
     return db_webhook
 
 
 @router.delete("/{webhook_id}")
 async def delete_webhook(
     webhook_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a webhook configuration"""
-    db_webhook = db.query(WebhookConfig).filter(WebhookConfig.id == webhook_id).first()
+    db_webhook = await db.get(WebhookConfig, webhook_id)
     if not db_webhook:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Webhook not found"
         )
     
-    db.delete(db_webhook)
-    db.commit()
+    # Queued deliveries and their log go with it
+    await db.execute(delete(WebhookOutbox).where(WebhookOutbox.webhook_id == webhook_id))
+    await db.execute(delete(WebhookDeliveryAttempt).where(WebhookDeliveryAttempt.webhook_id == webhook_id))
+    await db.delete(db_webhook)
+    await db.commit()
+    webhook_health.forget(webhook_id)
     return {"message": "Webhook deleted successfully"}
 
 
 @router.get("/{webhook_id}/stats", response_model=WebhookStats)
 async def get_webhook_stats(
     webhook_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get webhook statistics"""
-    webhook = db.query(WebhookConfig).filter(WebhookConfig.id == webhook_id).first()
+    webhook = await db.get(WebhookConfig, webhook_id)
     if not webhook:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Webhook not found"
         )
     
+    p50, p95, p99 = await latency_percentiles(db, webhook_id)
     success_rate = 0
     if webhook.total_calls > 0:
         success_rate = (webhook.successful_calls / webhook.total_calls) * 100
@@ -121,17 +142,21 @@ async def get_webhook_stats(
         successful_calls=webhook.successful_calls,
         failed_calls=webhook.failed_calls,
         success_rate=success_rate,
-        last_triggered=webhook.last_triggered
+        last_triggered=webhook.last_triggered,
+        latency_p50=p50,
+        latency_p95=p95,
+        latency_p99=p99,
+        circuit=WebhookCircuit(**webhook_health.snapshot(webhook_id)._asdict())
     )
 
 
 @router.post("/{webhook_id}/test")
 async def test_webhook(
     webhook_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Test a webhook by sending a test payload"""
-    webhook = db.query(WebhookConfig).filter(WebhookConfig.id == webhook_id).first()
+    """Test a webhook by queueing a test payload for it"""
+    webhook = await db.get(WebhookConfig, webhook_id)
     if not webhook:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -148,8 +173,12 @@ async def test_webhook(
     }
     
     try:
-        await webhook_service.send_webhook("test_webhook", test_data)
-        return {"message": "Test webhook sent successfully"}
+        deliveries = await webhook_service.send_webhook("test_webhook", test_data, webhooks=[webhook])
+        await db.commit()
+        return {
+            "message": "Test webhook queued for delivery",
+            "delivery_ids": [delivery.id for delivery in deliveries]
+        }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
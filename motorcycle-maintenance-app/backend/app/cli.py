@@ -0,0 +1,74 @@
+# backend/app/cli.py
+# Maintenance commands for the backend database.
+#
+# Run from the backend directory:
+#   python -m app.cli rebuild-rollups
+#   python -m app.cli rebuild-due-states
+#   python -m app.cli rebuild-fuel-stats
+#   python -m app.cli downsample-telemetry
+
+import argparse
+import asyncio
+
+from app.core.database import SessionLocal
+from app.core.migrations import run_migrations
+
+
+async def rebuild_rollups():
+    """Regenerate the monthly cost rollup from the raw records"""
+    from app.services.cost_rollup_service import CostRollupService
+
+    async with SessionLocal() as db:
+        rows = await CostRollupService(db).rebuild()
+    print(f"Rebuilt monthly cost rollup: {rows} rows")
+
+
+async def rebuild_due_states():
+    """Regenerate the per-service maintenance due state from the history"""
+    from app.services.due_state_service import DueStateService
+
+    async with SessionLocal() as db:
+        rows = await DueStateService(db).rebuild()
+    print(f"Rebuilt maintenance due state: {rows} rows")
+
+
+async def rebuild_fuel_stats():
+    """Regenerate the per-motorcycle fuel statistics from the ride logs"""
+    from app.services.fuel_stats_service import FuelStatsService
+
+    async with SessionLocal() as db:
+        rows = await FuelStatsService(db).rebuild()
+    print(f"Rebuilt fuel statistics: {rows} rows")
+
+
+async def downsample_telemetry():
+    """Thin out the odometer readings past the raw retention period now"""
+    from datetime import datetime, timedelta
+
+    from app.core.config import settings
+    from app.services.telemetry import downsample
+
+    cutoff = datetime.utcnow() - timedelta(days=settings.TELEMETRY_RAW_RETENTION_DAYS)
+    async with SessionLocal() as db:
+        removed = await downsample(db, cutoff, settings.TELEMETRY_DOWNSAMPLE_INTERVAL)
+    print(f"Downsampled odometer telemetry: {removed} readings removed")
+
+
+COMMANDS = {
+    "rebuild-rollups": rebuild_rollups,
+    "rebuild-due-states": rebuild_due_states,
+    "rebuild-fuel-stats": rebuild_fuel_stats,
+    "downsample-telemetry": downsample_telemetry,
+}
+
+
+async def main(command: str):
+    await run_migrations()
+    await COMMANDS[command]()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rideway backend maintenance commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(main(args.command))
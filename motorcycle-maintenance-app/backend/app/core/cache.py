@@ -0,0 +1,138 @@
+# backend/app/core/cache.py
+# In-process response cache for the dashboard endpoints.
+#
+# Entries are scoped to the whole fleet or to a single motorcycle. Committed
+# writes invalidate the scopes they touch (see app.core.change_tracking); the
+# TTL only bounds staleness for writes this process cannot see, such as other
+# workers or manual database edits.
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.change_tracking import Changes, on_commit
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+
+FLEET_SCOPE = "fleet"
+
+# Tables the dashboard responses are computed from
+DASHBOARD_TABLES = {"motorcycles", "maintenance_records", "parts", "ride_logs"}
+
+cache_hits = Counter("dashboard_cache_hits_total", "Dashboard responses served from cache", ("endpoint",))
+cache_misses = Counter("dashboard_cache_misses_total", "Dashboard responses computed on a cache miss", ("endpoint",))
+cache_invalidations = Counter("dashboard_cache_invalidations_total", "Dashboard cache scopes invalidated by writes", ("scope",))
+
+
+def motorcycle_scope(motorcycle_id: int) -> str:
+    return f"motorcycle:{motorcycle_id}"
+
+
+class ResponseCache:
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}  # (scope, key) -> (expires_at, value)
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0  # Bumped by clear(), which invalidates every scope at once
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, scope: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(scope, 0)
+
+    def get(self, scope: str, key: Tuple) -> Tuple[bool, Any]:
+        entry = self._entries.get((scope, key))
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop((scope, key), None)
+            return False, None
+        return True, value
+
+    def set(self, scope: str, key: Tuple, value: Any, generation: Tuple[int, int]):
+        """Store a value unless its scope was invalidated while it was being computed"""
+        with self._lock:
+            if self.generation(scope) != generation:
+                return
+            if len(self._entries) >= self.max_entries:
+                self._evict_expired()
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[(scope, key)] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, scope: str):
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == scope]:
+                del self._entries[entry_key]
+        cache_invalidations.inc(scope=scope.split(":")[0])
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+        cache_invalidations.inc(scope="all")
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for entry_key in [entry_key for entry_key, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[entry_key]
+
+    def cached(self, endpoint: str, scope_param: Optional[str] = None):
+        """Cache an endpoint's response, keyed by its non-session arguments.
+
+        The entry is scoped to the motorcycle named by scope_param when the
+        request has one, and to the whole fleet otherwise.
+        """
+        def decorator(func: Callable):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                motorcycle_id = kwargs.get(scope_param) if scope_param else None
+                scope = motorcycle_scope(motorcycle_id) if motorcycle_id else FLEET_SCOPE
+                key = (endpoint,) + tuple(sorted(
+                    (name, value) for name, value in kwargs.items() if name != "db"
+                ))
+
+                hit, value = self.get(scope, key)
+                if hit:
+                    cache_hits.inc(endpoint=endpoint)
+                    return value
+
+                cache_misses.inc(endpoint=endpoint)
+                generation = self.generation(scope)
+                value = await func(*args, **kwargs)
+                self.set(scope, key, value, generation)
+                return value
+            return wrapper
+        return decorator
+
+
+dashboard_cache = ResponseCache(
+    ttl=settings.DASHBOARD_CACHE_TTL,
+    max_entries=settings.DASHBOARD_CACHE_MAX_ENTRIES
+)
+
+Gauge("dashboard_cache_entries", "Responses currently held in the dashboard cache", callback=lambda: len(dashboard_cache))
+
+
+@on_commit
+def _invalidate_dashboard_cache(changes: Changes):
+    touched = DASHBOARD_TABLES.intersection(changes)
+    if not touched:
+        return
+
+    motorcycle_ids = set().union(*(changes[table] for table in touched))
+    if None in motorcycle_ids:
+        # A write not attributed to a motorcycle could affect any of them
+        dashboard_cache.clear()
+        return
+
+    # Every fleet-wide figure depends on all bikes, so any write invalidates it
+    dashboard_cache.invalidate(FLEET_SCOPE)
+    for motorcycle_id in motorcycle_ids:
+        dashboard_cache.invalidate(motorcycle_scope(motorcycle_id))
@@ -0,0 +1,104 @@
+# backend/app/core/change_tracking.py
+# Collects which tables (and which motorcycles) a transaction wrote to. Flush
+# subscribers see each batch inside the transaction; commit subscribers get
+# the accumulated set once the transaction has committed.
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# {table name: ids of the motorcycles touched; None marks a change not tied to one bike}
+Changes = Dict[str, Set[Optional[int]]]
+
+_PENDING_KEY = "pending_changes"
+_flush_subscribers: List[Callable[[Session, Changes], None]] = []
+_subscribers: List[Callable[[Changes], None]] = []
+
+
+def on_flush(callback: Callable[[Session, Changes], None]) -> Callable[[Session, Changes], None]:
+    """Register a callback run inside the transaction with each batch of changes.
+
+    The callback gets the sync Session and may write through session.connection(),
+    so whatever it writes commits or rolls back with the changes themselves.
+    """
+    _flush_subscribers.append(callback)
+    return callback
+
+
+def on_commit(callback: Callable[[Changes], None]) -> Callable[[Changes], None]:
+    """Register a callback run with the committed changes of every transaction"""
+    _subscribers.append(callback)
+    return callback
+
+
+def _record(session: Session, changes: Changes):
+    for callback in _flush_subscribers:
+        callback(session, changes)
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for table, motorcycle_ids in changes.items():
+        pending.setdefault(table, set()).update(motorcycle_ids)
+
+
+async def mark_changed(db: AsyncSession, table: str, motorcycle_ids: Iterable[Optional[int]] = (None,)):
+    """Record a change made outside the ORM unit of work (Core inserts/updates)"""
+    await db.run_sync(_record, {table: set(motorcycle_ids)})
+
+
+def committed_value(obj, key: str):
+    """Value of an attribute as it was before the current flush"""
+    history = inspect(obj).attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return None
+
+
+def _motorcycle_ids(obj) -> Set[Optional[int]]:
+    """Current and previous motorcycle the object belongs to"""
+    if obj.__tablename__ == "motorcycles":
+        return {obj.id}
+
+    if not hasattr(obj, "motorcycle_id"):
+        return {None}
+
+    history = inspect(obj).attrs.motorcycle_id.history
+    ids = set(history.added) | set(history.deleted) | set(history.unchanged)
+    return ids or {obj.motorcycle_id}
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    changes: Changes = {}
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table is None:
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        changes.setdefault(table, set()).update(_motorcycle_ids(obj))
+    if changes:
+        _record(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    for callback in _subscribers:
+        try:
+            callback(changes)
+        except Exception:
+            # The data is committed already; a failing subscriber must not surface as a write error
+            logger.exception("Change subscriber %r failed", callback)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_PENDING_KEY, None)
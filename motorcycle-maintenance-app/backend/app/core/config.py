@@ -9,6 +9,46 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./data/motorcycle_maintenance.db"
     
+    # Database profile: "default" uses a single engine with stock SQLite settings,
+    # "production" enables WAL and splits writes and reads over separate engines
+    DATABASE_PROFILE: str = "default"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -64000  # negative = KiB (64MB)
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256MB
+    SQLITE_BUSY_TIMEOUT: int = 5000  # milliseconds
+    DATABASE_READ_POOL_SIZE: int = 5
+    DATABASE_READ_MAX_OVERFLOW: int = 10
+    
+    # Dashboard response cache; writes invalidate entries, the TTL bounds
+    # staleness for changes made outside this process
+    DASHBOARD_CACHE_TTL: int = 60  # seconds
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 1024
+    
+    # Background scan for due maintenance (0 disables it); each due point
+    # fires one maintenance_due event
+    MAINTENANCE_SCAN_INTERVAL: int = 300  # seconds
+    MAINTENANCE_DUE_NOTICE_DAYS: int = 7  # notify this many days before the due date
+    MAINTENANCE_DUE_NOTICE_KM: float = 0  # notify this many km before the due mileage
+    
+    # Bulk ride log import
+    RIDE_LOG_IMPORT_BATCH: int = 500  # rows validated and written per transaction
+    
+    # Streaming exports
+    EXPORT_BATCH_SIZE: int = 1000  # rows fetched per cursor round trip
+    
+    # Recorded GPS tracks
+    GPS_TRACK_MAX_POINTS: int = 200000  # per uploaded track
+    GPS_TRACK_TOLERANCES: List[float] = [2.0, 8.0, 32.0, 128.0, 512.0]  # meters, one level of detail each
+    
+    # Odometer telemetry; samples are buffered and written in one transaction
+    # per flush, which also moves current_mileage
+    TELEMETRY_FLUSH_INTERVAL: int = 1  # seconds between batched writes
+    TELEMETRY_BATCH: int = 5000  # buffered samples that trigger an early write
+    TELEMETRY_MAX_BUFFERED: int = 100000  # samples held before ingestion answers 503
+    TELEMETRY_MAX_SAMPLES: int = 10000  # per request
+    TELEMETRY_RAW_RETENTION_DAYS: int = 7  # readings are kept at full rate this long
+    TELEMETRY_DOWNSAMPLE_INTERVAL: int = 3600  # seconds; older readings keep one per motorcycle per interval
+    
     # CORS - Allow all origins in development
     BACKEND_CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -23,7 +63,29 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     
     # Webhook settings
-    WEBHOOK_TIMEOUT: int = 30  # seconds
+    WEBHOOK_TIMEOUT: int = 30  # seconds; write and pool wait
+    WEBHOOK_CONNECT_TIMEOUT: int = 5  # seconds
+    WEBHOOK_READ_TIMEOUT: int = 30  # seconds
+    WEBHOOK_MAX_CONNECTIONS: int = 20  # shared client pool
+    WEBHOOK_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    WEBHOOK_KEEPALIVE_EXPIRY: int = 30  # seconds an idle connection is kept
+    WEBHOOK_PER_HOST_LIMIT: int = 4  # concurrent requests to one receiver
+    WEBHOOK_HTTP2: bool = False  # needs httpx[http2]
+    WEBHOOK_WORKERS: int = 4  # concurrent deliveries from the outbox
+    WEBHOOK_POLL_INTERVAL: int = 5  # seconds; commits that queue events wake the workers sooner
+    WEBHOOK_DRAIN_TIMEOUT: int = 10  # seconds to finish claimed deliveries on shutdown
+    WEBHOOK_OUTBOX_RETENTION_DAYS: int = 7  # delivered rows and logged attempts are purged after this
+    WEBHOOK_REGISTRY_TTL: int = 60  # seconds; bounds staleness of other processes' webhook edits
+    WEBHOOK_BREAKER_WINDOW: int = 20  # recent calls the failure rate is taken over
+    WEBHOOK_BREAKER_MIN_CALLS: int = 5  # calls needed before the circuit can open
+    WEBHOOK_BREAKER_FAILURE_RATE: float = 0.5  # failed or slow share of calls that opens it
+    WEBHOOK_BREAKER_SLOW_CALL: float = 10.0  # seconds; slower calls count as failures
+    WEBHOOK_BREAKER_COOLDOWN: int = 60  # seconds open before a probe call
+    WEBHOOK_LATENCY_SAMPLES: int = 200  # recent call latencies kept for percentiles
+    WEBHOOK_LOG_FLUSH_INTERVAL: int = 5  # seconds between batched writes of the delivery log
+    WEBHOOK_LOG_BATCH: int = 200  # buffered attempts that trigger an early write
+    WEBHOOK_LOG_MAX_BUFFERED: int = 10000  # attempts held while writes fail; the oldest are dropped past this
+    WEBHOOK_STATS_SAMPLES: int = 1000  # logged calls the stats latency percentiles cover
     
     # Locale settings (Europe/GMT+1 default)
     DEFAULT_TIMEZONE: str = "Europe/Amsterdam"
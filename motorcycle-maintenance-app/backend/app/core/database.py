@@ -1,22 +1,96 @@
-from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # SQLite specific
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def async_database_url(database_url: str) -> str:
+    """Map a plain sqlite:// URL onto the aiosqlite driver"""
+    url = make_url(database_url)
+    if url.drivername == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+def _set_sqlite_pragmas(dbapi_connection, read_only: bool = False):
+    """Apply the production pragmas to a freshly opened SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def build_engines(database_url: str, profile: str = "default"):
+    """Create the (writer, reader) async engine pair for a database profile.
+
+    The default profile returns one engine for both roles. The production
+    profile uses a single-connection writer, so writes queue in the pool
+    instead of fighting over the SQLite lock, and a pooled read-only engine
+    that keeps serving reads from the WAL while a write is in progress.
+    """
+    database_url = async_database_url(database_url)
+    connect_args = {"check_same_thread": False}  # SQLite specific
+
+    if profile != "production":
+        # aiosqlite defaults to NullPool, which would open a connection (and a
+        # worker thread) per request; keep the pooling the sync driver had
+        default_engine = create_async_engine(
+            database_url,
+            connect_args=connect_args,
+            poolclass=AsyncAdaptedQueuePool
+        )
+        return default_engine, default_engine
+
+    writer = create_async_engine(
+        database_url,
+        connect_args=connect_args,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0
+    )
+    reader = create_async_engine(
+        database_url,
+        connect_args=connect_args,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DATABASE_READ_POOL_SIZE,
+        max_overflow=settings.DATABASE_READ_MAX_OVERFLOW
+    )
+
+    @event.listens_for(writer.sync_engine, "connect")
+    def _on_writer_connect(dbapi_connection, connection_record):
+        _set_sqlite_pragmas(dbapi_connection)
+
+    @event.listens_for(reader.sync_engine, "connect")
+    def _on_reader_connect(dbapi_connection, connection_record):
+        _set_sqlite_pragmas(dbapi_connection, read_only=True)
+
+    return writer, reader
+
+
+engine, read_engine = build_engines(settings.DATABASE_URL, settings.DATABASE_PROFILE)
+
+# expire_on_commit is off because attribute refreshes cannot lazy-load under asyncio
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+ReadSessionLocal = async_sessionmaker(bind=read_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def create_tables():
-    Base.metadata.create_all(bind=engine)
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_read_db():
+    """Session for read-only endpoints; served by the reader engine"""
+    async with ReadSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,86 @@
+# backend/app/core/http_client.py
+# Long-lived HTTP client for outgoing webhook calls.
+#
+# The app lifespan opens one pooled httpx.AsyncClient that every delivery
+# shares, so connections (and their TLS sessions) stay alive between calls
+# instead of being set up for each one. A semaphore per host caps how many
+# requests run against a single receiver at once.
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401  (installed with httpx[http2])
+    except ImportError:
+        return False
+    return True
+
+
+class WebhookHttpClient:
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        per_host_limit: int,
+        connect_timeout: float,
+        read_timeout: float,
+        timeout: float,
+        http2: bool = False
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout, read=read_timeout)
+        self.per_host_limit = per_host_limit
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def open(self):
+        if self._client is not None:
+            return
+        http2 = self.http2
+        if http2 and not _http2_available():
+            logger.warning("WEBHOOK_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+            http2 = False
+        self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=http2)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post(self, url: str, content, headers: Dict[str, str]) -> httpx.Response:
+        # Opened on first use too, for callers running outside the app lifespan
+        self.open()
+        host = urlsplit(url).netloc
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        async with slots:
+            return await self._client.post(url, content=content, headers=headers)
+
+
+webhook_http = WebhookHttpClient(
+    max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.WEBHOOK_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.WEBHOOK_KEEPALIVE_EXPIRY,
+    per_host_limit=settings.WEBHOOK_PER_HOST_LIMIT,
+    connect_timeout=settings.WEBHOOK_CONNECT_TIMEOUT,
+    read_timeout=settings.WEBHOOK_READ_TIMEOUT,
+    timeout=settings.WEBHOOK_TIMEOUT,
+    http2=settings.WEBHOOK_HTTP2
+)
@@ -0,0 +1,42 @@
+# backend/app/core/migrations.py
+import os
+import logging
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Revision matching the schema that create_all() used to build
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config() -> Config:
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    return config
+
+
+def _upgrade(connection: Connection):
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+
+    tables = inspect(connection).get_table_names()
+    if "alembic_version" not in tables and "motorcycles" in tables:
+        # Database was created by create_all() before migrations existed
+        logger.info(f"Stamping existing database at revision {BASELINE_REVISION}")
+        command.stamp(config, BASELINE_REVISION)
+
+    command.upgrade(config, "head")
+
+
+async def run_migrations():
+    """Upgrade the database schema to the latest revision"""
+    async with engine.begin() as conn:
+        await conn.run_sync(_upgrade)
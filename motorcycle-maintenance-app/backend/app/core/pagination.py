@@ -0,0 +1,76 @@
+# backend/app/core/pagination.py
+# Keyset (cursor) pagination for the list endpoints.
+#
+# A page ends with the sort key of its last row; the next page starts right
+# after that key with a range condition the matching index answers directly,
+# so page N costs what page 1 does. The key travels as an opaque cursor in
+# the X-Next-Cursor response header, leaving the list bodies unchanged, and
+# is absent on the last page. skip/limit keep working for older clients.
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Column, DateTime, Select, literal, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Keyset:
+    """The columns a list is sorted on, all ascending or all descending, ending in a unique one"""
+
+    def __init__(self, *columns: Column, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def order_by(self) -> List[Any]:
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def encode(self, row: Any) -> str:
+        values = [getattr(row, column.key) for column in self.columns]
+        raw = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> List[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError
+            return [
+                datetime.fromisoformat(value) if isinstance(column.type, DateTime) and value is not None else value
+                for column, value in zip(self.columns, values)
+            ]
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def paginate(query: Select, keyset: Keyset, cursor: Optional[str], skip: int, limit: int) -> Select:
+    """The page's query: sorted by the keyset and one row past limit, to tell whether more follow"""
+    query = query.order_by(*keyset.order_by())
+    if cursor:
+        after = tuple_(*(_bound(column, value) for column, value in zip(keyset.columns, keyset.decode(cursor))))
+        key = tuple_(*keyset.columns)
+        query = query.where(key < after if keyset.descending else key > after)
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+def _bound(column: Column, value: Any) -> Any:
+    # Server-default timestamps are stored as SQLite's CURRENT_TIMESTAMP text,
+    # without the microseconds SQLAlchemy writes; comparing in another form
+    # would repeat the rows that share the last row's second
+    if isinstance(value, datetime) and column.server_default is not None:
+        return literal(value.strftime("%Y-%m-%d %H:%M:%S"))
+    return literal(value, column.type)
+
+
+def page(rows: Sequence[Any], keyset: Keyset, limit: int, response: Response) -> Sequence[Any]:
+    """Trim the look-ahead row and point X-Next-Cursor past the last row returned"""
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            response.headers[NEXT_CURSOR_HEADER] = keyset.encode(rows[-1])
+    return rows
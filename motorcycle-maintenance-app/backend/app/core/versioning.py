@@ -0,0 +1,80 @@
+# backend/app/core/versioning.py
+# Per-table and per-motorcycle write counters behind the weak ETags on the
+# list endpoints. Counters are bumped in the writing transaction, so they are
+# shared by every worker and survive restarts.
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.change_tracking import Changes, on_flush
+from app.models.data_version import DataVersion
+
+VERSIONED_TABLES = {"motorcycles", "maintenance_records", "parts", "ride_logs"}
+
+
+def version_scope(table: str, motorcycle_id: Optional[int] = None) -> str:
+    return f"{table}:{motorcycle_id}" if motorcycle_id else table
+
+
+@on_flush
+def _bump_versions(session: Session, changes: Changes):
+    scopes = []
+    unattributed = []
+    for table, motorcycle_ids in changes.items():
+        if table not in VERSIONED_TABLES:
+            continue
+        scopes.append(version_scope(table))
+        scopes.extend(version_scope(table, motorcycle_id) for motorcycle_id in motorcycle_ids if motorcycle_id)
+        if None in motorcycle_ids:
+            unattributed.append(table)
+    if not scopes:
+        return
+
+    connection = session.connection()
+    connection.execute(
+        insert(DataVersion).on_conflict_do_update(
+            index_elements=[DataVersion.scope],
+            set_={"version": DataVersion.version + 1}
+        ),
+        [{"scope": scope, "version": 1} for scope in scopes]
+    )
+    for table in unattributed:
+        # Could have touched any motorcycle's rows
+        connection.execute(
+            update(DataVersion)
+            .where(DataVersion.scope.like(f"{table}:%"))
+            .values(version=DataVersion.version + 1)
+        )
+
+
+async def list_etag(db: AsyncSession, request: Request, table: str, motorcycle_id: Optional[int] = None) -> str:
+    """Weak ETag for a list response: the scope's write counter plus the query string"""
+    scope = version_scope(table, motorcycle_id)
+    version = await db.scalar(select(DataVersion.version).where(DataVersion.scope == scope)) or 0
+    query = hashlib.blake2b(
+        repr(sorted(request.query_params.multi_items())).encode(), digest_size=6
+    ).hexdigest()
+    return f'W/"{scope}-{version}-{query}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """304 response when If-None-Match already names this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    opaque = etag[2:]  # Weak comparison ignores the W/ prefix
+    if "*" in candidates or etag in candidates or opaque in candidates:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"  # Always revalidate; unchanged lists cost a 304
@@ -6,11 +6,19 @@ import uvicorn
 import logging
 from contextlib import asynccontextmanager
 import os
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.core.config import settings
-from app.core.database import engine, create_tables
+from app.core.database import engine, SessionLocal
+from app.core.http_client import webhook_http
+from app.core.metrics import render_metrics
+from app.core.migrations import run_migrations
 from app.api.v1.api import api_router
+from app.services.due_notifier import due_scanner
+from app.services.mileage_index import mileage_index
+from app.services.telemetry import odometer_log
+from app.services.webhook_delivery import webhook_dispatcher
+from app.services.webhook_log import delivery_log
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -25,14 +33,32 @@ async def lifespan(app: FastAPI):
     os.makedirs("data", exist_ok=True)
     os.makedirs("static/uploads", exist_ok=True)
     
-    # Create database tables
-    create_tables()
-    logger.info("Database tables created")
+    # Apply database migrations
+    await run_migrations()
+    logger.info("Database migrations applied")
+    
+    # Load the pending mileage thresholds checked on every mileage write
+    async with SessionLocal() as db:
+        thresholds = await mileage_index.load(db)
+    logger.info(f"Mileage threshold index loaded: {thresholds} thresholds")
+    
+    # Shared webhook HTTP client, delivery workers and their batched log,
+    # then the periodic scan for due maintenance and the telemetry writer
+    webhook_http.open()
+    delivery_log.start()
+    webhook_dispatcher.start()
+    due_scanner.start()
+    odometer_log.start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down...")
+    await odometer_log.stop()
+    await due_scanner.stop()
+    await webhook_dispatcher.stop()
+    await delivery_log.stop()
+    await webhook_http.close()
 
 app = FastAPI(
     title="Rideway API",
@@ -51,6 +77,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Logging middleware
@@ -98,6 +125,11 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "API is running"}
 
+# Metrics endpoint (Prometheus text format)
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return render_metrics()
+
 # 404 handler
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
@@ -1,13 +1,28 @@
 from .motorcycle import Motorcycle
 from .maintenance import MaintenanceRecord
 from .parts import Part
-from .logs import RideLog
-from .webhook import WebhookConfig
+from .logs import RideLog, RideTrack
+from .webhook import WebhookConfig, WebhookEvent, WebhookOutbox, WebhookDeliveryAttempt
+from .cost_rollup import MonthlyCostRollup
+from .fuel_stats import MotorcycleFuelStats
+from .telemetry import OdometerReading
+from .data_version import DataVersion
+from .due_state import MaintenanceDueState, MaintenanceDueNotification
 
 __all__ = [
     "Motorcycle",
     "MaintenanceRecord", 
     "Part",
     "RideLog",
-    "WebhookConfig"
+    "RideTrack",
+    "WebhookConfig",
+    "WebhookEvent",
+    "WebhookOutbox",
+    "WebhookDeliveryAttempt",
+    "MonthlyCostRollup",
+    "MotorcycleFuelStats",
+    "OdometerReading",
+    "DataVersion",
+    "MaintenanceDueState",
+    "MaintenanceDueNotification"
 ]
\ No newline at end of file
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from app.core.database import Base
+
+
+class MonthlyCostRollup(Base):
+    """Per-month cost totals, kept in step with maintenance records and parts"""
+    __tablename__ = "monthly_cost_rollups"
+    
+    motorcycle_id = Column(Integer, ForeignKey("motorcycles.id"), primary_key=True)
+    period = Column(String(7), primary_key=True)  # YYYY-MM, or 0000-00 for undated parts
+    source = Column(String, primary_key=True)  # maintenance or parts
+    bucket = Column(String, primary_key=True)  # Service type or part category
+    currency = Column(String, primary_key=True)
+    
+    # Totals
+    record_count = Column(Integer, nullable=False, default=0)
+    total_cost = Column(Float, nullable=False, default=0.0)
+    labor_cost = Column(Float, nullable=False, default=0.0)
+    parts_cost = Column(Float, nullable=False, default=0.0)
+    stock_value = Column(Float, nullable=False, default=0.0)  # Parts only
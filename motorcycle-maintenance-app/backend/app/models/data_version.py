@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String
+from app.core.database import Base
+
+
+class DataVersion(Base):
+    """Write counter per table and per (table, motorcycle), used for ETags"""
+    __tablename__ = "data_versions"
+    
+    scope = Column(String, primary_key=True)  # "parts" or "parts:12"
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey
+from app.core.database import Base
+
+
+class MaintenanceDueState(Base):
+    """Latest completed service per motorcycle and service, with its next due point"""
+    __tablename__ = "maintenance_due_states"
+    
+    motorcycle_id = Column(Integer, ForeignKey("motorcycles.id"), primary_key=True)
+    service_type = Column(String, primary_key=True)  # ServiceType value
+    service_key = Column(String, primary_key=True)  # Normalized name for custom services, "" otherwise
+    
+    # Latest completed record for this service
+    record_id = Column(Integer, nullable=False)  # No FK: the record is deleted before its row is recomputed
+    service_name = Column(String, nullable=False)
+    performed_at = Column(DateTime, nullable=False)
+    
+    # Next service scheduling
+    next_service_date = Column(DateTime, index=True)
+    next_service_mileage = Column(Float)
+
+
+class MaintenanceDueNotification(Base):
+    """Watermark of the last due point a maintenance_due event went out for"""
+    __tablename__ = "maintenance_due_notifications"
+    
+    motorcycle_id = Column(Integer, ForeignKey("motorcycles.id"), primary_key=True)
+    service_type = Column(String, primary_key=True)
+    service_key = Column(String, primary_key=True)
+    
+    # Due point that was notified; a new record or a changed interval fires again
+    record_id = Column(Integer, nullable=False)
+    next_service_date = Column(DateTime)
+    next_service_mileage = Column(Float)
+    notified_at = Column(DateTime, nullable=False)
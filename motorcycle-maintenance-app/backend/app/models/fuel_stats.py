@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey
+from app.core.database import Base
+
+
+class MotorcycleFuelStats(Base):
+    """Running fuel statistics per motorcycle, kept in step with its ride logs"""
+    __tablename__ = "motorcycle_fuel_stats"
+    
+    motorcycle_id = Column(Integer, ForeignKey("motorcycles.id"), primary_key=True)
+    
+    # Rides with fuel consumed
+    ride_count = Column(Integer, nullable=False, default=0)
+    fuel_total = Column(Float, nullable=False, default=0.0)
+    fuel_cost_total = Column(Float, nullable=False, default=0.0)
+    
+    # Price per liter, over the rides with a fuel cost
+    price_count = Column(Integer, nullable=False, default=0)
+    price_sum = Column(Float, nullable=False, default=0.0)
+    
+    # Fuel efficiency, over the rides that have one
+    efficiency_count = Column(Integer, nullable=False, default=0)
+    efficiency_sum = Column(Float, nullable=False, default=0.0)
+    efficiency_sum_squares = Column(Float, nullable=False, default=0.0)
+    best_efficiency = Column(Float)
+    best_ride_id = Column(Integer)
+    worst_efficiency = Column(Float)
+    worst_ride_id = Column(Integer)
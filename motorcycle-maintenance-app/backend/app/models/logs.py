@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, LargeBinary, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -38,9 +38,28 @@ class RideLog(Base):
     notes = Column(Text)
     
     # Metadata
+    content_hash = Column(String)  # Set by bulk imports, which skip rides already stored
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     motorcycle = relationship("Motorcycle", back_populates="ride_logs")
+    
+    __table_args__ = (
+        Index("ix_ride_logs_motorcycle_start", motorcycle_id, start_date, id),
+        Index("ix_ride_logs_start_id", start_date, id),
+        Index("ix_ride_logs_content_hash", content_hash, unique=True),
+        Index("ix_ride_logs_motorcycle_efficiency", motorcycle_id, fuel_efficiency),
+    )
+
 
+class RideTrack(Base):
+    """A ride's recorded GPS track at one level of detail"""
+    __tablename__ = "ride_tracks"
+    
+    ride_log_id = Column(Integer, ForeignKey("ride_logs.id", ondelete="CASCADE"), primary_key=True)
+    level = Column(Integer, primary_key=True)  # 0 is the full recording, higher levels keep fewer points
+    tolerance = Column(Float, nullable=False)  # Douglas-Peucker tolerance in meters, 0 for the recording
+    point_count = Column(Integer, nullable=False)
+    points = Column(LargeBinary, nullable=False)  # Delta-encoded fixed-point, see app/services/gps_track.py
+    created_at = Column(DateTime, server_default=func.now())
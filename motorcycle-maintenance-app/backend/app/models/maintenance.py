@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -63,3 +63,13 @@ class MaintenanceRecord(Base):
     
     # Relationships
     motorcycle = relationship("Motorcycle", back_populates="maintenance_records")
+    
+    # Indexes matching the per-motorcycle history, recent activity, due date/mileage
+    # queries and the keyset-paginated list
+    __table_args__ = (
+        Index("ix_maintenance_records_motorcycle_performed", motorcycle_id, performed_at.desc(), id.desc()),
+        Index("ix_maintenance_records_performed_id", performed_at, id),
+        Index("ix_maintenance_records_completed_performed", is_completed, performed_at),
+        Index("ix_maintenance_records_next_service_date", next_service_date),
+        Index("ix_maintenance_records_motorcycle_next_mileage", motorcycle_id, next_service_mileage),
+    )
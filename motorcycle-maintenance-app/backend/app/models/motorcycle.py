@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -33,4 +33,9 @@ class Motorcycle(Base):
     # Relationships
     maintenance_records = relationship("MaintenanceRecord", back_populates="motorcycle")
     parts = relationship("Part", back_populates="motorcycle")
-    ride_logs = relationship("RideLog", back_populates="motorcycle")
\ No newline at end of file
+    ride_logs = relationship("RideLog", back_populates="motorcycle")
+    
+    # Keyset pagination of the motorcycle list
+    __table_args__ = (
+        Index("ix_motorcycles_created_id", created_at, id),
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -46,4 +46,11 @@ class Part(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    motorcycle = relationship("Motorcycle", back_populates="parts")
\ No newline at end of file
+    motorcycle = relationship("Motorcycle", back_populates="parts")
+    
+    __table_args__ = (
+        Index("ix_parts_motorcycle_category", motorcycle_id, category),
+        Index("ix_parts_purchase_date", purchase_date),
+        Index("ix_parts_created_id", created_at, id),
+        Index("ix_parts_motorcycle_created_id", motorcycle_id, created_at, id),
+    )
\ No newline at end of file
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
+from app.core.database import Base
+
+
+class OdometerReading(Base):
+    """An odometer sample from a motorcycle's data logger; rows are only inserted or downsampled away"""
+    __tablename__ = "odometer_readings"
+
+    id = Column(Integer, primary_key=True)
+    motorcycle_id = Column(Integer, ForeignKey("motorcycles.id"), nullable=False)
+    recorded_at = Column(DateTime, nullable=False)  # As reported by the logger, naive UTC
+    mileage = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_odometer_readings_motorcycle_recorded_at", motorcycle_id, recorded_at),
+        Index("ix_odometer_readings_recorded_at", recorded_at),
+    )
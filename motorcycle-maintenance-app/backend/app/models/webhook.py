@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, LargeBinary, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -24,6 +25,11 @@ class WebhookConfig(Base):
     max_retries = Column(Integer, default=3)
     retry_delay = Column(Integer, default=60)  # seconds
     
+    # Coalescing: events of one type raised within the window go out as one
+    # batched call of up to coalesce_max_batch items; a window of 0 sends each
+    coalesce_window = Column(Integer, nullable=False, default=0, server_default="0")  # seconds
+    coalesce_max_batch = Column(Integer, nullable=False, default=50, server_default="50")
+    
     # Metadata
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -32,4 +38,67 @@ class WebhookConfig(Base):
     # Statistics
     total_calls = Column(Integer, default=0)
     successful_calls = Column(Integer, default=0)
-    failed_calls = Column(Integer, default=0)
\ No newline at end of file
+    failed_calls = Column(Integer, default=0)
+    
+    # Keyset pagination of the webhook list
+    __table_args__ = (
+        Index("ix_webhook_configs_created_id", created_at, id),
+    )
+
+
+class WebhookEvent(Base):
+    """An event raised for webhooks; every subscriber's delivery shares its payload"""
+    __tablename__ = "webhook_events"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    event_type = Column(String, nullable=False)
+    payload = Column(LargeBinary, nullable=False)  # JSON body, encoded once when raised
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class WebhookOutbox(Base):
+    """A webhook delivery, queued in the transaction that raised the event"""
+    __tablename__ = "webhook_outbox"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    webhook_id = Column(Integer, ForeignKey("webhook_configs.id", ondelete="CASCADE"), nullable=False)
+    event_id = Column(Integer, ForeignKey("webhook_events.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # Delivery state: pending, delivered or failed (retries exhausted)
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)  # Pushed ahead while a worker holds the delivery
+    leased_until = Column(DateTime)  # Set while a worker holds the delivery, cleared with its outcome
+    last_error = Column(Text)
+    
+    # Metadata
+    created_at = Column(DateTime, server_default=func.now())
+    delivered_at = Column(DateTime)
+    
+    event = relationship("WebhookEvent")
+    
+    __table_args__ = (
+        Index("ix_webhook_outbox_status_next_attempt_at", status, next_attempt_at),
+    )
+
+
+class WebhookDeliveryAttempt(Base):
+    """One call (or skipped call) to a webhook receiver, written in batches"""
+    __tablename__ = "webhook_delivery_attempts"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    webhook_id = Column(Integer, ForeignKey("webhook_configs.id", ondelete="CASCADE"), nullable=False)
+    outbox_id = Column(Integer)  # First delivery of the call; the outbox row may be purged since
+    events = Column(Integer, nullable=False, default=1)  # Deliveries the call carried when coalesced
+    attempt = Column(Integer, nullable=False)
+    
+    # delivered, failed, or short_circuited (no call made, the circuit was open)
+    status = Column(String, nullable=False)
+    response_code = Column(Integer)
+    latency = Column(Float)  # seconds; empty when no call was made
+    error = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_webhook_delivery_attempts_webhook_id_id", webhook_id, id),
+    )
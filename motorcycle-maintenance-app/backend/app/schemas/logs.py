@@ -1,6 +1,6 @@
 # backend/app/schemas/logs.py
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -64,4 +64,39 @@ class FuelStatistics(BaseModel):
     average_price_per_liter: float
     best_efficiency: Optional[dict] = None
     worst_efficiency: Optional[dict] = None
-    average_efficiency: float
\ No newline at end of file
+    average_efficiency: float
+    efficiency_variance: float = 0
+    efficiency_std_dev: float = 0
+
+
+class RideStatsBucket(BaseModel):
+    period: Optional[str] = None  # Day, Monday of the week, month or year; None without an interval
+    group: Optional[str] = None
+    rides: int
+    distance: float
+    fuel: float
+    fuel_cost: float
+    average_efficiency: Optional[float] = None
+    average_price_per_liter: Optional[float] = None
+
+
+class TrackLevelInfo(BaseModel):
+    level: int
+    tolerance: float  # meters; 0 for the full recording
+    point_count: int
+
+
+class TrackSummary(BaseModel):
+    ride_log_id: int
+    point_count: int
+    distance: float  # km along the recorded track
+    size: int  # bytes stored over all levels
+    levels: List[TrackLevelInfo]
+
+
+class TrackResponse(BaseModel):
+    ride_log_id: int
+    level: int
+    tolerance: float
+    point_count: int
+    points: List[List[float]]  # [latitude, longitude] pairs
@@ -1,7 +1,7 @@
 # Copy this EXACTLY into: backend/app/schemas/motorcycle.py
 
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -39,4 +39,13 @@ class MotorcycleResponse(MotorcycleBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class OdometerSample(BaseModel):
+    recorded_at: datetime
+    mileage: float = Field(..., ge=0)
+
+
+class TelemetryBatch(BaseModel):
+    samples: List[OdometerSample] = Field(..., min_length=1)
@@ -1,5 +1,6 @@
 # backend/app/schemas/webhook.py
-from pydantic import BaseModel, HttpUrl
+import json
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 from typing import Optional, List
 from datetime import datetime
 
@@ -13,6 +14,8 @@ class WebhookBase(BaseModel):
     service_type: str = "generic"
     max_retries: int = 3
     retry_delay: int = 60
+    coalesce_window: int = Field(0, ge=0)  # seconds; 0 sends every event on its own
+    coalesce_max_batch: int = Field(50, ge=1)
 
 
 class WebhookCreate(WebhookBase):
@@ -28,6 +31,8 @@ class WebhookUpdate(BaseModel):
     service_type: Optional[str] = None
     max_retries: Optional[int] = None
     retry_delay: Optional[int] = None
+    coalesce_window: Optional[int] = Field(None, ge=0)
+    coalesce_max_batch: Optional[int] = Field(None, ge=1)
 
 
 class WebhookResponse(WebhookBase):
@@ -39,13 +44,36 @@ class WebhookResponse(WebhookBase):
     successful_calls: int
     failed_calls: int
 
+    @field_validator("event_types", mode="before")
+    @classmethod
+    def parse_event_types(cls, value):
+        # Stored as a JSON array in the database
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
     class Config:
         from_attributes = True
 
 
+class WebhookCircuit(BaseModel):
+    """Receiver health as seen by this process's deliveries"""
+    state: str  # closed, open or half_open
+    recent_calls: int
+    failure_rate: float  # failed or slow share of recent_calls
+    open_until: Optional[datetime] = None
+    latency_p50: Optional[float] = None  # seconds, over recent calls
+    latency_p95: Optional[float] = None
+    latency_p99: Optional[float] = None
+
+
 class WebhookStats(BaseModel):
     total_calls: int
     successful_calls: int
     failed_calls: int
     success_rate: float
-    last_triggered: Optional[datetime] = None
\ No newline at end of file
+    last_triggered: Optional[datetime] = None
+    latency_p50: Optional[float] = None  # seconds, over the last logged calls
+    latency_p95: Optional[float] = None
+    latency_p99: Optional[float] = None
+    circuit: WebhookCircuit
\ No newline at end of file
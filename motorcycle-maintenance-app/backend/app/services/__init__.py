@@ -0,0 +1,5 @@
+# Importing the services package registers the session listeners that keep
+# derived tables (cost rollups, due states, version counters) and the mileage
+# threshold index in step with writes
+from app.core import versioning
+from app.services import cost_rollup_service, due_state_service, mileage_index
@@ -0,0 +1,286 @@
+# backend/app/services/cost_rollup_service.py
+from sqlalchemy import select, func, delete, event
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Dict, Optional, Tuple
+from datetime import datetime
+
+from app.core.change_tracking import committed_value
+from app.models.cost_rollup import MonthlyCostRollup
+from app.models.maintenance import MaintenanceRecord
+from app.models.parts import Part
+
+MAINTENANCE = "maintenance"
+PARTS = "parts"
+UNDATED_PERIOD = "0000-00"  # Parts without a purchase date
+DEFAULT_CURRENCY = "EUR"
+
+AMOUNT_FIELDS = ("record_count", "total_cost", "labor_cost", "parts_cost", "stock_value")
+
+
+def month_period(value: Optional[datetime]) -> str:
+    """Rollup period (YYYY-MM) for a timestamp"""
+    if value is None:
+        return UNDATED_PERIOD
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def _next_month(value: datetime) -> datetime:
+    if value.month == 12:
+        return datetime(value.year + 1, 1, 1)
+    return datetime(value.year, value.month + 1, 1)
+
+
+def _empty_totals() -> Dict[str, float]:
+    return {field: 0 for field in AMOUNT_FIELDS}
+
+
+def _contribution(obj, value) -> Optional[Tuple[tuple, tuple]]:
+    """Rollup key and amounts a record contributes, reading attributes through value()"""
+    if isinstance(obj, MaintenanceRecord):
+        if not value("is_completed") or value("performed_at") is None:
+            return None
+        service_type = value("service_type")
+        key = (
+            value("motorcycle_id"),
+            month_period(value("performed_at")),
+            MAINTENANCE,
+            getattr(service_type, "value", service_type),
+            value("currency") or DEFAULT_CURRENCY
+        )
+        amounts = (1, value("total_cost") or 0, value("labor_cost") or 0, value("parts_cost") or 0, 0)
+        return key, amounts
+
+    if isinstance(obj, Part):
+        key = (
+            value("motorcycle_id"),
+            month_period(value("purchase_date")),
+            PARTS,
+            value("category") or "Uncategorized",
+            value("currency") or DEFAULT_CURRENCY
+        )
+        stock_value = (value("unit_price") or 0) * (value("quantity_in_stock") or 0)
+        amounts = (1, value("total_cost") or 0, 0, 0, stock_value)
+        return key, amounts
+
+    return None
+
+
+def _add_delta(deltas: dict, contribution, sign: int):
+    if contribution is None:
+        return
+    key, amounts = contribution
+    totals = deltas.setdefault(key, [0] * len(AMOUNT_FIELDS))
+    for i, amount in enumerate(amounts):
+        totals[i] += sign * amount
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_cost_rollup_deltas(session, flush_context):
+    """Fold flushed maintenance record and part changes into the rollup.
+
+    Runs on the flushing connection, so the rollup commits or rolls back
+    together with the rows it summarizes.
+    """
+    deltas = {}
+    for obj in session.new:
+        if isinstance(obj, (MaintenanceRecord, Part)):
+            _add_delta(deltas, _contribution(obj, lambda key: getattr(obj, key)), 1)
+
+    for obj in session.dirty:
+        if isinstance(obj, (MaintenanceRecord, Part)):
+            _add_delta(deltas, _contribution(obj, lambda key: committed_value(obj, key)), -1)
+            _add_delta(deltas, _contribution(obj, lambda key: getattr(obj, key)), 1)
+
+    for obj in session.deleted:
+        if isinstance(obj, (MaintenanceRecord, Part)):
+            _add_delta(deltas, _contribution(obj, lambda key: committed_value(obj, key)), -1)
+
+    rows = [
+        dict(zip(("motorcycle_id", "period", "source", "bucket", "currency"), key), **dict(zip(AMOUNT_FIELDS, totals)))
+        for key, totals in deltas.items()
+        if any(totals)
+    ]
+    if not rows:
+        return
+
+    table = MonthlyCostRollup.__table__
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[column.name for column in table.primary_key],
+        set_={field: table.c[field] + stmt.excluded[field] for field in AMOUNT_FIELDS}
+    )
+    connection = session.connection()
+    connection.execute(stmt, rows)
+    connection.execute(delete(table).where(
+        table.c.record_count <= 0,
+        table.c.motorcycle_id.in_({row["motorcycle_id"] for row in rows})
+    ))
+
+
+class CostRollupService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def summarize(
+        self,
+        source: str,
+        motorcycle_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """Cost totals per bucket (service type or part category) in a date range.
+
+        Months that lie fully inside the range are read from the rollup; only
+        the partial months at either edge are summed from the raw rows.
+        """
+        if start_date is not None:
+            start_date = start_date.replace(tzinfo=None)
+        if end_date is not None:
+            end_date = end_date.replace(tzinfo=None)
+
+        totals: Dict[str, Dict[str, float]] = {}
+
+        def merge(rows):
+            for row in rows:
+                bucket_totals = totals.setdefault(row[0], _empty_totals())
+                for field, amount in zip(AMOUNT_FIELDS, row[1:]):
+                    bucket_totals[field] += amount or 0
+
+        # Full months covered by the range
+        first_full = None
+        if start_date is not None:
+            first_full = start_date if start_date == _month_start(start_date) else _next_month(start_date)
+        last_full_end = None  # exclusive
+        if end_date is not None:
+            last_full_end = _month_start(end_date)
+
+        if first_full is None or last_full_end is None or first_full < last_full_end:
+            query = select(
+                MonthlyCostRollup.bucket,
+                *[func.sum(getattr(MonthlyCostRollup, field)) for field in AMOUNT_FIELDS]
+            ).where(MonthlyCostRollup.source == source)
+            if motorcycle_id:
+                query = query.where(MonthlyCostRollup.motorcycle_id == motorcycle_id)
+            if first_full is not None:
+                query = query.where(MonthlyCostRollup.period >= month_period(first_full))
+            if last_full_end is not None:
+                query = query.where(
+                    MonthlyCostRollup.period < month_period(last_full_end),
+                    MonthlyCostRollup.period != UNDATED_PERIOD
+                )
+            merge((await self.db.execute(query.group_by(MonthlyCostRollup.bucket))).all())
+
+            # Partial months at the edges
+            if start_date is not None and start_date < first_full:
+                merge(await self._raw_totals(source, motorcycle_id, start_date, first_full, end_inclusive=False))
+            if end_date is not None:
+                merge(await self._raw_totals(source, motorcycle_id, last_full_end, end_date, end_inclusive=True))
+        else:
+            # The range does not span a whole month
+            merge(await self._raw_totals(source, motorcycle_id, start_date, end_date, end_inclusive=True))
+
+        return totals
+
+    async def _raw_totals(
+        self,
+        source: str,
+        motorcycle_id: Optional[int],
+        start_date: datetime,
+        end_date: datetime,
+        end_inclusive: bool
+    ):
+        if source == MAINTENANCE:
+            timestamp = MaintenanceRecord.performed_at
+            query = select(
+                MaintenanceRecord.service_type,
+                func.count(MaintenanceRecord.id),
+                func.sum(MaintenanceRecord.total_cost),
+                func.sum(MaintenanceRecord.labor_cost),
+                func.sum(MaintenanceRecord.parts_cost),
+                func.sum(0)
+            ).where(MaintenanceRecord.is_completed == True).group_by(MaintenanceRecord.service_type)
+            owner = MaintenanceRecord.motorcycle_id
+        else:
+            timestamp = Part.purchase_date
+            category = func.coalesce(func.nullif(Part.category, ""), "Uncategorized")
+            query = select(
+                category,
+                func.count(Part.id),
+                func.sum(Part.total_cost),
+                func.sum(0),
+                func.sum(0),
+                func.sum(func.coalesce(Part.unit_price, 0) * func.coalesce(Part.quantity_in_stock, 0))
+            ).group_by(category)
+            owner = Part.motorcycle_id
+
+        if motorcycle_id:
+            query = query.where(owner == motorcycle_id)
+        if start_date is not None:
+            query = query.where(timestamp >= start_date)
+        if end_date is not None:
+            query = query.where(timestamp <= end_date if end_inclusive else timestamp < end_date)
+
+        return [
+            (getattr(row[0], "value", row[0]), *row[1:])
+            for row in (await self.db.execute(query)).all()
+        ]
+
+    async def rebuild(self) -> int:
+        """Regenerate the rollup from the raw maintenance records and parts"""
+        await self.db.execute(delete(MonthlyCostRollup))
+
+        period = func.strftime("%Y-%m", MaintenanceRecord.performed_at)
+        currency = func.coalesce(MaintenanceRecord.currency, DEFAULT_CURRENCY)
+        maintenance_rows = (await self.db.execute(
+            select(
+                MaintenanceRecord.motorcycle_id, period, MaintenanceRecord.service_type, currency,
+                func.count(MaintenanceRecord.id),
+                func.coalesce(func.sum(MaintenanceRecord.total_cost), 0),
+                func.coalesce(func.sum(MaintenanceRecord.labor_cost), 0),
+                func.coalesce(func.sum(MaintenanceRecord.parts_cost), 0)
+            )
+            .where(MaintenanceRecord.is_completed == True, MaintenanceRecord.performed_at.isnot(None))
+            .group_by(MaintenanceRecord.motorcycle_id, period, MaintenanceRecord.service_type, currency)
+        )).all()
+
+        part_period = func.coalesce(func.strftime("%Y-%m", Part.purchase_date), UNDATED_PERIOD)
+        category = func.coalesce(func.nullif(Part.category, ""), "Uncategorized")
+        part_currency = func.coalesce(Part.currency, DEFAULT_CURRENCY)
+        part_rows = (await self.db.execute(
+            select(
+                Part.motorcycle_id, part_period, category, part_currency,
+                func.count(Part.id),
+                func.coalesce(func.sum(Part.total_cost), 0),
+                func.coalesce(func.sum(func.coalesce(Part.unit_price, 0) * func.coalesce(Part.quantity_in_stock, 0)), 0)
+            )
+            .group_by(Part.motorcycle_id, part_period, category, part_currency)
+        )).all()
+
+        rows = [
+            {
+                "motorcycle_id": motorcycle_id, "period": period, "source": MAINTENANCE,
+                "bucket": service_type.value, "currency": currency,
+                "record_count": count, "total_cost": total_cost, "labor_cost": labor_cost,
+                "parts_cost": parts_cost, "stock_value": 0
+            }
+            for motorcycle_id, period, service_type, currency, count, total_cost, labor_cost, parts_cost
+            in maintenance_rows
+        ] + [
+            {
+                "motorcycle_id": motorcycle_id, "period": period, "source": PARTS,
+                "bucket": category, "currency": currency,
+                "record_count": count, "total_cost": total_cost, "labor_cost": 0,
+                "parts_cost": 0, "stock_value": stock_value
+            }
+            for motorcycle_id, period, category, currency, count, total_cost, stock_value in part_rows
+        ]
+        if rows:
+            await self.db.execute(insert(MonthlyCostRollup), rows)
+        await self.db.commit()
+        return len(rows)
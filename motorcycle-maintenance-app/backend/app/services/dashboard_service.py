@@ -1,5 +1,6 @@
 # backend/app/services/dashboard_service.py
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Dict, List
 
@@ -7,40 +8,36 @@ from app.models.motorcycle import Motorcycle
 from app.models.maintenance import MaintenanceRecord
 from app.models.parts import Part
 from app.services.maintenance_service import MaintenanceService
+from app.services.cost_rollup_service import CostRollupService, MAINTENANCE, PARTS
 
 
 class DashboardService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.maintenance_service = MaintenanceService(db)
 
-    def get_dashboard_stats(self) -> Dict:
+    async def get_dashboard_stats(self) -> Dict:
         """Get dashboard statistics"""
-        # Motorcycle stats
-        total_motorcycles = self.db.query(Motorcycle).count()
-        active_motorcycles = self.db.query(Motorcycle).filter(
-            Motorcycle.is_active == True,
-            Motorcycle.is_archived == False
-        ).count()
-        
-        # Total mileage across all active motorcycles
-        active_bikes = self.db.query(Motorcycle).filter(
-            Motorcycle.is_active == True,
-            Motorcycle.is_archived == False
-        ).all()
-        total_mileage = sum(bike.current_mileage or 0 for bike in active_bikes)
+        # Motorcycle counts and total mileage of active bikes in one statement
+        is_active_bike = (Motorcycle.is_active == True) & (Motorcycle.is_archived == False)
+        motorcycle_stats = (await self.db.execute(select(
+            func.count(Motorcycle.id),
+            func.count(case((is_active_bike, Motorcycle.id))),
+            func.coalesce(func.sum(case((is_active_bike, Motorcycle.current_mileage))), 0)
+        ))).one()
+        total_motorcycles, active_motorcycles, total_mileage = motorcycle_stats
         
         # Upcoming maintenance
-        upcoming_maintenance = self.maintenance_service.get_upcoming_maintenance(days_ahead=30)
+        upcoming_maintenance = await self.maintenance_service.get_upcoming_maintenance(days_ahead=30)
         upcoming_services = len(upcoming_maintenance)
         overdue_services = len([item for item in upcoming_maintenance if item['is_overdue']])
         
         # Monthly expenses (last 30 days)
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        monthly_expenses = self._get_monthly_expenses(thirty_days_ago)
+        monthly_expenses = await self._get_monthly_expenses(thirty_days_ago)
         
         # Recent activities (last 10 completed maintenance records)
-        recent_activities = self._get_recent_activities(limit=10)
+        recent_activities = await self._get_recent_activities(limit=10)
         
         return {
             "total_motorcycles": total_motorcycles,
@@ -52,34 +49,24 @@ class DashboardService:
             "recent_activities": recent_activities
         }
 
-    def _get_monthly_expenses(self, since_date: datetime) -> float:
+    async def _get_monthly_expenses(self, since_date: datetime) -> float:
         """Calculate total expenses for maintenance and parts since given date"""
-        # Maintenance costs
-        maintenance_costs = self.db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.performed_at >= since_date,
-            MaintenanceRecord.is_completed == True
-        ).all()
-        
-        maintenance_total = sum(record.total_cost or 0 for record in maintenance_costs)
+        rollup = CostRollupService(self.db)
+        maintenance_totals = await rollup.summarize(MAINTENANCE, start_date=since_date)
+        parts_totals = await rollup.summarize(PARTS, start_date=since_date)
         
-        # Parts costs
-        parts_costs = self.db.query(Part).filter(
-            Part.purchase_date >= since_date.date()
-        ).all()
-        
-        parts_total = sum(part.total_cost or 0 for part in parts_costs)
-        
-        return maintenance_total + parts_total
+        return sum(bucket["total_cost"] for bucket in maintenance_totals.values()) + \
+            sum(bucket["total_cost"] for bucket in parts_totals.values())
 
-    def _get_recent_activities(self, limit: int = 10) -> List[Dict]:
+    async def _get_recent_activities(self, limit: int = 10) -> List[Dict]:
         """Get recent maintenance activities"""
-        recent_maintenance = self.db.query(MaintenanceRecord, Motorcycle).join(
+        recent_maintenance = (await self.db.execute(select(MaintenanceRecord, Motorcycle).join(
             Motorcycle, MaintenanceRecord.motorcycle_id == Motorcycle.id
-        ).filter(
+        ).where(
             MaintenanceRecord.is_completed == True
         ).order_by(
             MaintenanceRecord.performed_at.desc()
-        ).limit(limit).all()
+        ).limit(limit))).all()
         
         activities = []
         for maintenance, motorcycle in recent_maintenance:
@@ -97,36 +84,34 @@ class DashboardService:
         
         return activities
 
-    def get_motorcycle_overview(self, motorcycle_id: int) -> Dict:
+    async def get_motorcycle_overview(self, motorcycle_id: int) -> Dict:
         """Get overview for a specific motorcycle"""
-        motorcycle = self.db.query(Motorcycle).filter(Motorcycle.id == motorcycle_id).first()
+        motorcycle = await self.db.get(Motorcycle, motorcycle_id)
         if not motorcycle:
             return None
         
         # Upcoming maintenance for this motorcycle
-        upcoming_maintenance = self.maintenance_service.get_upcoming_maintenance(
+        upcoming_maintenance = await self.maintenance_service.get_upcoming_maintenance(
             motorcycle_id=motorcycle_id, 
             days_ahead=60
         )
         
         # Recent maintenance history
-        recent_maintenance = self.db.query(MaintenanceRecord).filter(
+        recent_maintenance = (await self.db.scalars(select(MaintenanceRecord).where(
             MaintenanceRecord.motorcycle_id == motorcycle_id,
             MaintenanceRecord.is_completed == True
-        ).order_by(MaintenanceRecord.performed_at.desc()).limit(5).all()
+        ).order_by(MaintenanceRecord.performed_at.desc()).limit(5))).all()
         
         # Parts summary
-        parts_summary = self._get_parts_summary(motorcycle_id)
+        parts_summary = await self._get_parts_summary(motorcycle_id)
         
         # Maintenance costs (last 12 months)
         twelve_months_ago = datetime.utcnow() - timedelta(days=365)
-        annual_maintenance_costs = self.db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.motorcycle_id == motorcycle_id,
-            MaintenanceRecord.performed_at >= twelve_months_ago,
-            MaintenanceRecord.is_completed == True
-        ).all()
-        
-        total_annual_cost = sum(record.total_cost or 0 for record in annual_maintenance_costs)
+        annual_totals = await CostRollupService(self.db).summarize(
+            MAINTENANCE, motorcycle_id, start_date=twelve_months_ago
+        )
+        total_annual_cost = sum(bucket["total_cost"] for bucket in annual_totals.values())
+        maintenance_frequency = sum(bucket["record_count"] for bucket in annual_totals.values())
         
         return {
             "motorcycle": {
@@ -152,12 +137,12 @@ class DashboardService:
             ],
             "parts_summary": parts_summary,
             "annual_maintenance_cost": total_annual_cost,
-            "maintenance_frequency": len(annual_maintenance_costs)
+            "maintenance_frequency": maintenance_frequency
         }
 
-    def _get_parts_summary(self, motorcycle_id: int) -> Dict:
+    async def _get_parts_summary(self, motorcycle_id: int) -> Dict:
         """Get parts summary for a motorcycle"""
-        parts = self.db.query(Part).filter(Part.motorcycle_id == motorcycle_id).all()
+        parts = (await self.db.scalars(select(Part).where(Part.motorcycle_id == motorcycle_id))).all()
         
         total_parts = len(parts)
         total_stock_value = sum((part.unit_price or 0) * part.quantity_in_stock for part in parts)
@@ -170,16 +155,16 @@ class DashboardService:
             "categories": len(set(part.category for part in parts if part.category))
         }
 
-    def get_maintenance_due_soon(self, days_ahead: int = 30) -> List[Dict]:
+    async def get_maintenance_due_soon(self, days_ahead: int = 30) -> List[Dict]:
         """Get maintenance due within specified days"""
-        return self.maintenance_service.get_upcoming_maintenance(days_ahead=days_ahead)
+        return await self.maintenance_service.get_upcoming_maintenance(days_ahead=days_ahead)
 
-    def get_fleet_summary(self) -> Dict:
+    async def get_fleet_summary(self) -> Dict:
         """Get fleet-wide summary statistics"""
-        motorcycles = self.db.query(Motorcycle).filter(
+        motorcycles = (await self.db.scalars(select(Motorcycle).where(
             Motorcycle.is_active == True,
             Motorcycle.is_archived == False
-        ).all()
+        ))).all()
         
         if not motorcycles:
             return {
@@ -0,0 +1,194 @@
+# backend/app/services/due_notifier.py
+# Sends maintenance_due webhooks for services that have come due.
+#
+# A background scan checks the whole fleet's due state in one query on a
+# fixed interval; the mileage threshold index asks for the services a write
+# just pushed past their due mileage. Either way a due point is notified
+# once: the notification table keeps a watermark of what was sent.
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import select, func, case, and_, or_, tuple_
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.metrics import Counter, Gauge
+from app.models.due_state import MaintenanceDueState, MaintenanceDueNotification
+from app.models.motorcycle import Motorcycle
+from app.services.webhook_service import WebhookService
+
+logger = logging.getLogger(__name__)
+
+DueKey = Tuple[int, str, str]
+
+notifications_sent = Counter(
+    "maintenance_due_notifications_total", "maintenance_due events sent", ("trigger",)
+)
+scans_total = Counter("maintenance_due_scans_total", "Background due maintenance scans run")
+scan_duration = Gauge("maintenance_due_scan_duration_seconds", "Duration of the last due maintenance scan")
+scan_items = Gauge("maintenance_due_scan_items", "Services evaluated by the last due maintenance scan")
+
+# Scan and mileage triggered notifications must not both send the same due point
+_notify_lock = asyncio.Lock()
+
+
+class DueNotifier:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def notify(self, trigger: str, keys: Optional[Iterable[DueKey]] = None) -> Tuple[int, int]:
+        """Send maintenance_due for every due service not notified yet.
+
+        Checks the whole fleet, or only the given (motorcycle, service type,
+        service key) entries. Returns the number of services evaluated and
+        the number of events sent.
+        """
+        today = datetime.utcnow().date()
+        cutoff_iso = (today + timedelta(days=settings.MAINTENANCE_DUE_NOTICE_DAYS)).isoformat()
+        due = MaintenanceDueState
+        sent = MaintenanceDueNotification
+
+        is_due = or_(
+            func.date(due.next_service_date) <= cutoff_iso,
+            and_(
+                Motorcycle.current_mileage > 0,
+                due.next_service_mileage > 0,
+                Motorcycle.current_mileage >= due.next_service_mileage - settings.MAINTENANCE_DUE_NOTICE_KM
+            )
+        )
+        # Watermark matches when this exact due point went out already
+        notified = and_(
+            sent.record_id == due.record_id,
+            sent.next_service_date.is_not_distinct_from(due.next_service_date),
+            sent.next_service_mileage.is_not_distinct_from(due.next_service_mileage)
+        )
+
+        query = select(
+            due.motorcycle_id,
+            due.service_type,
+            due.service_key,
+            due.record_id,
+            due.service_name,
+            due.performed_at,
+            due.next_service_date,
+            due.next_service_mileage,
+            Motorcycle.name,
+            Motorcycle.make,
+            Motorcycle.model,
+            Motorcycle.current_mileage,
+            case((and_(is_due, ~notified), True), else_=False).label("pending")
+        ).join(
+            Motorcycle, due.motorcycle_id == Motorcycle.id
+        ).outerjoin(
+            sent, and_(
+                sent.motorcycle_id == due.motorcycle_id,
+                sent.service_type == due.service_type,
+                sent.service_key == due.service_key
+            )
+        ).where(
+            Motorcycle.is_active == True,
+            Motorcycle.is_archived == False
+        )
+        if keys is not None:
+            query = query.where(tuple_(due.motorcycle_id, due.service_type, due.service_key).in_(list(keys)))
+
+        async with _notify_lock:
+            rows = (await self.db.execute(query)).all()
+            pending = [row for row in rows if row.pending]
+
+            webhook_service = WebhookService(self.db)
+            for row in pending:
+                motorcycle_data = {
+                    "id": row.motorcycle_id,
+                    "name": row.name,
+                    "make": row.make,
+                    "model": row.model,
+                    "current_mileage": row.current_mileage
+                }
+                maintenance_data = {
+                    "id": row.record_id,
+                    "service_name": row.service_name,
+                    "service_type": row.service_type,
+                    "performed_at": row.performed_at.isoformat(),
+                    "due_date": row.next_service_date.isoformat() if row.next_service_date else None,
+                    "due_mileage": row.next_service_mileage
+                }
+                await webhook_service.trigger_maintenance_due(motorcycle_data, maintenance_data)
+
+            if pending:
+                now = datetime.utcnow()
+                watermark = {"record_id", "next_service_date", "next_service_mileage", "notified_at"}
+                stmt = insert(sent)
+                await self.db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[column.name for column in sent.__table__.primary_key],
+                        set_={name: stmt.excluded[name] for name in watermark}
+                    ),
+                    [
+                        {
+                            "motorcycle_id": row.motorcycle_id,
+                            "service_type": row.service_type,
+                            "service_key": row.service_key,
+                            "record_id": row.record_id,
+                            "next_service_date": row.next_service_date,
+                            "next_service_mileage": row.next_service_mileage,
+                            "notified_at": now
+                        }
+                        for row in pending
+                    ]
+                )
+                await self.db.commit()
+                notifications_sent.inc(len(pending), trigger=trigger)
+
+        return len(rows), len(pending)
+
+
+class DueScanner:
+    """Periodic fleet-wide due maintenance scan, run from the app lifespan"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def scan(self) -> Tuple[int, int]:
+        started = time.perf_counter()
+        async with SessionLocal() as db:
+            evaluated, sent = await DueNotifier(db).notify("scan")
+        duration = time.perf_counter() - started
+
+        scans_total.inc()
+        scan_duration.set(duration)
+        scan_items.set(evaluated)
+        logger.info(f"Due maintenance scan: {evaluated} services evaluated, {sent} notified in {duration:.3f}s")
+        return evaluated, sent
+
+    async def _run(self):
+        while True:
+            try:
+                await self.scan()
+            except Exception:
+                logger.exception("Due maintenance scan failed")
+            await asyncio.sleep(self.interval)
+
+
+due_scanner = DueScanner(settings.MAINTENANCE_SCAN_INTERVAL)
@@ -0,0 +1,149 @@
+# backend/app/services/due_state_service.py
+from sqlalchemy import select, delete, event
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Optional, Set, Tuple
+
+from app.core.change_tracking import committed_value
+from app.models.due_state import MaintenanceDueState
+from app.models.maintenance import MaintenanceRecord, ServiceType
+from app.services.mileage_index import stage_threshold
+
+
+def service_key(service_type, service_name: Optional[str]) -> str:
+    """Custom services are told apart by name; every other type is one service"""
+    if ServiceType(getattr(service_type, "value", service_type)) == ServiceType.CUSTOM:
+        return (service_name or "").strip().lower()
+    return ""
+
+
+def _due_key(value) -> Optional[Tuple[int, str, str]]:
+    service_type = value("service_type")
+    if value("motorcycle_id") is None or service_type is None:
+        return None
+    return (
+        value("motorcycle_id"),
+        getattr(service_type, "value", service_type),
+        service_key(service_type, value("service_name"))
+    )
+
+
+def _refresh_due_state(connection, key: Tuple[int, str, str]):
+    """Point a (motorcycle, service) row at its latest completed record, returned"""
+    motorcycle_id, service_type, key_name = key
+    query = select(
+        MaintenanceRecord.id,
+        MaintenanceRecord.service_name,
+        MaintenanceRecord.performed_at,
+        MaintenanceRecord.next_service_date,
+        MaintenanceRecord.next_service_mileage
+    ).where(
+        MaintenanceRecord.motorcycle_id == motorcycle_id,
+        MaintenanceRecord.service_type == ServiceType(service_type),
+        MaintenanceRecord.is_completed == True,
+        MaintenanceRecord.performed_at.isnot(None)
+    ).order_by(MaintenanceRecord.performed_at.desc(), MaintenanceRecord.id.desc())
+    if ServiceType(service_type) != ServiceType.CUSTOM:
+        query = query.limit(1)
+
+    rows = connection.execute(query)
+    # Custom names are matched here rather than in SQL, whose lower() only folds ASCII
+    latest = next(
+        (row for row in rows if service_key(service_type, row.service_name) == key_name),
+        None
+    )
+    rows.close()
+
+    table = MaintenanceDueState.__table__
+    if latest is None:
+        connection.execute(delete(table).where(
+            table.c.motorcycle_id == motorcycle_id,
+            table.c.service_type == service_type,
+            table.c.service_key == key_name
+        ))
+        return None
+
+    values = {
+        "record_id": latest.id,
+        "service_name": latest.service_name,
+        "performed_at": latest.performed_at,
+        "next_service_date": latest.next_service_date,
+        "next_service_mileage": latest.next_service_mileage
+    }
+    connection.execute(
+        insert(table)
+        .values(motorcycle_id=motorcycle_id, service_type=service_type, service_key=key_name, **values)
+        .on_conflict_do_update(index_elements=[column.name for column in table.primary_key], set_=values)
+    )
+    return latest
+
+
+@event.listens_for(Session, "after_flush")
+def _update_due_states(session, flush_context):
+    """Recompute the due state of every service touched by the flush.
+
+    Both the old and the new key of an edited record are refreshed, so moving
+    a record to another bike or service type updates both rows.
+    """
+    keys: Set[Tuple[int, str, str]] = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, MaintenanceRecord):
+            continue
+        if obj not in session.new:
+            keys.add(_due_key(lambda key: committed_value(obj, key)))
+        if obj not in session.deleted:
+            keys.add(_due_key(lambda key: getattr(obj, key)))
+    keys.discard(None)
+
+    if keys:
+        connection = session.connection()
+        for key in keys:
+            latest = _refresh_due_state(connection, key)
+            stage_threshold(session, key, latest.next_service_mileage if latest else None)
+
+
+class DueStateService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def rebuild(self) -> int:
+        """Regenerate the due state from the full maintenance history"""
+        await self.db.execute(delete(MaintenanceDueState))
+
+        records = await self.db.stream(
+            select(
+                MaintenanceRecord.id,
+                MaintenanceRecord.motorcycle_id,
+                MaintenanceRecord.service_type,
+                MaintenanceRecord.service_name,
+                MaintenanceRecord.performed_at,
+                MaintenanceRecord.next_service_date,
+                MaintenanceRecord.next_service_mileage
+            ).where(
+                MaintenanceRecord.is_completed == True,
+                MaintenanceRecord.performed_at.isnot(None)
+            ).order_by(MaintenanceRecord.performed_at.desc(), MaintenanceRecord.id.desc())
+        )
+
+        # Newest first, so the first record seen for each service is its latest
+        latest = {}
+        async for row in records:
+            key = (row.motorcycle_id, row.service_type.value, service_key(row.service_type, row.service_name))
+            if key not in latest:
+                latest[key] = {
+                    "motorcycle_id": key[0],
+                    "service_type": key[1],
+                    "service_key": key[2],
+                    "record_id": row.id,
+                    "service_name": row.service_name,
+                    "performed_at": row.performed_at,
+                    "next_service_date": row.next_service_date,
+                    "next_service_mileage": row.next_service_mileage
+                }
+
+        rows = list(latest.values())
+        if rows:
+            await self.db.execute(insert(MaintenanceDueState), rows)
+        await self.db.commit()
+        return len(rows)
@@ -0,0 +1,136 @@
+# backend/app/services/export_service.py
+# Streaming CSV/NDJSON export of ride logs, maintenance records and parts.
+#
+# Rows are read through a server-side cursor (yield_per) and written out a
+# partition at a time, so memory stays flat however large the export is.
+# CSV numbers are written in full, without exponent or thousands grouping, so
+# the file can be read back in; only the decimal separator follows the locale
+# (DECIMAL_SEPARATOR), with ";" between fields when it is a comma. NDJSON
+# keeps plain JSON numbers.
+
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Column, Float, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.logs import RideLog
+from app.models.maintenance import MaintenanceRecord
+from app.models.parts import Part
+
+
+class ExportDataset(str, enum.Enum):
+    LOGS = "logs"
+    MAINTENANCE = "maintenance"
+    PARTS = "parts"
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson"
+}
+
+
+class _Dataset(NamedTuple):
+    model: Any
+    date_column: Column  # What the start_date/end_date filters apply to
+    exclude: frozenset = frozenset()
+
+    @property
+    def columns(self) -> List[Column]:
+        return [column for column in self.model.__table__.columns if column.name not in self.exclude]
+
+
+_DATASETS = {
+    ExportDataset.LOGS: _Dataset(RideLog, RideLog.start_date, frozenset({"content_hash"})),
+    ExportDataset.MAINTENANCE: _Dataset(MaintenanceRecord, MaintenanceRecord.performed_at),
+    ExportDataset.PARTS: _Dataset(Part, Part.purchase_date)
+}
+
+
+def format_decimal(value: float, decimal_separator: str) -> str:
+    """A float in positional notation with the locale's decimal separator, keeping its own precision"""
+    # repr() holds the shortest digits that round-trip; Decimal spells them out without an exponent
+    return format(Decimal(repr(value)), "f").replace(".", decimal_separator)
+
+
+class Exporter:
+    def __init__(self, db: AsyncSession, dataset: ExportDataset, batch_size: int):
+        self.db = db
+        self.dataset = _DATASETS[dataset]
+        self.batch_size = batch_size
+
+    async def rows(
+        self,
+        motorcycle_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[Sequence[Sequence[Any]]]:
+        """The matching rows, a partition of up to batch_size at a time"""
+        dataset = self.dataset
+        query = select(*dataset.columns)
+        if motorcycle_id:
+            query = query.where(dataset.model.motorcycle_id == motorcycle_id)
+        if start_date:
+            query = query.where(dataset.date_column >= start_date)
+        if end_date:
+            query = query.where(dataset.date_column <= end_date)
+        query = query.order_by(dataset.date_column, dataset.model.id)
+
+        result = await self.db.stream(query.execution_options(yield_per=self.batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+    async def csv(self, **filters) -> AsyncIterator[str]:
+        columns = self.dataset.columns
+        decimal_separator = settings.DECIMAL_SEPARATOR
+        delimiter = ";" if decimal_separator == "," else ","
+        floats = [isinstance(column.type, Float) for column in columns]
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter)
+        writer.writerow([column.name for column in columns])
+        async for partition in self.rows(**filters):
+            for row in partition:
+                writer.writerow([
+                    format_decimal(value, decimal_separator)
+                    if is_float and value is not None else _plain(value)
+                    for value, is_float in zip(row, floats)
+                ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+
+    async def ndjson(self, **filters) -> AsyncIterator[str]:
+        names = [column.name for column in self.dataset.columns]
+        async for partition in self.rows(**filters):
+            yield "".join(
+                json.dumps(dict(zip(names, (_plain(value) for value in row)))) + "\n"
+                for row in partition
+            )
+
+
+def _plain(value: Any) -> Any:
+    """Values as text-friendly scalars; None stays None (an empty CSV cell)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def export_filename(dataset: ExportDataset, export_format: ExportFormat, filters: Dict[str, Any]) -> str:
+    suffix = f"-motorcycle-{filters['motorcycle_id']}" if filters.get("motorcycle_id") else ""
+    return f"{dataset.value}{suffix}.{export_format.value}"
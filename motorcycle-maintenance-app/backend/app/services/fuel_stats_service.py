@@ -0,0 +1,285 @@
+# backend/app/services/fuel_stats_service.py
+# Per-motorcycle fuel statistics kept in step with the ride logs.
+#
+# Each flush folds the rides it added, changed or removed into their
+# motorcycle's accumulator row: counts, sums and the sum of squared
+# efficiencies move by the difference, and an added ride takes over the best
+# or worst efficiency when it beats the current one. Only when the ride that
+# holds an extreme changes or goes is the extreme looked up again, through
+# the (motorcycle_id, fuel_efficiency) index. Reading the statistics is a
+# primary-key lookup, and variance comes from the sums.
+
+import math
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Select, and_, case, delete, event, func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.change_tracking import committed_value
+from app.models.fuel_stats import MotorcycleFuelStats
+from app.models.logs import RideLog
+
+AMOUNT_FIELDS = (
+    "ride_count", "fuel_total", "fuel_cost_total", "price_count", "price_sum",
+    "efficiency_count", "efficiency_sum", "efficiency_sum_squares"
+)
+
+# What a ride contributes is worked out from these columns (and its id)
+FUEL_COLUMNS = (RideLog.id, RideLog.motorcycle_id, RideLog.fuel_consumed, RideLog.fuel_cost, RideLog.fuel_efficiency)
+
+
+class FuelRide(NamedTuple):
+    motorcycle_id: int
+    ride_id: int
+    amounts: Tuple[float, ...]
+    efficiency: Optional[float]
+
+
+def _contribution(ride_id: int, value) -> Optional[FuelRide]:
+    """What a ride adds to its motorcycle's statistics, reading attributes through value()"""
+    fuel = value("fuel_consumed")
+    if fuel is None or fuel <= 0:
+        return None
+    cost = value("fuel_cost")
+    efficiency = value("fuel_efficiency") or None
+    amounts = (
+        1, fuel, cost or 0,
+        1 if cost else 0, cost / fuel if cost else 0,
+        1 if efficiency else 0, efficiency or 0, efficiency * efficiency if efficiency else 0
+    )
+    return FuelRide(value("motorcycle_id"), ride_id, amounts, efficiency)
+
+
+def _extreme_ride(motorcycle_id, best: bool) -> Select:
+    """Efficiency and id of the motorcycle's most (or least) efficient ride; ties go to the oldest"""
+    efficiency = RideLog.fuel_efficiency
+    return (
+        select(efficiency, RideLog.id)
+        .where(
+            RideLog.motorcycle_id == motorcycle_id,
+            efficiency.isnot(None),
+            efficiency != 0,
+            RideLog.fuel_consumed > 0
+        )
+        .order_by(efficiency.desc() if best else efficiency.asc(), RideLog.id)
+        .limit(1)
+    )
+
+
+def _beats(table, excluded, kind: str, better) -> Any:
+    """Whether the incoming candidate replaces the stored extreme of the given kind"""
+    stored, incoming = table.c[f"{kind}_efficiency"], excluded[f"{kind}_efficiency"]
+    return and_(incoming.isnot(None), or_(
+        stored.is_(None),
+        better(incoming, stored),
+        and_(incoming == stored, excluded[f"{kind}_ride_id"] < table.c[f"{kind}_ride_id"])
+    ))
+
+
+def fold_rides(connection: Connection, added: Iterable[FuelRide], removed: Iterable[FuelRide] = ()):
+    """Apply ride contributions to the accumulator, on the caller's connection and transaction"""
+    rows: Dict[int, Dict[str, Any]] = {}
+
+    def row(motorcycle_id: int) -> Dict[str, Any]:
+        return rows.setdefault(motorcycle_id, {
+            "motorcycle_id": motorcycle_id,
+            **{field: 0 for field in AMOUNT_FIELDS},
+            "best_efficiency": None, "best_ride_id": None,
+            "worst_efficiency": None, "worst_ride_id": None
+        })
+
+    for ride in added:
+        totals = row(ride.motorcycle_id)
+        for field, amount in zip(AMOUNT_FIELDS, ride.amounts):
+            totals[field] += amount
+        if ride.efficiency:
+            best = totals["best_efficiency"]
+            if best is None or (ride.efficiency, -ride.ride_id) > (best, -totals["best_ride_id"]):
+                totals["best_efficiency"], totals["best_ride_id"] = ride.efficiency, ride.ride_id
+            worst = totals["worst_efficiency"]
+            if worst is None or (ride.efficiency, ride.ride_id) < (worst, totals["worst_ride_id"]):
+                totals["worst_efficiency"], totals["worst_ride_id"] = ride.efficiency, ride.ride_id
+
+    vacated: Dict[int, set] = {}
+    for ride in removed:
+        totals = row(ride.motorcycle_id)
+        for field, amount in zip(AMOUNT_FIELDS, ride.amounts):
+            totals[field] -= amount
+        vacated.setdefault(ride.motorcycle_id, set()).add(ride.ride_id)
+
+    if not rows:
+        return
+
+    table = MotorcycleFuelStats.__table__
+    stmt = insert(table)
+    excluded = stmt.excluded
+    replace_best = _beats(table, excluded, "best", lambda incoming, stored: incoming > stored)
+    replace_worst = _beats(table, excluded, "worst", lambda incoming, stored: incoming < stored)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.motorcycle_id],
+        set_={
+            **{field: table.c[field] + excluded[field] for field in AMOUNT_FIELDS},
+            # Every right-hand side sees the row as it was, so the conditions agree
+            "best_efficiency": case((replace_best, excluded.best_efficiency), else_=table.c.best_efficiency),
+            "best_ride_id": case((replace_best, excluded.best_ride_id), else_=table.c.best_ride_id),
+            "worst_efficiency": case((replace_worst, excluded.worst_efficiency), else_=table.c.worst_efficiency),
+            "worst_ride_id": case((replace_worst, excluded.worst_ride_id), else_=table.c.worst_ride_id)
+        }
+    )
+    connection.execute(stmt, list(rows.values()))
+
+    if vacated:
+        holders = connection.execute(
+            select(table.c.motorcycle_id, table.c.best_ride_id, table.c.worst_ride_id)
+            .where(table.c.motorcycle_id.in_(vacated))
+        ).all()
+        for motorcycle_id, best_ride_id, worst_ride_id in holders:
+            # The ride holding an extreme changed or went: look the extreme up again
+            for kind, holder in (("best", best_ride_id), ("worst", worst_ride_id)):
+                if holder not in vacated[motorcycle_id]:
+                    continue
+                found = connection.execute(_extreme_ride(motorcycle_id, kind == "best")).first()
+                efficiency, ride_id = found or (None, None)
+                connection.execute(
+                    update(table).where(table.c.motorcycle_id == motorcycle_id)
+                    .values({f"{kind}_efficiency": efficiency, f"{kind}_ride_id": ride_id})
+                )
+
+    connection.execute(delete(table).where(table.c.ride_count <= 0, table.c.motorcycle_id.in_(rows)))
+
+
+def stage_fuel_rides(session: Session, rides: Iterable[Any]):
+    """Fold rides written with Core statements, which bypass the flush listener.
+
+    Each ride needs the FUEL_COLUMNS attributes, as a RETURNING row has them.
+    """
+    added = [_contribution(ride.id, lambda key: getattr(ride, key)) for ride in rides]
+    fold_rides(session.connection(), [ride for ride in added if ride is not None])
+
+
+@event.listens_for(Session, "after_flush")
+def _fold_flushed_rides(session, flush_context):
+    """Fold flushed ride log changes into the fuel statistics.
+
+    Runs on the flushing connection, so the statistics commit or roll back
+    together with the rides they summarize.
+    """
+    added: List[FuelRide] = []
+    removed: List[FuelRide] = []
+    for obj in session.new:
+        if isinstance(obj, RideLog):
+            added.append(_contribution(obj.id, lambda key: getattr(obj, key)))
+
+    for obj in session.dirty:
+        if isinstance(obj, RideLog):
+            before = _contribution(obj.id, lambda key: committed_value(obj, key))
+            after = _contribution(obj.id, lambda key: getattr(obj, key))
+            if before != after:
+                removed.append(before)
+                added.append(after)
+
+    for obj in session.deleted:
+        if isinstance(obj, RideLog):
+            removed.append(_contribution(obj.id, lambda key: committed_value(obj, key)))
+
+    added = [ride for ride in added if ride is not None]
+    removed = [ride for ride in removed if ride is not None]
+    if added or removed:
+        fold_rides(session.connection(), added, removed)
+
+
+class FuelStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def statistics(self, motorcycle_id: Optional[int] = None) -> Dict[str, Any]:
+        """Fuel statistics of one motorcycle, or of the whole fleet, from the accumulator"""
+        stats = MotorcycleFuelStats
+        owner = [stats.motorcycle_id == motorcycle_id] if motorcycle_id else []
+        totals = (await self.db.execute(
+            select(*[func.coalesce(func.sum(getattr(stats, field)), 0) for field in AMOUNT_FIELDS]).where(*owner)
+        )).one()
+        totals = dict(zip(AMOUNT_FIELDS, totals))
+
+        if not totals["ride_count"]:
+            return {
+                "total_fuel_consumed": 0,
+                "total_fuel_cost": 0,
+                "average_price_per_liter": 0,
+                "best_efficiency": None,
+                "worst_efficiency": None,
+                "average_efficiency": 0,
+                "efficiency_variance": 0,
+                "efficiency_std_dev": 0
+            }
+
+        average_efficiency = variance = 0
+        if totals["efficiency_count"]:
+            average_efficiency = totals["efficiency_sum"] / totals["efficiency_count"]
+            # Clamped: the sums are kept by adding and subtracting, so rounding can dip below zero
+            variance = max(totals["efficiency_sum_squares"] / totals["efficiency_count"] - average_efficiency ** 2, 0)
+
+        return {
+            "total_fuel_consumed": totals["fuel_total"],
+            "total_fuel_cost": totals["fuel_cost_total"],
+            "average_price_per_liter": totals["price_sum"] / totals["price_count"] if totals["price_count"] else 0,
+            "best_efficiency": await self._extreme(stats.best_efficiency, stats.best_ride_id, True, owner),
+            "worst_efficiency": await self._extreme(stats.worst_efficiency, stats.worst_ride_id, False, owner),
+            "average_efficiency": average_efficiency,
+            "efficiency_variance": variance,
+            "efficiency_std_dev": math.sqrt(variance)
+        }
+
+    async def _extreme(self, efficiency, ride_id, best: bool, owner) -> Optional[Dict[str, Any]]:
+        holder = (await self.db.execute(
+            select(efficiency, ride_id)
+            .where(efficiency.isnot(None), *owner)
+            .order_by(efficiency.desc() if best else efficiency.asc(), ride_id)
+            .limit(1)
+        )).first()
+        if holder is None:
+            return None
+        ride = (await self.db.execute(
+            select(RideLog.start_date, RideLog.trip_type).where(RideLog.id == holder[1])
+        )).one()
+        return {"value": holder[0], "date": ride.start_date.isoformat(), "trip_type": ride.trip_type}
+
+    async def rebuild(self) -> int:
+        """Regenerate the fuel statistics from the ride logs"""
+        await self.db.execute(delete(MotorcycleFuelStats))
+
+        efficiency = func.nullif(RideLog.fuel_efficiency, 0)
+        has_cost = RideLog.fuel_cost != 0
+        rows = (await self.db.execute(
+            select(
+                RideLog.motorcycle_id,
+                func.count(RideLog.id),
+                func.sum(RideLog.fuel_consumed),
+                func.coalesce(func.sum(RideLog.fuel_cost), 0),
+                func.count(case((has_cost, 1))),
+                func.coalesce(func.sum(case((has_cost, RideLog.fuel_cost / RideLog.fuel_consumed))), 0),
+                func.count(efficiency),
+                func.coalesce(func.sum(efficiency), 0),
+                func.coalesce(func.sum(efficiency * efficiency), 0)
+            )
+            .where(RideLog.fuel_consumed > 0)
+            .group_by(RideLog.motorcycle_id)
+        )).all()
+        if rows:
+            await self.db.execute(
+                insert(MotorcycleFuelStats),
+                [dict(zip(("motorcycle_id", *AMOUNT_FIELDS), row)) for row in rows]
+            )
+
+            table = MotorcycleFuelStats.__table__
+            for kind in ("best", "worst"):
+                extreme = _extreme_ride(table.c.motorcycle_id, kind == "best")
+                await self.db.execute(update(table).values({
+                    f"{kind}_efficiency": extreme.with_only_columns(RideLog.fuel_efficiency).scalar_subquery(),
+                    f"{kind}_ride_id": extreme.with_only_columns(RideLog.id).scalar_subquery()
+                }))
+        await self.db.commit()
+        return len(rows)
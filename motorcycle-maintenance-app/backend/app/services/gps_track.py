@@ -0,0 +1,194 @@
+# backend/app/services/gps_track.py
+# Recorded GPS tracks of rides: compact storage and simplified variants.
+#
+# Coordinates are stored as fixed-point integers (1e-5 degrees, about a
+# meter): the first point in full, every following one as the difference to
+# the one before, packed at the narrowest integer width that holds all the
+# differences. A 1 Hz recording moves less than 127 units a second, so it
+# costs one byte per coordinate.
+#
+# Next to the recording, Douglas-Peucker simplification at each of the
+# GPS_TRACK_TOLERANCES (meters) gives coarser levels of detail, each derived
+# from the one before. A client asks for the level that matches its map
+# resolution and gets no more points than it can draw.
+
+import asyncio
+import struct
+from typing import BinaryIO, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.logs import RideTrack
+from app.services.ride_log_import import EARTH_RADIUS_KM, gpx_tracks
+
+SCALE = 100_000  # Fixed-point units per degree
+
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BBI")  # Format version, delta width in bytes, point count
+_ORIGIN = struct.Struct("<ii")  # First point, in fixed-point units
+_WIDTHS = {1: np.dtype("<i1"), 2: np.dtype("<i2"), 4: np.dtype("<i4")}
+
+
+class TrackLevel(NamedTuple):
+    level: int
+    tolerance: float
+    points: np.ndarray  # (n, 2) latitude/longitude
+
+
+def encode_track(points: np.ndarray) -> bytes:
+    """Pack an (n, 2) latitude/longitude array into a track blob"""
+    fixed = np.round(np.asarray(points, dtype=float) * SCALE).astype(np.int64)
+    if not len(fixed):
+        return _HEADER.pack(_FORMAT_VERSION, 1, 0)
+    deltas = np.diff(fixed, axis=0)
+    low, high = (int(deltas.min()), int(deltas.max())) if deltas.size else (0, 0)
+    width = next(
+        width for width, dtype in _WIDTHS.items()
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max
+    )
+    return b"".join((
+        _HEADER.pack(_FORMAT_VERSION, width, len(fixed)),
+        _ORIGIN.pack(*fixed[0].tolist()),
+        deltas.astype(_WIDTHS[width]).tobytes()
+    ))
+
+
+def decode_track(blob: bytes) -> np.ndarray:
+    """The (n, 2) latitude/longitude array of a track blob"""
+    version, width, count = _HEADER.unpack_from(blob)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unknown track format {version}")
+    if not count:
+        return np.empty((0, 2))
+    fixed = np.empty((count, 2), dtype=np.int64)
+    fixed[0] = _ORIGIN.unpack_from(blob, _HEADER.size)
+    deltas = np.frombuffer(blob, dtype=_WIDTHS[width], offset=_HEADER.size + _ORIGIN.size)
+    np.cumsum(deltas.reshape(-1, 2), axis=0, out=fixed[1:])
+    fixed[1:] += fixed[0]
+    return fixed / SCALE
+
+
+def _planar(points: np.ndarray) -> np.ndarray:
+    """Points in meters on a plane around the track, close enough at ride scale"""
+    latitude, longitude = np.radians(points[:, 0]), np.radians(points[:, 1])
+    radius = EARTH_RADIUS_KM * 1000
+    return np.column_stack((radius * longitude * np.cos(latitude.mean()), radius * latitude))
+
+
+def _segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Distance of each point to the segment between start and end"""
+    direction = end - start
+    length = direction @ direction
+    if length == 0:
+        # Round trips end where they started
+        return np.hypot(*(points - start).T)
+    along = np.clip((points - start) @ direction / length, 0, 1)
+    return np.hypot(*(points - (start + along[:, None] * direction)).T)
+
+
+def simplify(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices of the points Douglas-Peucker keeps at a tolerance in meters"""
+    count = len(points)
+    if count < 3:
+        return np.arange(count)
+    plane = _planar(points)
+    keep = np.zeros(count, dtype=bool)
+    keep[[0, -1]] = True
+    spans = [(0, count - 1)]
+    while spans:
+        first, last = spans.pop()
+        if last - first < 2:
+            continue
+        distances = _segment_distances(plane[first + 1:last], plane[first], plane[last])
+        furthest = int(np.argmax(distances))
+        if distances[furthest] > tolerance:
+            split = first + 1 + furthest
+            keep[split] = True
+            spans.append((first, split))
+            spans.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def track_levels(points: np.ndarray, tolerances: Sequence[float]) -> List[TrackLevel]:
+    """The recording and its simplified variants, dropping tolerances that remove no point"""
+    levels = [TrackLevel(0, 0.0, points)]
+    for tolerance in sorted(tolerances):
+        previous = levels[-1].points
+        simplified = previous[simplify(previous, tolerance)]
+        if len(simplified) < len(previous):
+            levels.append(TrackLevel(len(levels), tolerance, simplified))
+    return levels
+
+
+def read_track(file: BinaryIO, max_points: int) -> np.ndarray:
+    """Every track point of a GPX file, its tracks joined in order"""
+    tracks = []
+    count = 0
+    for track in gpx_tracks(file):
+        count += len(track.points)
+        if count > max_points:
+            raise ValueError(f"More than {max_points} track points")
+        tracks.append(track.points)
+    return np.concatenate(tracks) if tracks else np.empty((0, 2))
+
+
+class TrackService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, ride_log_id: int, points: np.ndarray, tolerances: Sequence[float]) -> List[RideTrack]:
+        """Store a ride's track and its simplified levels, replacing any earlier track"""
+        # Simplification is CPU work, kept off the event loop
+        levels = await asyncio.to_thread(track_levels, points, tolerances)
+        tracks = [
+            RideTrack(
+                ride_log_id=ride_log_id,
+                level=level.level,
+                tolerance=level.tolerance,
+                point_count=len(level.points),
+                points=encode_track(level.points)
+            )
+            for level in levels
+        ]
+        await self.db.execute(delete(RideTrack).where(RideTrack.ride_log_id == ride_log_id))
+        self.db.add_all(tracks)
+        await self.db.commit()
+        return tracks
+
+    async def levels(self, ride_log_id: int):
+        """Level, tolerance and point count of each stored level, most detailed first"""
+        return (await self.db.execute(
+            select(RideTrack.level, RideTrack.tolerance, RideTrack.point_count)
+            .where(RideTrack.ride_log_id == ride_log_id)
+            .order_by(RideTrack.level)
+        )).all()
+
+    async def load(
+        self,
+        ride_log_id: int,
+        resolution: Optional[float] = None,
+        max_points: Optional[int] = None
+    ) -> Optional[TrackLevel]:
+        """The coarsest level still finer than resolution (meters per pixel), within max_points"""
+        levels = await self.levels(ride_log_id)
+        if not levels:
+            return None
+        chosen = levels[0]
+        for level in levels[1:]:
+            fine_enough = resolution is not None and level.tolerance <= resolution
+            too_many = max_points is not None and chosen.point_count > max_points
+            if not (fine_enough or too_many):
+                break
+            chosen = level
+
+        blob = await self.db.scalar(
+            select(RideTrack.points).where(RideTrack.ride_log_id == ride_log_id, RideTrack.level == chosen.level)
+        )
+        return TrackLevel(chosen.level, chosen.tolerance, decode_track(blob))
+
+    async def delete(self, ride_log_id: int) -> bool:
+        result = await self.db.execute(delete(RideTrack).where(RideTrack.ride_log_id == ride_log_id))
+        await self.db.commit()
+        return result.rowcount > 0
@@ -1,19 +1,22 @@
 # backend/app/services/maintenance_service.py
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case, cast, and_, or_, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 import json
 
+from app.models.due_state import MaintenanceDueState
 from app.models.maintenance import MaintenanceRecord, ServiceType
 from app.models.motorcycle import Motorcycle
 from app.schemas.maintenance import MaintenanceCreate, MaintenanceUpdate
+from app.services.cost_rollup_service import CostRollupService, MAINTENANCE
 
 
 class MaintenanceService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_maintenance_records(
+    async def get_maintenance_records(
         self, 
         skip: int = 0, 
         limit: int = 100, 
@@ -21,23 +24,26 @@ class MaintenanceService:
         service_type: Optional[ServiceType] = None,
         is_completed: Optional[bool] = None
     ) -> List[MaintenanceRecord]:
-        query = self.db.query(MaintenanceRecord)
+        query = select(MaintenanceRecord)
         
         if motorcycle_id:
-            query = query.filter(MaintenanceRecord.motorcycle_id == motorcycle_id)
+            query = query.where(MaintenanceRecord.motorcycle_id == motorcycle_id)
         if service_type:
-            query = query.filter(MaintenanceRecord.service_type == service_type)
+            query = query.where(MaintenanceRecord.service_type == service_type)
         if is_completed is not None:
-            query = query.filter(MaintenanceRecord.is_completed == is_completed)
+            query = query.where(MaintenanceRecord.is_completed == is_completed)
         
-        return query.order_by(MaintenanceRecord.performed_at.desc()).offset(skip).limit(limit).all()
+        result = await self.db.scalars(
+            query.order_by(MaintenanceRecord.performed_at.desc()).offset(skip).limit(limit)
+        )
+        return result.all()
 
-    def get_maintenance_record(self, record_id: int) -> Optional[MaintenanceRecord]:
-        return self.db.query(MaintenanceRecord).filter(MaintenanceRecord.id == record_id).first()
+    async def get_maintenance_record(self, record_id: int) -> Optional[MaintenanceRecord]:
+        return await self.db.get(MaintenanceRecord, record_id)
 
-    def create_maintenance_record(self, record_data: MaintenanceCreate) -> MaintenanceRecord:
+    async def create_maintenance_record(self, record_data: MaintenanceCreate) -> MaintenanceRecord:
         # Verify motorcycle exists
-        motorcycle = self.db.query(Motorcycle).filter(Motorcycle.id == record_data.motorcycle_id).first()
+        motorcycle = await self.db.get(Motorcycle, record_data.motorcycle_id)
         if not motorcycle:
             raise ValueError(f"Motorcycle with id {record_data.motorcycle_id} not found")
         
@@ -62,6 +68,7 @@ class MaintenanceService:
             photos_json = json.dumps(record_data.photos)
         
         data_dict = record_data.dict()
+        data_dict.pop('installation_notes', None)  # Not stored on maintenance records
         data_dict['total_cost'] = total_cost
         data_dict['next_service_date'] = next_service_date
         data_dict['next_service_mileage'] = next_service_mileage
@@ -73,20 +80,21 @@ class MaintenanceService:
         
         db_record = MaintenanceRecord(**data_dict)
         self.db.add(db_record)
-        self.db.commit()
-        self.db.refresh(db_record)
+        await self.db.flush()
         
-        # Trigger webhook if configured
-        self._trigger_maintenance_webhook(db_record, motorcycle, "maintenance_completed")
+        # Queue webhooks in the same transaction as the record
+        await self._trigger_maintenance_webhook(db_record, motorcycle, "maintenance_completed")
         
+        await self.db.commit()
+        await self.db.refresh(db_record)
         return db_record
 
-    def update_maintenance_record(
+    async def update_maintenance_record(
         self, 
         record_id: int, 
         record_update: MaintenanceUpdate
     ) -> Optional[MaintenanceRecord]:
-        db_record = self.get_maintenance_record(record_id)
+        db_record = await self.get_maintenance_record(record_id)
         if not db_record:
             return None
         
@@ -118,109 +126,124 @@ class MaintenanceService:
         for field, value in update_data.items():
             setattr(db_record, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_record)
+        await self.db.commit()
+        await self.db.refresh(db_record)
         return db_record
 
-    def delete_maintenance_record(self, record_id: int) -> bool:
-        db_record = self.get_maintenance_record(record_id)
+    async def delete_maintenance_record(self, record_id: int) -> bool:
+        db_record = await self.get_maintenance_record(record_id)
         if not db_record:
             return False
         
-        self.db.delete(db_record)
-        self.db.commit()
+        await self.db.delete(db_record)
+        await self.db.commit()
         return True
 
-    def get_upcoming_maintenance(
+    async def get_upcoming_maintenance(
         self, 
         motorcycle_id: Optional[int] = None,
-        days_ahead: int = 60
+        days_ahead: int = 60,
+        mileage_window: float = 2000
     ) -> List[dict]:
-        """Get upcoming maintenance based on date and mileage"""
-        query = self.db.query(MaintenanceRecord, Motorcycle).join(
-            Motorcycle, MaintenanceRecord.motorcycle_id == Motorcycle.id
+        """Get upcoming maintenance based on date and mileage.
+        
+        Includes items that are overdue, due by date within days_ahead, or due
+        by mileage within mileage_window km of the bike's current mileage.
+        Only the latest completed record of each service counts (see
+        MaintenanceDueState); filtering, flags and ordering happen in one
+        SQL statement.
+        """
+        today = datetime.utcnow().date()
+        today_iso = today.isoformat()
+        cutoff_iso = (today + timedelta(days=days_ahead)).isoformat()
+        due = MaintenanceDueState
+        due_day = func.date(due.next_service_date)
+        
+        days_remaining = cast(func.julianday(due_day) - func.julianday(today_iso), Integer)
+        mileage_remaining = due.next_service_mileage - Motorcycle.current_mileage
+        overdue_by_date = due_day < today_iso
+        overdue_by_mileage = and_(
+            Motorcycle.current_mileage > 0,
+            due.next_service_mileage > 0,
+            Motorcycle.current_mileage >= due.next_service_mileage
+        )
+        in_date_window = and_(due_day >= today_iso, due_day <= cutoff_iso)
+        near_by_mileage = and_(
+            Motorcycle.current_mileage > 0,
+            due.next_service_mileage > 0,
+            Motorcycle.current_mileage >= due.next_service_mileage - 1000
+        )
+        priority = case(
+            (or_(overdue_by_date, overdue_by_mileage), 0),
+            (and_(in_date_window, days_remaining <= 7), 0),
+            (and_(in_date_window, days_remaining <= 30), 1),
+            (near_by_mileage, 1),
+            else_=2
         )
         
-        if motorcycle_id:
-            query = query.filter(MaintenanceRecord.motorcycle_id == motorcycle_id)
-        
-        # Filter for records that have next service dates or mileage
-        query = query.filter(
-            (MaintenanceRecord.next_service_date.isnot(None)) |
-            (MaintenanceRecord.next_service_mileage.isnot(None))
+        query = select(
+            due.record_id,
+            due.motorcycle_id,
+            Motorcycle.name,
+            due.service_name,
+            due.service_type,
+            due.next_service_date,
+            due.next_service_mileage,
+            Motorcycle.current_mileage,
+            days_remaining.label("days_remaining"),
+            mileage_remaining.label("mileage_remaining"),
+            case((overdue_by_date, True), else_=False).label("overdue_by_date"),
+            case((overdue_by_mileage, True), else_=False).label("overdue_by_mileage"),
+            priority.label("priority")
+        ).join(
+            Motorcycle, due.motorcycle_id == Motorcycle.id
+        ).where(or_(
+            due_day <= cutoff_iso,
+            and_(
+                due.next_service_mileage > 0,
+                due.next_service_mileage <= Motorcycle.current_mileage + mileage_window
+            )
+        )).order_by(
+            priority,
+            due.next_service_date.is_(None),
+            due.next_service_date
         )
         
-        results = []
-        cutoff_date = datetime.utcnow() + timedelta(days=days_ahead)
-        
-        for maintenance, motorcycle in query.all():
-            upcoming_item = {
-                'id': maintenance.id,
-                'motorcycle_id': motorcycle.id,
-                'motorcycle_name': motorcycle.name,
-                'service_name': maintenance.service_name,
-                'service_type': maintenance.service_type.value,
-                'due_date': maintenance.next_service_date.isoformat() if maintenance.next_service_date else None,
-                'due_mileage': maintenance.next_service_mileage,
-                'current_mileage': motorcycle.current_mileage,
-                'is_overdue': False,
-                'days_overdue': None,
-                'mileage_overdue': None,
-                'priority': 'low'
+        if motorcycle_id:
+            query = query.where(due.motorcycle_id == motorcycle_id)
+        
+        priority_names = ('high', 'medium', 'low')
+        return [
+            {
+                'id': row.record_id,
+                'motorcycle_id': row.motorcycle_id,
+                'motorcycle_name': row.name,
+                'service_name': row.service_name,
+                'service_type': row.service_type,
+                'due_date': row.next_service_date.isoformat() if row.next_service_date else None,
+                'due_mileage': row.next_service_mileage,
+                'current_mileage': row.current_mileage,
+                'days_remaining': row.days_remaining,
+                'mileage_remaining': row.mileage_remaining,
+                'is_overdue': bool(row.overdue_by_date or row.overdue_by_mileage),
+                'days_overdue': -row.days_remaining if row.overdue_by_date else None,
+                'mileage_overdue': -row.mileage_remaining if row.overdue_by_mileage else None,
+                'priority': priority_names[row.priority]
             }
-            
-            # Check if overdue by date
-            if maintenance.next_service_date:
-                if maintenance.next_service_date < datetime.utcnow().date():
-                    upcoming_item['is_overdue'] = True
-                    upcoming_item['days_overdue'] = (
-                        datetime.utcnow().date() - maintenance.next_service_date
-                    ).days
-                    upcoming_item['priority'] = 'high'
-                elif maintenance.next_service_date <= cutoff_date.date():
-                    days_until = (maintenance.next_service_date - datetime.utcnow().date()).days
-                    if days_until <= 7:
-                        upcoming_item['priority'] = 'high'
-                    elif days_until <= 30:
-                        upcoming_item['priority'] = 'medium'
-            
-            # Check if overdue by mileage
-            if maintenance.next_service_mileage and motorcycle.current_mileage:
-                if motorcycle.current_mileage >= maintenance.next_service_mileage:
-                    upcoming_item['is_overdue'] = True
-                    upcoming_item['mileage_overdue'] = (
-                        motorcycle.current_mileage - maintenance.next_service_mileage
-                    )
-                    upcoming_item['priority'] = 'high'
-                elif motorcycle.current_mileage >= (maintenance.next_service_mileage - 1000):
-                    if upcoming_item['priority'] != 'high':
-                        upcoming_item['priority'] = 'medium'
-            
-            # Only include if due within timeframe or overdue
-            if (upcoming_item['is_overdue'] or 
-                (maintenance.next_service_date and maintenance.next_service_date <= cutoff_date.date()) or
-                (maintenance.next_service_mileage and motorcycle.current_mileage >= (maintenance.next_service_mileage - 2000))):
-                results.append(upcoming_item)
-        
-        # Sort by priority and date
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        results.sort(key=lambda x: (
-            priority_order[x['priority']], 
-            x['due_date'] or '9999-12-31'
-        ))
-        
-        return results
+            for row in (await self.db.execute(query)).all()
+        ]
 
-    def get_overdue_maintenance(self, motorcycle_id: Optional[int] = None) -> List[dict]:
+    async def get_overdue_maintenance(self, motorcycle_id: Optional[int] = None) -> List[dict]:
         """Get only overdue maintenance"""
-        upcoming = self.get_upcoming_maintenance(motorcycle_id, days_ahead=0)
+        # Date window ends yesterday and the mileage window at the current mileage
+        upcoming = await self.get_upcoming_maintenance(motorcycle_id, days_ahead=-1, mileage_window=0)
         return [item for item in upcoming if item['is_overdue']]
 
-    def bulk_complete_maintenance(self, maintenance_ids: List[int]) -> List[MaintenanceRecord]:
+    async def bulk_complete_maintenance(self, maintenance_ids: List[int]) -> List[MaintenanceRecord]:
         """Mark multiple maintenance records as completed"""
-        records = self.db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.id.in_(maintenance_ids)
-        ).all()
+        records = (await self.db.scalars(
+            select(MaintenanceRecord).where(MaintenanceRecord.id.in_(maintenance_ids))
+        )).all()
         
         completed_records = []
         for record in records:
@@ -229,9 +252,7 @@ class MaintenanceService:
                 record.performed_at = datetime.utcnow()
             
             # Get associated motorcycle
-            motorcycle = self.db.query(Motorcycle).filter(
-                Motorcycle.id == record.motorcycle_id
-            ).first()
+            motorcycle = await self.db.get(Motorcycle, record.motorcycle_id)
             
             if motorcycle:
                 # Update mileage if not set
@@ -249,25 +270,22 @@ class MaintenanceService:
             
             completed_records.append(record)
         
-        self.db.commit()
-        
-        # Trigger webhooks
+        # Queue webhooks in the same transaction as the completions
         for record in completed_records:
-            motorcycle = self.db.query(Motorcycle).filter(
-                Motorcycle.id == record.motorcycle_id
-            ).first()
+            motorcycle = await self.db.get(Motorcycle, record.motorcycle_id)
             if motorcycle:
-                self._trigger_maintenance_webhook(record, motorcycle, "maintenance_completed")
+                await self._trigger_maintenance_webhook(record, motorcycle, "maintenance_completed")
         
+        await self.db.commit()
         return completed_records
 
-    def get_maintenance_history(
+    async def get_maintenance_history(
         self, 
         motorcycle_id: int, 
         service_type: Optional[str] = None
     ) -> List[MaintenanceRecord]:
         """Get maintenance history for a specific motorcycle"""
-        query = self.db.query(MaintenanceRecord).filter(
+        query = select(MaintenanceRecord).where(
             MaintenanceRecord.motorcycle_id == motorcycle_id,
             MaintenanceRecord.is_completed == True
         )
@@ -275,88 +293,66 @@ class MaintenanceService:
         if service_type:
             try:
                 service_type_enum = ServiceType(service_type)
-                query = query.filter(MaintenanceRecord.service_type == service_type_enum)
+                query = query.where(MaintenanceRecord.service_type == service_type_enum)
             except ValueError:
                 pass
         
-        return query.order_by(MaintenanceRecord.performed_at.desc()).all()
+        return (await self.db.scalars(query.order_by(MaintenanceRecord.performed_at.desc()))).all()
 
-    def get_maintenance_costs(
+    async def get_maintenance_costs(
         self, 
         motorcycle_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> dict:
-        """Get maintenance cost summary"""
-        query = self.db.query(MaintenanceRecord).filter(
-            MaintenanceRecord.is_completed == True
-        )
-        
-        if motorcycle_id:
-            query = query.filter(MaintenanceRecord.motorcycle_id == motorcycle_id)
-        
-        if start_date:
-            query = query.filter(MaintenanceRecord.performed_at >= start_date)
-        
-        if end_date:
-            query = query.filter(MaintenanceRecord.performed_at <= end_date)
-        
-        records = query.all()
-        
-        total_cost = sum(record.total_cost or 0 for record in records)
-        labor_cost = sum(record.labor_cost or 0 for record in records)
-        parts_cost = sum(record.parts_cost or 0 for record in records)
-        
-        # Group by service type
-        costs_by_type = {}
-        for record in records:
-            service_type = record.service_type.value
-            if service_type not in costs_by_type:
-                costs_by_type[service_type] = {
-                    'count': 0,
-                    'total_cost': 0,
-                    'labor_cost': 0,
-                    'parts_cost': 0
-                }
-            costs_by_type[service_type]['count'] += 1
-            costs_by_type[service_type]['total_cost'] += record.total_cost or 0
-            costs_by_type[service_type]['labor_cost'] += record.labor_cost or 0
-            costs_by_type[service_type]['parts_cost'] += record.parts_cost or 0
+        """Get maintenance cost summary from the monthly cost rollup"""
+        totals = await CostRollupService(self.db).summarize(MAINTENANCE, motorcycle_id, start_date, end_date)
+        
+        total_cost = sum(bucket['total_cost'] for bucket in totals.values())
+        record_count = sum(bucket['record_count'] for bucket in totals.values())
+        
+        costs_by_type = {
+            service_type: {
+                'count': bucket['record_count'],
+                'total_cost': bucket['total_cost'],
+                'labor_cost': bucket['labor_cost'],
+                'parts_cost': bucket['parts_cost']
+            }
+            for service_type, bucket in totals.items()
+        }
         
         return {
             'total_cost': total_cost,
-            'labor_cost': labor_cost,
-            'parts_cost': parts_cost,
-            'record_count': len(records),
-            'average_cost': total_cost / len(records) if records else 0,
+            'labor_cost': sum(bucket['labor_cost'] for bucket in totals.values()),
+            'parts_cost': sum(bucket['parts_cost'] for bucket in totals.values()),
+            'record_count': record_count,
+            'average_cost': total_cost / record_count if record_count else 0,
             'costs_by_type': costs_by_type
         }
 
-    def _trigger_maintenance_webhook(self, maintenance: MaintenanceRecord, motorcycle: Motorcycle, event_type: str):
-        """Trigger webhook for maintenance events"""
-        try:
-            from app.services.webhook_service import WebhookService
-            webhook_service = WebhookService(self.db)
-            
-            maintenance_data = {
-                "id": maintenance.id,
-                "service_name": maintenance.service_name,
-                "service_type": maintenance.service_type.value,
-                "performed_at": maintenance.performed_at.isoformat(),
-                "mileage": maintenance.mileage_at_service,
-                "cost": maintenance.total_cost
-            }
-            
-            motorcycle_data = {
-                "id": motorcycle.id,
-                "name": motorcycle.name,
-                "make": motorcycle.make,
-                "model": motorcycle.model,
-                "current_mileage": motorcycle.current_mileage
-            }
-            
-            # This would be async in production
-            # await webhook_service.trigger_service_completed(motorcycle_data, maintenance_data)
-        except ImportError:
-            # Webhook service not available
-            pass
\ No newline at end of file
+    async def _trigger_maintenance_webhook(self, maintenance: MaintenanceRecord, motorcycle: Motorcycle, event_type: str):
+        """Queue webhooks for maintenance events; delivered once the caller commits"""
+        from app.services.webhook_service import WebhookService
+        webhook_service = WebhookService(self.db)
+        
+        maintenance_data = {
+            "id": maintenance.id,
+            "service_name": maintenance.service_name,
+            "service_type": maintenance.service_type.value,
+            "performed_at": maintenance.performed_at.isoformat(),
+            "mileage": maintenance.mileage_at_service,
+            "cost": maintenance.total_cost
+        }
+        
+        motorcycle_data = {
+            "id": motorcycle.id,
+            "name": motorcycle.name,
+            "make": motorcycle.make,
+            "model": motorcycle.model,
+            "current_mileage": motorcycle.current_mileage
+        }
+        
+        await webhook_service.send_webhook(event_type, {
+            "motorcycle": motorcycle_data,
+            "maintenance": maintenance_data
+        })
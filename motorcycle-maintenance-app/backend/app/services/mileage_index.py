@@ -0,0 +1,182 @@
+# backend/app/services/mileage_index.py
+# Process-wide index of the pending mileage thresholds of every motorcycle.
+#
+# Each bike keeps the next_service_mileage of its services in a sorted list,
+# so a mileage write finds the thresholds it crossed with two bisects instead
+# of a scan over the due state. The index is loaded at startup and kept in
+# step with committed writes; crossings are handed to the due notifier.
+
+import asyncio
+import bisect
+import logging
+import threading
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.change_tracking import committed_value
+from app.core.database import SessionLocal
+from app.core.metrics import Counter, Gauge
+from app.models.due_state import MaintenanceDueState
+from app.models.motorcycle import Motorcycle
+from app.services.due_notifier import DueNotifier
+
+logger = logging.getLogger(__name__)
+
+# (motorcycle_id, service_type, service_key), as in the due state table
+DueKey = Tuple[int, str, str]
+
+_PENDING_KEY = "pending_mileage_index"
+_threshold_mileage = itemgetter(0)
+
+maintenance_due_events = Counter("maintenance_due_events_total", "Mileage thresholds crossed by a write")
+
+
+class MileageThresholdIndex:
+    def __init__(self):
+        # motorcycle_id -> sorted [(next_service_mileage, service_type, service_key)]
+        self._thresholds: Dict[int, List[Tuple[float, str, str]]] = {}
+        self._by_key: Dict[DueKey, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    async def load(self, db: AsyncSession) -> int:
+        """Replace the index with the thresholds in the due state table"""
+        rows = (await db.execute(
+            select(
+                MaintenanceDueState.motorcycle_id,
+                MaintenanceDueState.service_type,
+                MaintenanceDueState.service_key,
+                MaintenanceDueState.next_service_mileage
+            ).where(MaintenanceDueState.next_service_mileage > 0)
+        )).all()
+
+        thresholds: Dict[int, List[Tuple[float, str, str]]] = {}
+        by_key: Dict[DueKey, float] = {}
+        for motorcycle_id, service_type, service_key, mileage in rows:
+            thresholds.setdefault(motorcycle_id, []).append((mileage, service_type, service_key))
+            by_key[(motorcycle_id, service_type, service_key)] = mileage
+        for entries in thresholds.values():
+            entries.sort()
+
+        with self._lock:
+            self._thresholds = thresholds
+            self._by_key = by_key
+        return len(by_key)
+
+    def set_threshold(self, key: DueKey, mileage: Optional[float]):
+        """Move a service's threshold; None or 0 drops it"""
+        motorcycle_id, service_type, service_key = key
+        with self._lock:
+            entries = self._thresholds.setdefault(motorcycle_id, [])
+            previous = self._by_key.pop(key, None)
+            if previous is not None:
+                entry = (previous, service_type, service_key)
+                position = bisect.bisect_left(entries, entry)
+                if position < len(entries) and entries[position] == entry:
+                    del entries[position]
+            if mileage:
+                bisect.insort(entries, (mileage, service_type, service_key))
+                self._by_key[key] = mileage
+            if not entries:
+                del self._thresholds[motorcycle_id]
+
+    def crossed(self, motorcycle_id: int, old_mileage: float, new_mileage: float) -> List[Tuple[DueKey, float]]:
+        """Thresholds reached by moving from old_mileage to new_mileage"""
+        if new_mileage is None or new_mileage <= (old_mileage or 0):
+            return []
+        with self._lock:
+            entries = self._thresholds.get(motorcycle_id, [])
+            # A service is due once the odometer reaches its threshold
+            start = bisect.bisect_right(entries, old_mileage or 0, key=_threshold_mileage)
+            end = bisect.bisect_right(entries, new_mileage, key=_threshold_mileage)
+            return [
+                ((motorcycle_id, service_type, service_key), mileage)
+                for mileage, service_type, service_key in entries[start:end]
+            ]
+
+
+mileage_index = MileageThresholdIndex()
+
+Gauge("mileage_index_thresholds", "Pending mileage thresholds held in the index", callback=lambda: len(mileage_index))
+
+
+def _pending(session: Session) -> dict:
+    return session.info.setdefault(_PENDING_KEY, {"thresholds": {}, "mileage": {}})
+
+
+def stage_threshold(session: Session, key: DueKey, mileage: Optional[float]):
+    """Queue a threshold change, applied to the index once the session commits"""
+    _pending(session)["thresholds"][key] = mileage
+
+
+def stage_mileage(session: Session, motorcycle_id: int, old_mileage: Optional[float], new_mileage: Optional[float]):
+    """Queue a mileage move, checked for crossed thresholds once the session commits.
+
+    ORM writes are picked up by the flush listener below; Core updates of
+    current_mileage must report themselves here.
+    """
+    mileage = _pending(session)["mileage"]
+    # Keep the mileage the transaction started from across several writes
+    old_mileage = mileage.get(motorcycle_id, (old_mileage, None))[0]
+    mileage[motorcycle_id] = (old_mileage, new_mileage)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_mileage_changes(session, flush_context):
+    for obj in session.dirty:
+        if not isinstance(obj, Motorcycle) or not inspect(obj).attrs.current_mileage.history.has_changes():
+            continue
+        stage_mileage(session, obj.id, committed_value(obj, "current_mileage"), obj.current_mileage)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_changes(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    # Thresholds first: a service recorded in the same transaction as the
+    # mileage it was done at replaces the threshold that mileage would cross
+    for key, mileage in pending["thresholds"].items():
+        mileage_index.set_threshold(key, mileage)
+
+    crossings = []
+    for motorcycle_id, (old_mileage, new_mileage) in pending["mileage"].items():
+        crossings.extend(mileage_index.crossed(motorcycle_id, old_mileage, new_mileage))
+    if crossings:
+        maintenance_due_events.inc(len(crossings))
+        _emit(crossings)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+_tasks = set()  # Strong references, so pending sends are not garbage collected
+
+
+def _emit(crossings: List[Tuple[DueKey, float]]):
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No event loop to send %d maintenance_due events from", len(crossings))
+        return
+    task = loop.create_task(_send_maintenance_due(crossings))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def _send_maintenance_due(crossings: List[Tuple[DueKey, float]]):
+    """Notify the crossed services; the watermark skips any the scan already sent"""
+    try:
+        async with SessionLocal() as db:
+            await DueNotifier(db).notify("mileage", keys=[key for key, _ in crossings])
+    except Exception:
+        logger.exception("Sending maintenance_due events failed")
@@ -0,0 +1,317 @@
+# backend/app/services/ride_log_import.py
+# Bulk import of ride logs from CSV or GPX files.
+#
+# The upload is read as a stream and handled in batches of
+# RIDE_LOG_IMPORT_BATCH rows, each in its own transaction: rows are validated
+# against LogCreate, rides already stored (same content hash) are skipped,
+# distance and fuel efficiency are computed for the whole batch in one
+# vectorised pass, the rows go in as one executemany insert and every
+# motorcycle's current_mileage moves once. A progress record is yielded after
+# each batch.
+#
+# CSV columns are LogCreate's field names, separated by "," or, as the
+# export writes them with a decimal comma, by ";". A GPX file holds one ride
+# per track; tracks carry no odometer readings, so they are laid end to end
+# from the motorcycle's current mileage using the tracked distance.
+
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import xml.etree.ElementTree as ElementTree
+from array import array
+from datetime import datetime, timezone
+from itertools import chain, islice
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from pydantic import ValidationError
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.change_tracking import mark_changed
+from app.models.logs import RideLog
+from app.models.motorcycle import Motorcycle
+from app.schemas.logs import LogCreate
+from app.services.fuel_stats_service import FUEL_COLUMNS, stage_fuel_rides
+from app.services.mileage_index import stage_mileage
+
+EARTH_RADIUS_KM = 6371.0088
+
+# What makes two rides the same. Mileage tells apart rides that share a
+# start date; only relative (GPX) rows leave it out, so a re-imported track
+# matches however far the odometer has moved since
+_IDENTITY_FIELDS = (
+    "motorcycle_id", "start_date", "end_date", "fuel_consumed", "fuel_cost",
+    "start_location", "end_location", "route_description", "trip_type", "notes"
+)
+_MILEAGE_FIELDS = ("start_mileage", "end_mileage")
+# Written with a decimal comma in ";"-separated files
+_NUMBER_FIELDS = frozenset(_MILEAGE_FIELDS + ("fuel_consumed", "fuel_cost"))
+
+
+class ImportRow(NamedTuple):
+    line: int  # CSV line or GPX track number, for error reports
+    data: Dict[str, Any]
+    relative: bool  # Mileage counts from the start of the ride and is placed on the odometer
+
+
+def read_csv(file: BinaryIO) -> Iterator[ImportRow]:
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        header = text.readline()
+        try:
+            delimiter = csv.Sniffer().sniff(header, delimiters=",;").delimiter
+        except csv.Error:
+            delimiter = ","  # A single column
+        reader = csv.DictReader(chain([header], text), delimiter=delimiter)
+        for row in reader:
+            # Empty cells are left out so LogCreate's defaults apply
+            data = {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if isinstance(key, str) and isinstance(value, str) and value.strip()
+            }
+            if delimiter == ";":
+                for field in _NUMBER_FIELDS.intersection(data):
+                    data[field] = data[field].replace(",", ".")
+            yield ImportRow(reader.line_num, data, False)
+    finally:
+        text.detach()  # The upload is closed by its owner
+
+
+class GpxTrack(NamedTuple):
+    name: Optional[str]
+    points: np.ndarray  # (n, 2) latitude/longitude
+    start: Optional[datetime]
+    end: Optional[datetime]
+
+
+def gpx_tracks(file: BinaryIO) -> Iterator[GpxTrack]:
+    """The tracks of a GPX file, parsed as a stream and yielded one at a time"""
+    points = array("d")  # Flat latitude/longitude pairs, 16 bytes a point
+    start = end = None
+    for _, element in ElementTree.iterparse(file, events=("end",)):
+        tag = _local_name(element.tag)
+        if tag == "trkpt":
+            points.extend((float(element.get("lat")), float(element.get("lon"))))
+            for child in element:
+                if _local_name(child.tag) == "time" and child.text:
+                    end = _utc(datetime.fromisoformat(child.text.strip()))
+                    start = start or end
+            element.clear()
+        elif tag == "trkseg":
+            element.clear()
+        elif tag == "trk":
+            name = next((child.text for child in element if _local_name(child.tag) == "name"), None)
+            yield GpxTrack(name, np.frombuffer(points, dtype=float).reshape(-1, 2), start, end)
+            points = array("d")
+            start = end = None
+            element.clear()
+
+
+def read_gpx(file: BinaryIO) -> Iterator[ImportRow]:
+    for number, track in enumerate(gpx_tracks(file), 1):
+        yield ImportRow(number, {
+            "start_date": track.start,
+            "end_date": track.end,
+            "start_mileage": 0.0,
+            "end_mileage": round(track_distance(track.points), 3),
+            "route_description": track.name
+        }, True)
+
+
+def track_distance(points: np.ndarray) -> float:
+    """Great-circle length in km of an (n, 2) array of latitude/longitude points"""
+    if len(points) < 2:
+        return 0.0
+    latitude, longitude = np.radians(points[:, 0]), np.radians(points[:, 1])
+    a = (
+        np.sin(np.diff(latitude) / 2) ** 2
+        + np.cos(latitude[:-1]) * np.cos(latitude[1:]) * np.sin(np.diff(longitude) / 2) ** 2
+    )
+    return float(2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a)).sum())
+
+
+def ride_metrics(
+    start: np.ndarray, end: np.ndarray, fuel: np.ndarray, relative: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """distance and fuel_efficiency for many rides, as POST /logs/ works them out one by one.
+
+    Missing values are NaN on the way in and where a value is left empty on
+    the way out. A zero mileage counts as missing, except on relative rides,
+    which start wherever the odometer stood, 0 included.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        has_distance = relative | ((np.nan_to_num(start) != 0) & (np.nan_to_num(end) != 0))
+        distance = np.where(has_distance, end - start, np.nan)
+        has_efficiency = (np.nan_to_num(distance) != 0) & (np.nan_to_num(fuel) > 0)
+        efficiency = np.where(has_efficiency, distance / fuel, np.nan)
+    return distance, efficiency
+
+
+def content_hash(log: LogCreate, relative: bool = False) -> str:
+    fields = _IDENTITY_FIELDS if relative else _IDENTITY_FIELDS + _MILEAGE_FIELDS
+    identity = log.model_dump(include=set(fields), mode="json")
+    return hashlib.blake2b(json.dumps(identity, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+class RideLogImporter:
+    def __init__(self, db: AsyncSession, batch_size: int, motorcycle_id: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size
+        self.motorcycle_id = motorcycle_id  # For rows that do not name one
+
+    async def run(self, rows: Iterator[ImportRow]) -> AsyncIterator[Dict[str, Any]]:
+        """Import the rows batch by batch, yielding the running totals after each"""
+        totals = {"processed": 0, "imported": 0, "duplicates": 0, "failed": 0}
+        batch = 0
+        while True:
+            try:
+                # Parsing reads the upload, so it runs off the event loop
+                chunk = await asyncio.to_thread(lambda: list(islice(rows, self.batch_size)))
+            except (csv.Error, ElementTree.ParseError, UnicodeDecodeError, ValueError) as e:
+                yield {"done": True, "aborted": f"Unreadable file: {e}", **totals}
+                return
+            if not chunk:
+                break
+
+            batch += 1
+            imported, duplicates, errors = await self._import_batch(chunk)
+            totals["processed"] += len(chunk)
+            totals["imported"] += imported
+            totals["duplicates"] += duplicates
+            totals["failed"] += len(errors)
+            yield {"batch": batch, **totals, "errors": errors}
+        yield {"done": True, **totals}
+
+    async def _import_batch(self, chunk: List[ImportRow]) -> Tuple[int, int, List[Dict[str, Any]]]:
+        errors = []
+        valid: List[Tuple[ImportRow, LogCreate]] = []
+        for row in chunk:
+            if self.motorcycle_id is not None:
+                row.data.setdefault("motorcycle_id", self.motorcycle_id)
+            try:
+                valid.append((row, LogCreate.model_validate(row.data)))
+            except ValidationError as e:
+                errors.append({"line": row.line, "error": _describe(e)})
+
+        mileage = dict((await self.db.execute(
+            select(Motorcycle.id, Motorcycle.current_mileage)
+            .where(Motorcycle.id.in_({log.motorcycle_id for _, log in valid}))
+        )).all())
+        odometers = dict(mileage)
+        hashes = [content_hash(log, row.relative) for row, log in valid]
+        stored = set((await self.db.scalars(
+            select(RideLog.content_hash).where(RideLog.content_hash.in_(hashes))
+        )).all()) if hashes else set()
+
+        records = []
+        relative = []  # Per record, whether its mileage was placed on the odometer
+        inserted = []
+        duplicates = 0
+        for (row, log), digest in zip(valid, hashes):
+            if log.motorcycle_id not in odometers:
+                errors.append({"line": row.line, "error": "Motorcycle not found"})
+                continue
+            if digest in stored:
+                duplicates += 1
+                continue
+            stored.add(digest)
+            record = log.model_dump()
+            record["content_hash"] = digest
+            if row.relative:
+                # Laid end to end from wherever the odometer stands
+                offset = odometers[log.motorcycle_id] or 0
+                record["start_mileage"] += offset
+                if record["end_mileage"] is not None:
+                    record["end_mileage"] += offset
+                    odometers[log.motorcycle_id] = record["end_mileage"]
+            records.append(record)
+            relative.append(row.relative)
+
+        if records:
+            distance, efficiency = ride_metrics(
+                np.array([record["start_mileage"] for record in records], dtype=float),
+                np.array([_nan(record["end_mileage"]) for record in records], dtype=float),
+                np.array([_nan(record["fuel_consumed"]) for record in records], dtype=float),
+                np.array(relative, dtype=bool)
+            )
+            for record, ride_distance, ride_efficiency in zip(records, distance.tolist(), efficiency.tolist()):
+                record["distance"] = _none(ride_distance)
+                record["fuel_efficiency"] = _none(ride_efficiency)
+
+            # Another import of the same file may have stored a ride since the check
+            inserted = (await self.db.execute(
+                insert(RideLog.__table__)
+                .on_conflict_do_nothing(index_elements=["content_hash"])
+                .returning(*FUEL_COLUMNS, RideLog.content_hash),
+                records
+            )).all()
+            duplicates += len(records) - len(inserted)
+            if inserted:
+                # Core writes bypass the flush listener that keeps the fuel statistics
+                await self.db.run_sync(stage_fuel_rides, inserted)
+                written = {ride.content_hash for ride in inserted}
+                await self._advance_mileage([record for record in records if record["content_hash"] in written], mileage)
+                await mark_changed(self.db, RideLog.__tablename__, {ride.motorcycle_id for ride in inserted})
+        await self.db.commit()
+        errors.sort(key=lambda error: error["line"])
+        return len(inserted), duplicates, errors
+
+    async def _advance_mileage(self, records: List[Dict[str, Any]], current: Dict[int, Optional[float]]):
+        """Move each motorcycle's current_mileage once, to the furthest end_mileage of the batch"""
+        furthest: Dict[int, float] = {}
+        for record in records:
+            if record["end_mileage"]:
+                motorcycle_id = record["motorcycle_id"]
+                furthest[motorcycle_id] = max(furthest.get(motorcycle_id, 0), record["end_mileage"])
+
+        moved = []
+        for motorcycle_id, end_mileage in furthest.items():
+            if end_mileage <= (current[motorcycle_id] or 0):
+                continue
+            # Conditional, so a mileage written since the batch read it is never moved back
+            result = await self.db.execute(
+                update(Motorcycle)
+                .where(
+                    Motorcycle.id == motorcycle_id,
+                    or_(Motorcycle.current_mileage.is_(None), Motorcycle.current_mileage < end_mileage)
+                )
+                .values(current_mileage=end_mileage),
+                execution_options={"synchronize_session": False}
+            )
+            if not result.rowcount:
+                continue
+            # Core writes bypass the flush listeners that feed the mileage index
+            await self.db.run_sync(stage_mileage, motorcycle_id, current[motorcycle_id], end_mileage)
+            moved.append(motorcycle_id)
+        if moved:
+            await mark_changed(self.db, Motorcycle.__tablename__, moved)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _utc(moment: datetime) -> datetime:
+    """Naive UTC, as the rest of the database stores times"""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _nan(value: Optional[float]) -> float:
+    return np.nan if value is None else value
+
+
+def _none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else value
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+    )
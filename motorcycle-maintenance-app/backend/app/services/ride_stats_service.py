@@ -0,0 +1,80 @@
+# backend/app/services/ride_stats_service.py
+# Ride statistics aggregated in SQL: rides, distance, fuel, fuel cost and
+# efficiency per time bucket, optionally split by trip type or conditions.
+# Only the aggregate rows leave the database, never the ride logs themselves.
+
+import enum
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import case, func, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.logs import RideLog
+
+
+class StatsInterval(str, enum.Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"  # Labelled with the Monday the week starts on
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+class StatsGroup(str, enum.Enum):
+    TRIP_TYPE = "trip_type"
+    WEATHER_CONDITIONS = "weather_conditions"
+    ROAD_CONDITIONS = "road_conditions"
+
+
+def _period(interval: StatsInterval):
+    if interval == StatsInterval.WEEKLY:
+        # 'weekday 0' moves to the coming Sunday (or stays on one); six days back is its Monday
+        return func.date(RideLog.start_date, "weekday 0", "-6 days")
+    formats = {StatsInterval.DAILY: "%Y-%m-%d", StatsInterval.MONTHLY: "%Y-%m", StatsInterval.YEARLY: "%Y"}
+    return func.strftime(formats[interval], RideLog.start_date)
+
+
+class RideStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def buckets(
+        self,
+        motorcycle_id: Optional[int] = None,
+        interval: Optional[StatsInterval] = None,
+        group_by: Optional[StatsGroup] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """One row per bucket (and group), in bucket order.
+
+        Without an interval or group the whole range is a single row, returned
+        even when no ride matches. Efficiency and price per liter are averages
+        over the rides that have one.
+        """
+        period = _period(interval) if interval else None
+        group = getattr(RideLog, group_by.value) if group_by else None
+        keys = [key for key in (period, group) if key is not None]
+
+        price_per_liter = case(
+            (RideLog.fuel_cost != 0, RideLog.fuel_cost / func.nullif(RideLog.fuel_consumed, 0))
+        )
+        query = select(
+            (period if period is not None else null()).label("period"),
+            (group if group is not None else null()).label("group"),
+            func.count(RideLog.id).label("rides"),
+            func.coalesce(func.sum(RideLog.distance), 0).label("distance"),
+            func.coalesce(func.sum(RideLog.fuel_consumed), 0).label("fuel"),
+            func.coalesce(func.sum(RideLog.fuel_cost), 0).label("fuel_cost"),
+            func.avg(func.nullif(RideLog.fuel_efficiency, 0)).label("average_efficiency"),
+            func.avg(price_per_liter).label("average_price_per_liter")
+        )
+        if motorcycle_id:
+            query = query.where(RideLog.motorcycle_id == motorcycle_id)
+        if start_date:
+            query = query.where(RideLog.start_date >= start_date)
+        if end_date:
+            query = query.where(RideLog.start_date <= end_date)
+        if keys:
+            query = query.group_by(*keys).order_by(*keys)
+        return [dict(row) for row in (await self.db.execute(query)).mappings()]
@@ -0,0 +1,198 @@
+# backend/app/services/telemetry.py
+# Buffered ingestion of odometer telemetry from data loggers.
+#
+# The ingestion endpoint only appends samples to a buffer. Every
+# TELEMETRY_FLUSH_INTERVAL seconds, or sooner once TELEMETRY_BATCH samples
+# are waiting, the buffer is written in a single transaction: the readings as
+# one executemany insert and one current_mileage update per motorcycle that
+# moved, so a logger reporting every second costs one commit per flush, not
+# per sample. Samples still buffered when the process dies are lost; loggers
+# get 202 Accepted, not a durable write.
+#
+# Readings older than TELEMETRY_RAW_RETENTION_DAYS are downsampled to the
+# last one per motorcycle and TELEMETRY_DOWNSAMPLE_INTERVAL, which keeps the
+# table's size proportional to the history rather than the sample rate.
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import Integer, cast, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.change_tracking import mark_changed
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.metrics import Counter, Gauge
+from app.models.motorcycle import Motorcycle
+from app.models.telemetry import OdometerReading
+from app.services.mileage_index import stage_mileage
+
+logger = logging.getLogger(__name__)
+
+_DOWNSAMPLE_EVERY = 3600  # seconds between downsampling passes
+
+telemetry_samples = Counter("telemetry_samples_total", "Odometer samples by outcome", ("result",))
+telemetry_flushes = Counter("telemetry_flushes_total", "Batched writes of odometer telemetry")
+
+
+class OdometerLog:
+    def __init__(self, flush_interval: float, batch_size: int, max_buffered: int):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffered = max_buffered
+        self._buffer: List[dict] = []
+        self._full = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._last_downsample = time.monotonic()
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def record(self, motorcycle_id: int, samples: List[tuple]) -> bool:
+        """Buffer (recorded_at, mileage) samples; False when the buffer has no room for them"""
+        if len(self._buffer) + len(samples) > self.max_buffered:
+            telemetry_samples.inc(len(samples), result="rejected")
+            return False
+        self._buffer.extend(
+            {"motorcycle_id": motorcycle_id, "recorded_at": _utc(recorded_at), "mileage": mileage}
+            for recorded_at, mileage in samples
+        )
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+        return True
+
+    def start(self):
+        if self._flusher is not None:
+            return
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the periodic flush and write what is still buffered"""
+        if self._flusher is not None:
+            self._stopping = True
+            self._full.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            try:
+                await self.flush()
+                await self._downsample()
+            except Exception:
+                logger.exception("Writing odometer telemetry failed")
+
+    async def flush(self) -> int:
+        """Write the buffered samples and move current_mileage; returns how many were written"""
+        if not self._buffer:
+            return 0
+        samples, self._buffer = self._buffer, []
+        try:
+            async with SessionLocal() as db:
+                furthest: Dict[int, float] = {}
+                for sample in samples:
+                    motorcycle_id = sample["motorcycle_id"]
+                    furthest[motorcycle_id] = max(furthest.get(motorcycle_id, 0), sample["mileage"])
+                current = dict((await db.execute(
+                    select(Motorcycle.id, Motorcycle.current_mileage).where(Motorcycle.id.in_(furthest))
+                )).all())
+
+                # Motorcycles deleted since the request take their samples with them
+                readings = [sample for sample in samples if sample["motorcycle_id"] in current]
+                if readings:
+                    await db.execute(insert(OdometerReading), readings)
+                await _advance_mileage(db, furthest, current)
+                await db.commit()
+        except Exception:
+            # Kept for the next flush rather than lost
+            self._buffer[:0] = samples
+            raise
+        telemetry_samples.inc(len(readings), result="written")
+        telemetry_samples.inc(len(samples) - len(readings), result="dropped")
+        telemetry_flushes.inc()
+        return len(readings)
+
+    async def _downsample(self):
+        if time.monotonic() - self._last_downsample < _DOWNSAMPLE_EVERY:
+            return
+        self._last_downsample = time.monotonic()
+        cutoff = datetime.utcnow() - timedelta(days=settings.TELEMETRY_RAW_RETENTION_DAYS)
+        async with SessionLocal() as db:
+            removed = await downsample(db, cutoff, settings.TELEMETRY_DOWNSAMPLE_INTERVAL)
+        logger.info(f"Downsampled odometer telemetry: {removed} readings removed")
+
+
+async def _advance_mileage(db: AsyncSession, furthest: Dict[int, float], current: Dict[int, Optional[float]]):
+    """Move each motorcycle's current_mileage once, to the furthest sample of the flush"""
+    moved = []
+    for motorcycle_id, mileage in furthest.items():
+        if motorcycle_id not in current or mileage <= (current[motorcycle_id] or 0):
+            continue
+        # Conditional, so a manual mileage write since the select is never moved back
+        result = await db.execute(
+            update(Motorcycle)
+            .where(
+                Motorcycle.id == motorcycle_id,
+                or_(Motorcycle.current_mileage.is_(None), Motorcycle.current_mileage < mileage)
+            )
+            .values(current_mileage=mileage),
+            execution_options={"synchronize_session": False}
+        )
+        if not result.rowcount:
+            continue
+        # Core writes bypass the flush listeners that feed the mileage index
+        await db.run_sync(stage_mileage, motorcycle_id, current[motorcycle_id], mileage)
+        moved.append(motorcycle_id)
+    if moved:
+        await mark_changed(db, Motorcycle.__tablename__, moved)
+
+
+async def downsample(db: AsyncSession, before: datetime, interval: int) -> int:
+    """Keep the last reading per motorcycle and interval of the readings before a cutoff.
+
+    Returns how many readings were removed. Readings already downsampled are
+    alone in their interval, so running it again removes nothing.
+    """
+    bucket = cast(func.strftime("%s", OdometerReading.recorded_at), Integer) // interval
+    ranked = select(
+        OdometerReading.id,
+        func.row_number().over(
+            partition_by=(OdometerReading.motorcycle_id, bucket),
+            order_by=(OdometerReading.recorded_at.desc(), OdometerReading.id.desc())
+        ).label("position")
+    ).where(OdometerReading.recorded_at < before).subquery()
+    result = await db.execute(
+        delete(OdometerReading)
+        .where(OdometerReading.id.in_(select(ranked.c.id).where(ranked.c.position > 1)))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+def _utc(moment: datetime) -> datetime:
+    """Naive UTC, as the rest of the database stores times"""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+odometer_log = OdometerLog(
+    flush_interval=settings.TELEMETRY_FLUSH_INTERVAL,
+    batch_size=settings.TELEMETRY_BATCH,
+    max_buffered=settings.TELEMETRY_MAX_BUFFERED
+)
+
+Gauge("telemetry_buffered", "Odometer samples waiting to be written", callback=lambda: odometer_log.buffered)
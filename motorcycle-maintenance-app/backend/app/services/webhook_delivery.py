@@ -0,0 +1,379 @@
+# backend/app/services/webhook_delivery.py
+# Delivers the webhook outbox.
+#
+# Events are queued in the webhook_outbox table by the transaction that
+# raised them (WebhookService.send_webhook). A claim loop leases due rows by
+# pushing their next_attempt_at ahead (and marking leased_until until the
+# outcome is written), then starts a task per delivery, with a semaphore
+# bounding how many send at once. An event's subscribers are sent
+# concurrently from one shared body, so a slow receiver holds up its own
+# delivery only. A process that dies mid-delivery leaves its lease to expire
+# and the row is picked up again. Failed deliveries are retried per the
+# webhook's max_retries, retry_delay doubling with every attempt.
+#
+# Webhooks with a coalesce_window hold their deliveries back for that long
+# (send_webhook sets next_attempt_at ahead). When the first comes due, the
+# claim pulls in the rest of that endpoint's waiting events of the same type
+# and sends them as one call of up to coalesce_max_batch items, so a bulk
+# operation costs a few requests instead of one per record. The rows of a
+# batch share its outcome.
+#
+# Each webhook has a circuit breaker (app.services.webhook_health): while a
+# receiver is failing its deliveries are put off to the breaker's next probe
+# without calling it, and without spending one of their attempts. Calls are
+# recorded in the delivery log (app.services.webhook_log), which writes them
+# and the webhook's counters in batches.
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select, update, delete, func, or_, Row
+
+from app.core.change_tracking import Changes, on_commit
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.http_client import webhook_http
+from app.core.metrics import Counter, Gauge
+from app.models.webhook import WebhookDeliveryAttempt, WebhookEvent, WebhookOutbox
+from app.services.webhook_health import webhook_health
+from app.services.webhook_log import SHORT_CIRCUITED, delivery_log
+from app.services.webhook_registry import WebhookTarget, webhook_registry
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+DELIVERED = "delivered"
+FAILED = "failed"
+
+_CLEANUP_INTERVAL = 3600  # seconds between purges of old delivered rows
+
+deliveries_total = Counter("webhook_deliveries_total", "Webhook delivery attempts", ("result",))
+short_circuits = Counter("webhook_short_circuits_total", "Webhook deliveries failed by an open circuit without a call")
+coalesced_events = Counter("webhook_coalesced_events_total", "Events sent inside a coalesced webhook batch")
+
+
+class _Batch(NamedTuple):
+    """Outbox rows sent together in one call"""
+    ids: List[int]
+    webhook_id: int
+    attempts: int
+    body: bytes
+
+
+def retry_backoff(retry_delay: Optional[int], attempts: int) -> float:
+    """Seconds before the next attempt after `attempts` failed ones"""
+    return (retry_delay or 0) * 2 ** (attempts - 1)
+
+
+def batch_payload(event_type: str, bodies: Sequence[bytes]) -> bytes:
+    """One body for coalesced events, carrying each event's own payload as an item"""
+    head = json.dumps({
+        "event_type": event_type,
+        "timestamp": datetime.utcnow().isoformat(),
+        "count": len(bodies)
+    })
+    # The stored payloads are JSON already; spliced in rather than decoded and re-encoded
+    return head[:-1].encode() + b', "items": [' + b", ".join(bodies) + b"]}"
+
+
+class WebhookDispatcher:
+    def __init__(self, workers: int, poll_interval: float, drain_timeout: float):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.drain_timeout = drain_timeout
+        # Long enough for a worker to see a slow request through
+        self.lease = timedelta(seconds=2 * (settings.WEBHOOK_CONNECT_TIMEOUT + settings.WEBHOOK_READ_TIMEOUT + settings.WEBHOOK_TIMEOUT))
+        self._slots = asyncio.Semaphore(workers)  # Deliveries sending at once
+        self._wakeup = asyncio.Event()
+        self._claimer: Optional[asyncio.Task] = None
+        self._tasks: Dict[asyncio.Task, _Batch] = {}  # Claimed deliveries not finished yet
+        self._started: Set[asyncio.Task] = set()  # Deliveries holding a slot
+        self._stopping = False
+        self._last_cleanup = 0.0
+
+    @property
+    def in_process(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def capacity(self) -> int:
+        """Deliveries held at once: one sending per worker slot plus one waiting"""
+        return self.workers * 2
+
+    def wake(self):
+        """Look for due deliveries now instead of at the next poll"""
+        self._wakeup.set()
+
+    def start(self):
+        if self._claimer is not None:
+            return
+        self._stopping = False
+        self._claimer = asyncio.create_task(self._claim_loop())
+
+    async def stop(self):
+        """Stop claiming and finish the claimed deliveries, within drain_timeout"""
+        if self._claimer is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._claimer
+        self._claimer = None
+        if not self._tasks:
+            return
+
+        _, unfinished = await asyncio.wait(set(self._tasks), timeout=self.drain_timeout)
+        if unfinished:
+            logger.warning(f"Webhook drain timed out with {len(unfinished)} deliveries unfinished")
+        # Deliveries still waiting for a slot go back to the next run right away;
+        # ones cut off mid-send are retried when their lease runs out
+        unstarted = [
+            outbox_id
+            for task in unfinished if task not in self._started
+            for outbox_id in self._tasks[task].ids
+        ]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+        if unstarted:
+            async with SessionLocal() as db:
+                await db.execute(
+                    update(WebhookOutbox)
+                    .where(WebhookOutbox.id.in_(unstarted))
+                    .values(next_attempt_at=datetime.utcnow(), leased_until=None)
+                )
+                await db.commit()
+
+    async def _claim_loop(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            claimed, next_due = [], None
+            free = self.capacity - len(self._tasks)
+            try:
+                if free > 0:
+                    claimed, next_due = await self._claim(free)
+                await self._cleanup()
+            except Exception:
+                logger.exception("Claiming webhook deliveries failed")
+
+            # All subscribers of an event go out concurrently, sharing its body
+            for batch in claimed:
+                task = asyncio.create_task(self._run(batch))
+                self._tasks[task] = batch
+                task.add_done_callback(self._finished)
+
+            timeout = self.poll_interval
+            if next_due is not None:
+                # Sleep no longer than the next held-back delivery needs
+                timeout = min(timeout, max((next_due - datetime.utcnow()).total_seconds(), 0))
+            if timeout == 0 and len(self._tasks) < self.capacity:
+                continue  # More are due
+            try:
+                # Woken by new events, by a delivery freeing a slot, or by stop()
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _finished(self, task: asyncio.Task):
+        self._tasks.pop(task)
+        self._started.discard(task)
+        if len(self._tasks) == self.capacity - 1:
+            self.wake()  # The claim loop was waiting for a free slot
+
+    async def _claim(self, limit: int) -> Tuple[List[_Batch], Optional[datetime]]:
+        """Lease up to limit due deliveries and batch them per call.
+
+        Also returns when the next pending delivery comes due, so the claim
+        loop wakes in time for the end of a coalescing window.
+        """
+        now = datetime.utcnow()
+        outbox = WebhookOutbox.__table__
+        due = select(outbox.c.id).where(
+            outbox.c.status == PENDING,
+            outbox.c.next_attempt_at <= now
+        ).order_by(outbox.c.next_attempt_at, outbox.c.id).limit(limit)
+
+        async with SessionLocal() as db:
+            claimed = await self._lease(db, outbox.c.id.in_(due.scalar_subquery()), now)
+            events = await self._load_events(db, claimed)
+
+            batches = []
+            coalescing: Dict[Tuple[WebhookTarget, str], List[Row]] = {}
+            for delivery in claimed:
+                webhook = await webhook_registry.get(db, delivery.webhook_id)
+                event_type, body = events[delivery.event_id]
+                if webhook is None or not webhook.coalesce_window:
+                    batches.append(_Batch([delivery.id], delivery.webhook_id, delivery.attempts, body))
+                else:
+                    coalescing.setdefault((webhook, event_type), []).append(delivery)
+
+            for (webhook, event_type), deliveries in coalescing.items():
+                room = webhook.coalesce_max_batch - len(deliveries)
+                if room > 0:
+                    # The rest of the endpoint's events still waiting out their window:
+                    # never attempted, so neither in flight nor backing off for a retry
+                    waiting = select(outbox.c.id).join(
+                        WebhookEvent.__table__, WebhookEvent.id == outbox.c.event_id
+                    ).where(
+                        outbox.c.webhook_id == webhook.id,
+                        WebhookEvent.event_type == event_type,
+                        outbox.c.status == PENDING,
+                        outbox.c.attempts == 0,
+                        or_(outbox.c.leased_until.is_(None), outbox.c.leased_until <= now),
+                        outbox.c.next_attempt_at <= now + timedelta(seconds=webhook.coalesce_window),
+                        outbox.c.id.not_in([delivery.id for delivery in deliveries])
+                    ).order_by(outbox.c.id).limit(room)
+                    joined = await self._lease(db, outbox.c.id.in_(waiting.scalar_subquery()), now)
+                    events.update(await self._load_events(db, joined))
+                    deliveries.extend(joined)
+
+                size = webhook.coalesce_max_batch
+                for start in range(0, len(deliveries), size):
+                    chunk = deliveries[start:start + size]
+                    batches.append(_Batch(
+                        [delivery.id for delivery in chunk],
+                        webhook.id,
+                        max(delivery.attempts for delivery in chunk),
+                        batch_payload(event_type, [events[delivery.event_id][1] for delivery in chunk])
+                    ))
+
+            next_due = await db.scalar(select(func.min(outbox.c.next_attempt_at)).where(outbox.c.status == PENDING))
+            await db.commit()
+        return batches, next_due
+
+    async def _lease(self, db, condition, now: datetime) -> List[Row]:
+        outbox = WebhookOutbox.__table__
+        result = await db.execute(
+            update(outbox)
+            .where(condition)
+            .values(next_attempt_at=now + self.lease, leased_until=now + self.lease)
+            .returning(outbox.c.id, outbox.c.webhook_id, outbox.c.event_id, outbox.c.attempts)
+        )
+        return sorted(result.all(), key=lambda delivery: delivery.id)
+
+    async def _load_events(self, db, deliveries: List[Row]) -> Dict[int, Tuple[str, bytes]]:
+        """Event type and body per event id; one copy however many subscribers it has"""
+        if not deliveries:
+            return {}
+        rows = await db.execute(
+            select(WebhookEvent.id, WebhookEvent.event_type, WebhookEvent.payload)
+            .where(WebhookEvent.id.in_({delivery.event_id for delivery in deliveries}))
+        )
+        return {row.id: (row.event_type, row.payload) for row in rows}
+
+    async def _cleanup(self):
+        if time.monotonic() - self._last_cleanup < _CLEANUP_INTERVAL:
+            return
+        self._last_cleanup = time.monotonic()
+        cutoff = datetime.utcnow() - timedelta(days=settings.WEBHOOK_OUTBOX_RETENTION_DAYS)
+        async with SessionLocal() as db:
+            await db.execute(delete(WebhookOutbox).where(
+                WebhookOutbox.status == DELIVERED,
+                WebhookOutbox.delivered_at < cutoff
+            ))
+            await db.execute(delete(WebhookDeliveryAttempt).where(WebhookDeliveryAttempt.created_at < cutoff))
+            await db.execute(delete(WebhookEvent).where(
+                ~select(WebhookOutbox.id).where(WebhookOutbox.event_id == WebhookEvent.id).exists()
+            ))
+            await db.commit()
+
+    async def _run(self, batch: _Batch):
+        async with self._slots:
+            self._started.add(asyncio.current_task())
+            try:
+                await self._deliver(batch)
+            except Exception:
+                # Each delivery fails alone; the lease runs out and it is claimed again
+                logger.exception(f"Webhook delivery {batch.ids} failed unexpectedly")
+
+    async def _deliver(self, batch: _Batch):
+        async with SessionLocal() as db:
+            webhook = await webhook_registry.get(db, batch.webhook_id)
+            if webhook is None:
+                await db.execute(
+                    update(WebhookOutbox)
+                    .where(WebhookOutbox.id.in_(batch.ids))
+                    .values(status=FAILED, last_error="Webhook removed or disabled", leased_until=None)
+                )
+                await db.commit()
+                deliveries_total.inc(result="dropped")
+                return
+        # The session is closed before the call: in the production profile it
+        # would hold the only writer connection for as long as the receiver takes
+
+        breaker = webhook_health.breaker(webhook.id)
+        called = breaker.allow(datetime.utcnow())
+        error = None
+        latency = response_code = None
+        if called:
+            started = time.perf_counter()
+            try:
+                response = await webhook_http.post(
+                    webhook.url,
+                    content=batch.body,
+                    headers={"Content-Type": "application/json"}
+                )
+                response_code = response.status_code
+                response.raise_for_status()
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            latency = time.perf_counter() - started
+            breaker.record(error is None, latency, datetime.utcnow())
+        else:
+            error = "Circuit open: receiver is failing"
+            short_circuits.inc()
+
+        now = datetime.utcnow()
+        attempts = batch.attempts + 1
+        values = {"attempts": attempts, "last_error": error, "leased_until": None}
+        if not called:
+            # No request was made, so no attempt is spent: a receiver down for
+            # longer than the retry budget still gets the deliveries once it recovers
+            values.update(attempts=batch.attempts, next_attempt_at=breaker.next_call_at(now))
+            result = "deferred"
+        elif error is None:
+            values.update(status=DELIVERED, delivered_at=now)
+            result = "delivered"
+        elif attempts > webhook.max_retries:
+            values.update(status=FAILED)
+            result = "failed"
+            logger.warning(f"Webhook {webhook.name} gave up on delivery {batch.ids} after {attempts} attempts: {error}")
+        else:
+            retry_at = now + timedelta(seconds=retry_backoff(webhook.retry_delay, attempts))
+            values.update(next_attempt_at=max(retry_at, breaker.next_call_at(now)))
+            result = "retry"
+
+        async with SessionLocal() as db:
+            await db.execute(update(WebhookOutbox).where(WebhookOutbox.id.in_(batch.ids)).values(**values))
+            await db.commit()
+        delivery_log.record(
+            webhook_id=webhook.id,
+            outbox_id=batch.ids[0],
+            attempt=attempts,
+            status=(DELIVERED if error is None else FAILED) if called else SHORT_CIRCUITED,
+            latency=latency,
+            response_code=response_code,
+            error=error,
+            events=len(batch.ids)
+        )
+        deliveries_total.inc(result=result)
+        if len(batch.ids) > 1:
+            coalesced_events.inc(len(batch.ids))
+
+webhook_dispatcher = WebhookDispatcher(
+    workers=settings.WEBHOOK_WORKERS,
+    poll_interval=settings.WEBHOOK_POLL_INTERVAL,
+    drain_timeout=settings.WEBHOOK_DRAIN_TIMEOUT
+)
+
+Gauge("webhook_deliveries_in_process", "Webhook deliveries claimed by this process", callback=lambda: webhook_dispatcher.in_process)
+
+
+@on_commit
+def _wake_dispatcher(changes: Changes):
+    if WebhookOutbox.__tablename__ in changes:
+        webhook_dispatcher.wake()
@@ -0,0 +1,165 @@
+# backend/app/services/webhook_health.py
+# Circuit breaker and call latencies per webhook.
+#
+# Every delivery attempt reports its outcome and latency here. Once a
+# receiver fails, or answers slower than WEBHOOK_BREAKER_SLOW_CALL, on
+# WEBHOOK_BREAKER_FAILURE_RATE of its recent calls, its circuit opens:
+# deliveries to it fail on the spot without an HTTP call and go through the
+# usual retry backoff. After WEBHOOK_BREAKER_COOLDOWN a single probe is let
+# through (half-open), and its outcome closes the circuit or opens it for
+# another cooldown. State is kept per process and reset when the webhook's
+# URL changes.
+
+import math
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, NamedTuple, Optional, Sequence
+
+from app.core.config import settings
+from app.core.metrics import Gauge
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending sequence"""
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(fraction * len(ordered)), 1) - 1]
+
+
+class CircuitSnapshot(NamedTuple):
+    state: str
+    recent_calls: int
+    failure_rate: float
+    open_until: Optional[datetime]
+    latency_p50: Optional[float]  # seconds
+    latency_p95: Optional[float]
+    latency_p99: Optional[float]
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        window: int,
+        min_calls: int,
+        failure_rate: float,
+        slow_call: float,
+        cooldown: float,
+        latency_samples: int
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call = slow_call
+        self.cooldown = timedelta(seconds=cooldown)
+        self.state = CLOSED
+        self.open_until: Optional[datetime] = None
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True for a failed or slow call
+        self._latencies: Deque[float] = deque(maxlen=latency_samples)
+        self._probe_started: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def allow(self, now: datetime) -> bool:
+        """Whether a delivery may call the receiver now"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if now < self.open_until:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_started = None
+            # One probe at a time; a probe that never reported is replaced after a cooldown
+            if self._probe_started is not None and now < self._probe_started + self.cooldown:
+                return False
+            self._probe_started = now
+            return True
+
+    def next_call_at(self, now: datetime) -> datetime:
+        """Earliest time allow() may pass again"""
+        with self._lock:
+            if self.state == OPEN:
+                return self.open_until
+            if self.state == HALF_OPEN and self._probe_started is not None:
+                return self._probe_started + self.cooldown
+            return now
+
+    def record(self, ok: bool, latency: float, now: datetime):
+        with self._lock:
+            self._latencies.append(latency)
+            bad = not ok or latency >= self.slow_call
+            if self.state == HALF_OPEN:
+                self._probe_started = None
+                if bad:
+                    self._open(now)
+                else:
+                    self.state = CLOSED
+                    self.open_until = None
+                    self._outcomes.clear()
+                return
+            if self.state == OPEN:
+                return  # Sent before the circuit opened
+            self._outcomes.append(bad)
+            if len(self._outcomes) >= self.min_calls and self._rate() >= self.failure_rate:
+                self._open(now)
+
+    def snapshot(self) -> CircuitSnapshot:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return CircuitSnapshot(
+                state=self.state,
+                recent_calls=len(self._outcomes),
+                failure_rate=self._rate(),
+                open_until=self.open_until,
+                latency_p50=percentile(latencies, 0.50),
+                latency_p95=percentile(latencies, 0.95),
+                latency_p99=percentile(latencies, 0.99)
+            )
+
+    def _rate(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def _open(self, now: datetime):
+        self.state = OPEN
+        self.open_until = now + self.cooldown
+
+
+class WebhookHealth:
+    def __init__(self, **breaker_options):
+        self.breaker_options = breaker_options
+        self._breakers: Dict[int, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, webhook_id: int) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(webhook_id)
+            if breaker is None:
+                breaker = self._breakers[webhook_id] = CircuitBreaker(**self.breaker_options)
+            return breaker
+
+    def snapshot(self, webhook_id: int) -> CircuitSnapshot:
+        return self.breaker(webhook_id).snapshot()
+
+    def forget(self, webhook_id: int):
+        with self._lock:
+            self._breakers.pop(webhook_id, None)
+
+    def open_circuits(self) -> int:
+        with self._lock:
+            return sum(breaker.state != CLOSED for breaker in self._breakers.values())
+
+
+webhook_health = WebhookHealth(
+    window=settings.WEBHOOK_BREAKER_WINDOW,
+    min_calls=settings.WEBHOOK_BREAKER_MIN_CALLS,
+    failure_rate=settings.WEBHOOK_BREAKER_FAILURE_RATE,
+    slow_call=settings.WEBHOOK_BREAKER_SLOW_CALL,
+    cooldown=settings.WEBHOOK_BREAKER_COOLDOWN,
+    latency_samples=settings.WEBHOOK_LATENCY_SAMPLES
+)
+
+Gauge("webhook_circuits_open", "Webhooks whose circuit is open or half-open", callback=webhook_health.open_circuits)
+
@@ -0,0 +1,180 @@
+# backend/app/services/webhook_log.py
+# Buffered log of webhook delivery attempts.
+#
+# Delivery workers record each call here instead of updating the webhook's
+# statistics in their own transaction. Every WEBHOOK_LOG_FLUSH_INTERVAL
+# seconds, or sooner once WEBHOOK_LOG_BATCH calls are waiting, the buffer is
+# written in a single transaction: the attempts as one executemany insert and
+# the counters as one atomic increment per webhook. Statistics therefore lag
+# the deliveries by up to a flush interval. While the database cannot be
+# written the buffer holds at most WEBHOOK_LOG_MAX_BUFFERED attempts, dropping
+# the oldest; the webhook's counters then miss the calls dropped.
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, insert, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.metrics import Counter, Gauge
+from app.models.webhook import WebhookConfig, WebhookDeliveryAttempt
+from app.services.webhook_health import percentile
+
+logger = logging.getLogger(__name__)
+
+DELIVERED = "delivered"
+FAILED = "failed"
+SHORT_CIRCUITED = "short_circuited"
+
+log_flushes = Counter("webhook_log_flushes_total", "Batched writes of the webhook delivery log")
+log_dropped = Counter("webhook_log_dropped_total", "Delivery attempts dropped from a full webhook delivery log")
+
+
+class DeliveryLog:
+    def __init__(self, flush_interval: float, batch_size: int, max_buffered: int):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffered = max_buffered
+        self._buffer: List[dict] = []
+        self._full = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def record(
+        self,
+        webhook_id: int,
+        outbox_id: int,
+        attempt: int,
+        status: str,
+        latency: Optional[float] = None,
+        response_code: Optional[int] = None,
+        error: Optional[str] = None,
+        events: int = 1
+    ):
+        self._buffer.append({
+            "webhook_id": webhook_id,
+            "outbox_id": outbox_id,
+            "events": events,
+            "attempt": attempt,
+            "status": status,
+            "response_code": response_code,
+            "latency": latency,
+            "error": error,
+            "created_at": datetime.utcnow()
+        })
+        self._trim()
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+
+    def _trim(self):
+        """Drop the oldest attempts past max_buffered"""
+        excess = len(self._buffer) - self.max_buffered
+        if excess > 0:
+            del self._buffer[:excess]
+            log_dropped.inc(excess)
+
+    def start(self):
+        if self._flusher is not None:
+            return
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the periodic flush and write what is still buffered"""
+        if self._flusher is not None:
+            self._stopping = True
+            self._full.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Writing the webhook delivery log failed")
+
+    async def flush(self) -> int:
+        """Write the buffered attempts and their counters; returns how many were written"""
+        if not self._buffer:
+            return 0
+        entries, self._buffer = self._buffer, []
+        try:
+            async with SessionLocal() as db:
+                # Webhooks deleted since the call take their attempts with them
+                existing = set((await db.scalars(
+                    select(WebhookConfig.id).where(WebhookConfig.id.in_({entry["webhook_id"] for entry in entries}))
+                )).all())
+                logged = [entry for entry in entries if entry["webhook_id"] in existing]
+                if logged:
+                    await db.execute(insert(WebhookDeliveryAttempt), logged)
+
+                for webhook_id, (calls, successes, last_success) in _totals(logged).items():
+                    values = {
+                        "total_calls": func.coalesce(WebhookConfig.total_calls, 0) + calls,
+                        "successful_calls": func.coalesce(WebhookConfig.successful_calls, 0) + successes,
+                        "failed_calls": func.coalesce(WebhookConfig.failed_calls, 0) + calls - successes
+                    }
+                    if last_success is not None:
+                        values["last_triggered"] = last_success
+                    await db.execute(
+                        update(WebhookConfig).where(WebhookConfig.id == webhook_id).values(**values),
+                        execution_options={"synchronize_session": False}
+                    )
+                await db.commit()
+        except Exception:
+            # Kept for the next flush rather than lost, as far as the buffer has room
+            self._buffer[:0] = entries
+            self._trim()
+            raise
+        log_flushes.inc()
+        return len(logged)
+
+
+def _totals(entries: List[dict]) -> Dict[int, Tuple[int, int, Optional[datetime]]]:
+    """Calls, successful calls and the last success per webhook"""
+    totals: Dict[int, Tuple[int, int, Optional[datetime]]] = {}
+    for entry in entries:
+        if entry["status"] == SHORT_CIRCUITED:
+            continue  # No call was made
+        calls, successes, last_success = totals.get(entry["webhook_id"], (0, 0, None))
+        if entry["status"] == DELIVERED:
+            successes += 1
+            last_success = entry["created_at"]
+        totals[entry["webhook_id"]] = (calls + 1, successes, last_success)
+    return totals
+
+
+async def latency_percentiles(db: AsyncSession, webhook_id: int) -> Tuple[Optional[float], ...]:
+    """p50, p95 and p99 call latency over the webhook's last logged calls"""
+    recent = (
+        select(WebhookDeliveryAttempt.latency)
+        .where(WebhookDeliveryAttempt.webhook_id == webhook_id, WebhookDeliveryAttempt.latency.is_not(None))
+        .order_by(WebhookDeliveryAttempt.id.desc())
+        .limit(settings.WEBHOOK_STATS_SAMPLES)
+    )
+    latencies = sorted((await db.scalars(recent)).all())
+    return tuple(percentile(latencies, fraction) for fraction in (0.50, 0.95, 0.99))
+
+
+delivery_log = DeliveryLog(
+    flush_interval=settings.WEBHOOK_LOG_FLUSH_INTERVAL,
+    batch_size=settings.WEBHOOK_LOG_BATCH,
+    max_buffered=settings.WEBHOOK_LOG_MAX_BUFFERED
+)
+
+Gauge("webhook_log_buffered", "Webhook delivery attempts waiting to be written", callback=lambda: delivery_log.buffered)
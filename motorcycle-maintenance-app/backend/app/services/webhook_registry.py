@@ -0,0 +1,123 @@
+# backend/app/services/webhook_registry.py
+# Process-local index of webhook subscriptions.
+#
+# Active webhook configs are loaded once and normalised into an
+# event_type -> subscribers map, so routing an event is a dict lookup with
+# no query and no JSON parsing. Committed writes to webhook_configs drop the
+# index (see app.core.change_tracking) and the next event reloads it; the TTL
+# bounds staleness for writes made by other processes.
+
+import json
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.change_tracking import Changes, on_commit
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.models.webhook import WebhookConfig
+
+registry_loads = Counter("webhook_registry_loads_total", "Webhook subscription index rebuilds")
+
+
+class WebhookTarget(NamedTuple):
+    """What delivery needs to know about an active webhook"""
+    id: int
+    name: str
+    url: str
+    max_retries: int
+    retry_delay: int
+    coalesce_window: int  # seconds; 0 when events are sent one by one
+    coalesce_max_batch: int
+
+
+class _Index(NamedTuple):
+    routes: Dict[str, Tuple[WebhookTarget, ...]]  # Subscribers per named event type
+    catch_all: Tuple[WebhookTarget, ...]  # Webhooks without an event type filter
+    by_id: Dict[int, WebhookTarget]
+    expires_at: float
+
+
+class WebhookRegistry:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._index: Optional[_Index] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._index = None
+
+    async def subscribers(self, db: AsyncSession, event_type: str) -> Tuple[WebhookTarget, ...]:
+        """Active webhooks subscribed to an event type"""
+        index = await self._current(db)
+        return index.routes.get(event_type, index.catch_all)
+
+    async def get(self, db: AsyncSession, webhook_id: int) -> Optional[WebhookTarget]:
+        """An active webhook by id; None once it is disabled or removed"""
+        return (await self._current(db)).by_id.get(webhook_id)
+
+    async def _current(self, db: AsyncSession) -> _Index:
+        index = self._index
+        if index is not None and index.expires_at >= time.monotonic():
+            return index
+
+        generation = self._generation
+        webhooks = (await db.execute(
+            select(
+                WebhookConfig.id,
+                WebhookConfig.name,
+                WebhookConfig.url,
+                WebhookConfig.max_retries,
+                WebhookConfig.retry_delay,
+                WebhookConfig.coalesce_window,
+                WebhookConfig.coalesce_max_batch,
+                WebhookConfig.event_types
+            ).where(WebhookConfig.is_active == True).order_by(WebhookConfig.id)
+        )).all()
+        registry_loads.inc()
+
+        by_id = {}
+        subscriptions: Dict[str, list] = {}
+        catch_all = []
+        for webhook in webhooks:
+            target = WebhookTarget(
+                webhook.id, webhook.name, webhook.url, webhook.max_retries or 0, webhook.retry_delay or 0,
+                webhook.coalesce_window or 0, max(webhook.coalesce_max_batch or 1, 1)
+            )
+            by_id[target.id] = target
+            if not webhook.event_types:
+                catch_all.append(target)
+                continue
+            for event_type in set(json.loads(webhook.event_types)):
+                subscriptions.setdefault(event_type, []).append(target)
+
+        # Every named route also reaches the catch-all webhooks
+        index = _Index(
+            routes={
+                event_type: tuple(sorted(targets + catch_all, key=lambda target: target.id))
+                for event_type, targets in subscriptions.items()
+            },
+            catch_all=tuple(catch_all),
+            by_id=by_id,
+            expires_at=time.monotonic() + self.ttl
+        )
+        with self._lock:
+            # A write committed while loading makes this snapshot stale already
+            if generation == self._generation:
+                self._index = index
+        return index
+
+
+webhook_registry = WebhookRegistry(ttl=settings.WEBHOOK_REGISTRY_TTL)
+
+
+@on_commit
+def _invalidate_registry(changes: Changes):
+    if WebhookConfig.__tablename__ in changes:
+        webhook_registry.invalidate()
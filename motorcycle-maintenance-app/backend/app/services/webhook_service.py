@@ -1,63 +1,58 @@
-import httpx
 import json
-from typing import Dict, Any, List
-from datetime import datetime
-from sqlalchemy.orm import Session
+from typing import Dict, Any, List, Optional, Sequence
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.webhook import WebhookConfig
-from app.core.config import settings
+from app.models.webhook import WebhookConfig, WebhookEvent, WebhookOutbox
+from app.services.webhook_registry import webhook_registry
 
 
 class WebhookService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def send_webhook(self, event_type: str, data: Dict[Any, Any]):
-        """Send webhook notifications for a specific event type"""
-        webhooks = self.db.query(WebhookConfig).filter(
-            WebhookConfig.is_active == True
-        ).all()
-        
-        for webhook in webhooks:
-            if self._should_trigger_webhook(webhook, event_type):
-                await self._send_single_webhook(webhook, event_type, data)
+    async def send_webhook(
+        self,
+        event_type: str,
+        data: Dict[Any, Any],
+        webhooks: Optional[Sequence[WebhookConfig]] = None
+    ) -> List[WebhookOutbox]:
+        """Queue webhook notifications for a specific event type.
 
-    def _should_trigger_webhook(self, webhook: WebhookConfig, event_type: str) -> bool:
-        """Check if webhook should be triggered for this event type"""
-        if not webhook.event_types:
-            return True
-        
-        event_types = json.loads(webhook.event_types)
-        return event_type in event_types
+        Goes to the event's subscribers, or to the given webhooks regardless
+        of their filter. The deliveries are added to the caller's session, so
+        they are stored when the caller commits the change that raised the
+        event; the webhook workers (app.services.webhook_delivery) send them
+        after that. Webhooks with a coalesce_window get theirs once the window
+        ends, batched with the other events of the type raised meanwhile.
+        """
+        if webhooks is None:
+            webhooks = await webhook_registry.subscribers(self.db, event_type)
+        if not webhooks:
+            return []
 
-    async def _send_single_webhook(self, webhook: WebhookConfig, event_type: str, data: Dict[Any, Any]):
-        """Send a single webhook notification"""
-        payload = {
-            "event_type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
-            "data": data
-        }
-        
-        try:
-            async with httpx.AsyncClient(timeout=settings.WEBHOOK_TIMEOUT) as client:
-                response = await client.post(
-                    webhook.url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                
-                # Update statistics
-                webhook.total_calls += 1
-                webhook.successful_calls += 1
-                webhook.last_triggered = datetime.utcnow()
-                self.db.commit()
-                
-        except Exception as e:
-            webhook.total_calls += 1
-            webhook.failed_calls += 1
-            self.db.commit()
-            print(f"Webhook failed for {webhook.name}: {str(e)}")
+        # Encoded once; every subscriber's delivery sends the same bytes
+        now = datetime.utcnow()
+        event = WebhookEvent(
+            event_type=event_type,
+            payload=json.dumps({
+                "event_type": event_type,
+                "timestamp": now.isoformat(),
+                "data": data
+            }, default=str).encode()
+        )
+        deliveries = [
+            WebhookOutbox(
+                webhook_id=webhook.id,
+                event=event,
+                status="pending",
+                attempts=0,
+                next_attempt_at=now + timedelta(seconds=webhook.coalesce_window or 0)
+            )
+            for webhook in webhooks
+        ]
+        self.db.add_all(deliveries)
+        return deliveries
 
     async def trigger_maintenance_due(self, motorcycle_data: Dict, maintenance_data: Dict):
         """Trigger webhook for maintenance due events"""
@@ -71,4 +66,4 @@ class WebhookService:
         await self.send_webhook("service_completed", {
             "motorcycle": motorcycle_data,
             "service": service_data
-        })
\ No newline at end of file
+        })
@@ -0,0 +1,47 @@
+# backend/benchmarks/concurrent_requests.py
+# Latency of concurrent API reads against the in-process ASGI app.
+#
+# Run from the backend directory against a scratch database:
+#   DATABASE_URL=sqlite:///./data/bench.db python -m benchmarks.concurrent_requests
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.main import app
+
+
+async def _timed_get(client: httpx.AsyncClient, path: str) -> float:
+    start = time.perf_counter()
+    response = await client.get(path)
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Concurrent request latency benchmark")
+    parser.add_argument("--path", default="/api/v1/dashboard/stats")
+    parser.add_argument("--levels", default="1,4,16,64")
+    args = parser.parse_args()
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _timed_get(client, args.path)  # warm up
+
+            print(f"{'in-flight':>10}{'p50 ms':>10}{'max ms':>10}{'wall ms':>10}")
+            for level in (int(value) for value in args.levels.split(",")):
+                start = time.perf_counter()
+                latencies = await asyncio.gather(*[_timed_get(client, args.path) for _ in range(level)])
+                wall = time.perf_counter() - start
+                print(
+                    f"{level:>10}{statistics.median(latencies) * 1000:>10.1f}"
+                    f"{max(latencies) * 1000:>10.1f}{wall * 1000:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
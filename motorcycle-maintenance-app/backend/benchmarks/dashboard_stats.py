@@ -0,0 +1,116 @@
+# backend/benchmarks/dashboard_stats.py
+# Latency of GET /dashboard/stats as the fleet grows, next to the previous
+# row-loading implementation for reference.
+#
+# Run from the backend directory:
+#   python -m benchmarks.dashboard_stats --fleets 100,1000,5000 --records-per-bike 20
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, func, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.v1.endpoints.dashboard import get_dashboard_stats
+from app.core.database import Base, build_engines
+from app.models import Motorcycle, MaintenanceRecord
+from app.models.maintenance import ServiceType
+
+
+async def _seed(engine, bikes: int, records_per_bike: int):
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Motorcycle), [
+            {
+                "name": f"Bike {i}", "make": "Bench", "model": "Mark", "year": 2020,
+                "current_mileage": float(i * 100), "is_active": i % 10 != 0, "is_archived": False
+            }
+            for i in range(bikes)
+        ])
+        await conn.execute(insert(MaintenanceRecord), [
+            {
+                "motorcycle_id": bike + 1,
+                "service_type": ServiceType.OIL_CHANGE,
+                "service_name": "Oil change",
+                "performed_at": now - timedelta(days=record * 7),
+                "mileage_at_service": float(record * 1000),
+                "next_service_date": now + timedelta(days=90 - record * 7),
+                "total_cost": 80.0,
+                "is_completed": True
+            }
+            for bike in range(bikes)
+            for record in range(records_per_bike)
+        ])
+
+
+async def _row_loading_stats(db):
+    """The previous implementation: load active bikes and recent records into Python"""
+    now = datetime.utcnow()
+    await db.scalar(select(func.count(Motorcycle.id)))
+    await db.scalar(select(func.count(Motorcycle.id)).where(
+        Motorcycle.is_active == True, Motorcycle.is_archived == False
+    ))
+    active_bikes = (await db.scalars(select(Motorcycle).where(
+        Motorcycle.is_active == True, Motorcycle.is_archived == False
+    ))).all()
+    sum(bike.current_mileage or 0 for bike in active_bikes)
+    await db.scalar(select(func.count(MaintenanceRecord.id)).where(
+        MaintenanceRecord.next_service_date >= now.date(),
+        MaintenanceRecord.next_service_date <= (now + timedelta(days=30)).date()
+    ))
+    await db.scalar(select(func.count(MaintenanceRecord.id)).where(
+        MaintenanceRecord.next_service_date < now.date()
+    ))
+    records = (await db.scalars(select(MaintenanceRecord).where(
+        MaintenanceRecord.performed_at >= now - timedelta(days=30),
+        MaintenanceRecord.is_completed == True
+    ))).all()
+    sum(record.total_cost or 0 for record in records)
+
+
+async def _median_ms(session_factory, call, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            await call(db)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+async def run_fleet(bikes: int, records_per_bike: int, iterations: int) -> dict:
+    path = os.path.join(tempfile.mkdtemp(prefix="rideway-bench-"), "bench.db")
+    engine, _ = build_engines(f"sqlite:///{path}")
+    await _seed(engine, bikes, records_per_bike)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    result = {
+        "bikes": bikes,
+        "aggregate_ms": await _median_ms(session_factory, lambda db: get_dashboard_stats(db=db), iterations),
+        "row_loading_ms": await _median_ms(session_factory, _row_loading_stats, iterations)
+    }
+    await engine.dispose()
+    return result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Dashboard stats latency by fleet size")
+    parser.add_argument("--fleets", default="100,1000,5000")
+    parser.add_argument("--records-per-bike", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'bikes':>8}{'aggregate ms':>15}{'row-loading ms':>17}")
+    for bikes in (int(value) for value in args.fleets.split(",")):
+        result = await run_fleet(bikes, args.records_per_bike, args.iterations)
+        print(f"{result['bikes']:>8}{result['aggregate_ms']:>15.2f}{result['row_loading_ms']:>17.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
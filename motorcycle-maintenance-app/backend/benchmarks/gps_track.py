@@ -0,0 +1,58 @@
+# backend/benchmarks/gps_track.py
+# Storage and simplification cost of a recorded GPS track: the packed blob
+# of each level of detail next to the same points as JSON, and the time to
+# encode, decode and simplify them.
+#
+# Run from the backend directory:
+#   python -m benchmarks.gps_track --points 10000,100000
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.gps_track import SCALE, decode_track, encode_track, track_levels
+
+
+def _ride(count: int, seed: int = 1) -> np.ndarray:
+    """A 1 Hz recording at 72 km/h along a wandering road"""
+    rng = np.random.default_rng(seed)
+    heading = np.cumsum(rng.normal(0, 0.05, count))
+    step = 20 / 111_000  # Degrees of latitude in 20 meters
+    latitude = 52.0 + np.cumsum(np.cos(heading) * step)
+    longitude = 5.0 + np.cumsum(np.sin(heading) * step / np.cos(np.radians(52.0)))
+    return np.column_stack((latitude, longitude))
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GPS track blob size and simplification cost")
+    parser.add_argument("--points", default="10000,100000")
+    args = parser.parse_args()
+
+    for count in (int(value) for value in args.points.split(",")):
+        points = _ride(count)
+        json_size = len(json.dumps(np.round(points, 5).tolist()))
+        simplify_ms, levels = _timed(track_levels, points, settings.GPS_TRACK_TOLERANCES)
+        print(f"{count} points, {json_size / 1024:.1f} KiB as JSON, simplified in {simplify_ms:.1f} ms")
+        print(f"{'level':>8}{'tolerance':>12}{'points':>10}{'KiB':>10}{'encode ms':>12}{'decode ms':>12}")
+        for level in levels:
+            encode_ms, blob = _timed(encode_track, level.points)
+            decode_ms, decoded = _timed(decode_track, blob)
+            assert np.abs(decoded - level.points).max() <= 0.5 / SCALE + 1e-12
+            print(
+                f"{level.level:>8}{level.tolerance:>12.1f}{len(level.points):>10}"
+                f"{len(blob) / 1024:>10.1f}{encode_ms:>12.2f}{decode_ms:>12.2f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# backend/benchmarks/list_pagination.py
+# Cost of a page of GET /logs/ by depth: skip/limit (OFFSET) next to the
+# keyset cursor, for one motorcycle with a long ride history.
+#
+# Run from the backend directory:
+#   python -m benchmarks.list_pagination --rides 50000 --pages 1,100,450
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.v1.endpoints.logs import RIDE_LOG_KEYSET
+from app.core.database import Base, build_engines
+from app.core.pagination import paginate
+from app.models import Motorcycle, RideLog
+
+
+async def _session_factory(rides: int):
+    path = os.path.join(tempfile.mkdtemp(prefix="rideway-bench-"), "bench.db")
+    engine, _ = build_engines(f"sqlite:///{path}")
+    start = datetime(2020, 1, 1)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Motorcycle), [{
+            "name": "Bench", "make": "Bench", "model": "Mark", "year": 2020,
+            "current_mileage": 1000.0, "is_active": True, "is_archived": False
+        }])
+        await conn.execute(insert(RideLog), [{
+            "motorcycle_id": 1,
+            "start_date": start + timedelta(hours=ride * 10),
+            "start_mileage": 1000.0 + ride * 40,
+            "end_mileage": 1040.0 + ride * 40,
+            "distance": 40.0,
+            "trip_type": "Commute"
+        } for ride in range(rides)])
+    return engine, async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+async def _timed(db, query, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = (await db.scalars(query)).all()
+    return (time.perf_counter() - start) / repeat * 1000, rows
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="GET /logs/ page cost by depth, OFFSET vs. keyset cursor")
+    parser.add_argument("--rides", type=int, default=50000)
+    parser.add_argument("--pages", default="1,100,450")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine, session_factory = await _session_factory(args.rides)
+    base = select(RideLog).where(RideLog.motorcycle_id == 1)
+    print(f"{'page':>8}{'offset ms':>12}{'cursor ms':>12}")
+    async with session_factory() as db:
+        for number in (int(value) for value in args.pages.split(",")):
+            skip = (number - 1) * args.limit
+            offset_ms, rows = await _timed(db, paginate(base, RIDE_LOG_KEYSET, None, skip, args.limit), args.repeat)
+
+            # The cursor the previous page would have handed out
+            cursor = None
+            if skip:
+                previous = (await db.scalars(paginate(base, RIDE_LOG_KEYSET, None, skip - 1, 1))).first()
+                cursor = RIDE_LOG_KEYSET.encode(previous)
+            cursor_ms, keyed = await _timed(db, paginate(base, RIDE_LOG_KEYSET, cursor, 0, args.limit), args.repeat)
+            assert [log.id for log in keyed] == [log.id for log in rows]
+            print(f"{number:>8}{offset_ms:>12.2f}{cursor_ms:>12.2f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
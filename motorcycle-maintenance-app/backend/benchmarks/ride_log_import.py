@@ -0,0 +1,94 @@
+# backend/benchmarks/ride_log_import.py
+# Time to load a rider's history: the bulk CSV import next to one
+# POST /logs/ call per ride (the previous way in).
+#
+# Run from the backend directory:
+#   python -m benchmarks.ride_log_import --rides 1000,5000
+
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.v1.endpoints.logs import create_ride_log
+from app.core.database import Base, build_engines
+from app.models import Motorcycle
+from app.schemas.logs import LogCreate
+from app.services.ride_log_import import RideLogImporter, read_csv
+
+COLUMNS = ("motorcycle_id", "start_date", "start_mileage", "end_mileage", "fuel_consumed", "fuel_cost", "trip_type")
+
+
+def _rides(count: int):
+    start = datetime(2020, 1, 1)
+    for ride in range(count):
+        yield {
+            "motorcycle_id": 1,
+            "start_date": (start + timedelta(hours=ride * 10)).isoformat(),
+            "start_mileage": 1000.0 + ride * 40,
+            "end_mileage": 1040.0 + ride * 40,
+            "fuel_consumed": 2.0,
+            "fuel_cost": 3.5,
+            "trip_type": "Commute"
+        }
+
+
+async def _session_factory():
+    path = os.path.join(tempfile.mkdtemp(prefix="rideway-bench-"), "bench.db")
+    engine, _ = build_engines(f"sqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Motorcycle), [{
+            "name": "Bench", "make": "Bench", "model": "Mark", "year": 2020,
+            "current_mileage": 1000.0, "is_active": True, "is_archived": False
+        }])
+    return engine, async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+async def one_by_one(count: int) -> float:
+    engine, session_factory = await _session_factory()
+    start = time.perf_counter()
+    async with session_factory() as db:
+        for ride in _rides(count):
+            await create_ride_log(LogCreate(**ride), db=db)
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed
+
+
+async def bulk(count: int, batch_size: int) -> float:
+    engine, session_factory = await _session_factory()
+    lines = [",".join(COLUMNS)]
+    lines.extend(",".join(str(ride[column]) for column in COLUMNS) for ride in _rides(count))
+    upload = io.BytesIO("\n".join(lines).encode())
+
+    start = time.perf_counter()
+    async with session_factory() as db:
+        async for _ in RideLogImporter(db, batch_size).run(read_csv(upload)):
+            pass
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Ride log import time, bulk vs. one request per ride")
+    parser.add_argument("--rides", default="1000,5000")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'rides':>8}{'bulk s':>10}{'one-by-one s':>15}")
+    for count in (int(value) for value in args.rides.split(",")):
+        bulk_seconds = await bulk(count, args.batch_size)
+        single_seconds = await one_by_one(count)
+        print(f"{count:>8}{bulk_seconds:>10.2f}{single_seconds:>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
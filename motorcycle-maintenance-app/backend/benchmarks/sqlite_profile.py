@@ -0,0 +1,93 @@
+# backend/benchmarks/sqlite_profile.py
+# Mixed read/write throughput for the default and production database profiles.
+#
+# Run from the backend directory:
+#   python -m benchmarks.sqlite_profile --seconds 10 --readers 8 --writers 2
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.database import Base, build_engines
+from app.models import Motorcycle, RideLog
+
+
+async def _seed(session_factory, bikes: int = 50):
+    async with session_factory() as db:
+        for i in range(bikes):
+            db.add(Motorcycle(name=f"Bike {i}", make="Bench", model="Mark", year=2020, current_mileage=0.0))
+        await db.commit()
+
+
+async def _writer(session_factory, deadline: float, counter: list, bikes: int):
+    i = 0
+    async with session_factory() as db:
+        while time.perf_counter() < deadline:
+            i += 1
+            db.add(RideLog(
+                motorcycle_id=(i % bikes) + 1,
+                start_date=datetime.utcnow(),
+                start_mileage=float(i),
+                end_mileage=float(i + 25),
+                distance=25.0
+            ))
+            await db.commit()
+            counter[0] += 1
+
+
+async def _reader(session_factory, deadline: float, counter: list):
+    async with session_factory() as db:
+        while time.perf_counter() < deadline:
+            await db.execute(select(func.count(RideLog.id), func.sum(RideLog.distance)))
+            (await db.scalars(select(Motorcycle).where(Motorcycle.is_active == True))).all()
+            await db.rollback()
+            counter[0] += 1
+
+
+async def run_profile(profile: str, seconds: float, readers: int, writers: int, bikes: int = 50) -> dict:
+    path = os.path.join(tempfile.mkdtemp(prefix="rideway-bench-"), "bench.db")
+    writer_engine, reader_engine = build_engines(f"sqlite:///{path}", profile)
+    async with writer_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    WriteSession = async_sessionmaker(bind=writer_engine, autoflush=False, expire_on_commit=False)
+    ReadSession = async_sessionmaker(bind=reader_engine, autoflush=False, expire_on_commit=False)
+    await _seed(WriteSession, bikes)
+
+    reads, writes = [0], [0]
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *[_writer(WriteSession, deadline, writes, bikes) for _ in range(writers)],
+        *[_reader(ReadSession, deadline, reads) for _ in range(readers)]
+    )
+
+    await writer_engine.dispose()
+    await reader_engine.dispose()
+    return {
+        "profile": profile,
+        "reads_per_sec": reads[0] / seconds,
+        "writes_per_sec": writes[0] / seconds
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="SQLite profile mixed read/write benchmark")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'reads/s':>12}{'writes/s':>12}")
+    for profile in ("default", "production"):
+        result = await run_profile(profile, args.seconds, args.readers, args.writers)
+        print(f"{result['profile']:<12}{result['reads_per_sec']:>12.1f}{result['writes_per_sec']:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+# backend/benchmarks/telemetry_ingest.py
+# Odometer samples per second against the in-process ASGI app: one
+# POST /motorcycles/{id}/mileage per sample (a commit each) next to
+# POST /motorcycles/{id}/telemetry batches, timed until the buffer is written.
+#
+# Run from the backend directory against a scratch database:
+#   DATABASE_URL=sqlite:///./data/bench.db python -m benchmarks.telemetry_ingest --samples 20000 --batches 1,100,1000
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+from app.main import app
+from app.services.telemetry import odometer_log
+
+
+async def _motorcycle(client: httpx.AsyncClient) -> int:
+    response = await client.post("/api/v1/motorcycles/", json={
+        "name": "Bench", "make": "Bench", "model": "Mark", "year": 2020, "current_mileage": 0.0
+    })
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def _per_call(client: httpx.AsyncClient, samples: int) -> float:
+    motorcycle_id = await _motorcycle(client)
+    start = time.perf_counter()
+    for sample in range(samples):
+        response = await client.post(f"/api/v1/motorcycles/{motorcycle_id}/mileage?new_mileage={sample * 0.02}")
+        response.raise_for_status()
+    return samples / (time.perf_counter() - start)
+
+
+async def _batched(client: httpx.AsyncClient, samples: int, batch: int) -> float:
+    motorcycle_id = await _motorcycle(client)
+    moment = datetime(2026, 1, 1)
+    start = time.perf_counter()
+    for first in range(0, samples, batch):
+        body = {"samples": [
+            {"recorded_at": (moment + timedelta(seconds=sample)).isoformat(), "mileage": sample * 0.02}
+            for sample in range(first, min(first + batch, samples))
+        ]}
+        response = await client.post(f"/api/v1/motorcycles/{motorcycle_id}/telemetry", json=body)
+        if response.status_code == 503:
+            await odometer_log.flush()
+            response = await client.post(f"/api/v1/motorcycles/{motorcycle_id}/telemetry", json=body)
+        response.raise_for_status()
+    await odometer_log.flush()
+    return samples / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Odometer ingestion: per-sample mileage calls vs. batched telemetry")
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--per-call-samples", type=int, default=1000)
+    parser.add_argument("--batches", default="1,100,1000")
+    args = parser.parse_args()
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{'mode':>24}{'samples/s':>12}")
+            rate = await _per_call(client, args.per_call_samples)
+            print(f"{'mileage call':>24}{rate:>12.0f}")
+            for batch in (int(value) for value in args.batches.split(",")):
+                rate = await _batched(client, args.samples, batch)
+                print(f"{f'telemetry, {batch} a call':>24}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+# backend/benchmarks/webhook_delivery.py
+# Webhook deliveries per second against a local stub receiver, with the
+# shared pooled client next to a fresh client per delivery (the previous
+# behaviour). The stub answers over plain HTTP, so the gap is the client
+# setup and TCP connect per call; TLS receivers add a handshake on top.
+#
+# Run from the backend directory:
+#   python -m benchmarks.webhook_delivery --deliveries 500 --concurrency 1,4,16
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.core.http_client import WebhookHttpClient
+
+PAYLOAD = json.dumps({
+    "event_type": "maintenance_due",
+    "timestamp": "2026-01-01T00:00:00",
+    "data": {"motorcycle": {"id": 1, "name": "Bench"}, "maintenance": {"id": 1, "service_type": "oil_change"}}
+})
+HEADERS = {"Content-Type": "application/json"}
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.1 receiver that keeps connections open"""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            writer.write(b"HTTP/1.1 204 No Content\r\nConnection: keep-alive\r\n\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run(post, url: str, deliveries: int, concurrency: int) -> float:
+    """Deliveries per second with `concurrency` workers sharing the work"""
+    remaining = iter(range(deliveries))
+
+    async def worker():
+        for _ in remaining:
+            response = await post(url)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return deliveries / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Webhook delivery throughput, pooled vs. unpooled")
+    parser.add_argument("--deliveries", type=int, default=500)
+    parser.add_argument("--concurrency", default="1,4,16")
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/hook"
+
+    async def unpooled(url):
+        async with httpx.AsyncClient(timeout=settings.WEBHOOK_TIMEOUT) as client:
+            return await client.post(url, content=PAYLOAD, headers=HEADERS)
+
+    print(f"{'workers':>8}{'pooled/s':>12}{'unpooled/s':>13}")
+    for concurrency in (int(value) for value in args.concurrency.split(",")):
+        client = WebhookHttpClient(
+            max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.WEBHOOK_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.WEBHOOK_KEEPALIVE_EXPIRY,
+            per_host_limit=max(concurrency, settings.WEBHOOK_PER_HOST_LIMIT),
+            connect_timeout=settings.WEBHOOK_CONNECT_TIMEOUT,
+            read_timeout=settings.WEBHOOK_READ_TIMEOUT,
+            timeout=settings.WEBHOOK_TIMEOUT
+        )
+        client.open()
+        pooled_rate = await _run(
+            lambda url: client.post(url, content=PAYLOAD, headers=HEADERS), url, args.deliveries, concurrency
+        )
+        await client.close()
+        unpooled_rate = await _run(unpooled, url, args.deliveries, concurrency)
+        print(f"{concurrency:>8}{pooled_rate:>12.0f}{unpooled_rate:>13.0f}")
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+# backend/tests/conftest.py
+# Runs the app against a scratch SQLite database in a temporary directory.
+#
+# Run from the backend directory:
+#   python -m pytest tests
+
+import os
+import tempfile
+
+import pytest
+
+# Before the app is imported: the engines are built from the settings
+_WORKDIR = tempfile.mkdtemp(prefix="rideway-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_WORKDIR, 'tests.db')}"
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    cwd = os.getcwd()
+    os.chdir(_WORKDIR)  # The lifespan creates data/ and static/ in the working directory
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def motorcycle(client):
+    response = client.post("/api/v1/motorcycles/", json={
+        "name": "Test", "make": "Test", "model": "Mark", "year": 2020, "current_mileage": 1000.0
+    })
+    response.raise_for_status()
+    return response.json()
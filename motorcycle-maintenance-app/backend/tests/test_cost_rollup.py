@@ -0,0 +1,84 @@
+# backend/tests/test_cost_rollup.py
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.cost_rollup import MonthlyCostRollup
+from app.services.cost_rollup_service import MAINTENANCE, CostRollupService
+
+
+def _maintenance(client, motorcycle_id: int, performed_at: str, labor: float, parts: float, **fields) -> dict:
+    response = client.post("/api/v1/maintenance/", json={
+        "motorcycle_id": motorcycle_id, "service_type": "oil_change", "service_name": "Oil",
+        "mileage_at_service": 1000, "performed_at": performed_at,
+        "labor_cost": labor, "parts_cost": parts, **fields
+    })
+    response.raise_for_status()
+    return response.json()
+
+
+def _part(client, motorcycle_id: int, **fields) -> dict:
+    response = client.post("/api/v1/parts/", json={"motorcycle_id": motorcycle_id, "name": "Filter", **fields})
+    response.raise_for_status()
+    return response.json()
+
+
+async def _rollups(motorcycle_id: int) -> list:
+    async with SessionLocal() as db:
+        rows = (await db.scalars(
+            select(MonthlyCostRollup)
+            .where(MonthlyCostRollup.motorcycle_id == motorcycle_id)
+            .order_by(MonthlyCostRollup.period, MonthlyCostRollup.source, MonthlyCostRollup.bucket)
+        )).all()
+    return [
+        (row.period, row.source, row.bucket, row.currency, row.record_count,
+         round(row.total_cost, 6), round(row.labor_cost, 6), round(row.parts_cost, 6), round(row.stock_value, 6))
+        for row in rows
+    ]
+
+
+async def _rebuild():
+    async with SessionLocal() as db:
+        await CostRollupService(db).rebuild()
+
+
+async def _summarize(motorcycle_id: int, start: datetime, end: datetime) -> dict:
+    async with SessionLocal() as db:
+        return await CostRollupService(db).summarize(MAINTENANCE, motorcycle_id, start_date=start, end_date=end)
+
+
+def test_incremental_rollup_matches_a_rebuild(client, motorcycle):
+    motorcycle_id = motorcycle["id"]
+    kept = _maintenance(client, motorcycle_id, "2025-03-10T09:00:00", 40, 25.5)
+    moved = _maintenance(client, motorcycle_id, "2025-03-20T09:00:00", 10, 5)
+    deleted = _maintenance(client, motorcycle_id, "2025-04-02T09:00:00", 70, 0, service_type="brake_service")
+    _maintenance(client, motorcycle_id, "2025-04-05T09:00:00", 15, 0, is_completed=False)
+    part = _part(client, motorcycle_id, category="Filters", unit_price=12.5, quantity_in_stock=4,
+                 total_cost=50, purchase_date="2025-03-01T00:00:00")
+    _part(client, motorcycle_id, unit_price=3, quantity_in_stock=2, total_cost=6)  # Undated, uncategorized
+
+    client.put(f"/api/v1/maintenance/{kept['id']}", json={"labor_cost": 45}).raise_for_status()
+    client.put(f"/api/v1/maintenance/{moved['id']}", json={"performed_at": "2025-05-01T09:00:00"}).raise_for_status()
+    client.delete(f"/api/v1/maintenance/{deleted['id']}").raise_for_status()
+    client.put(f"/api/v1/parts/{part['id']}", json={"quantity_in_stock": 1}).raise_for_status()
+
+    incremental = client.portal.call(_rollups, motorcycle_id)
+    assert ("2025-03", "maintenance", "oil_change", "EUR", 1, 70.5, 45.0, 25.5, 0.0) in incremental
+    assert ("0000-00", "parts", "Uncategorized", "EUR", 1, 6.0, 0.0, 0.0, 6.0) in incremental
+    assert not any(row[2] == "brake_service" for row in incremental)
+
+    client.portal.call(_rebuild)
+    assert client.portal.call(_rollups, motorcycle_id) == incremental
+
+
+def test_partial_months_are_summed_from_the_records(client, motorcycle):
+    motorcycle_id = motorcycle["id"]
+    for day, labor in ((5, 10), (20, 20)):
+        _maintenance(client, motorcycle_id, f"2025-06-{day:02d}T12:00:00", labor, 0)
+    _maintenance(client, motorcycle_id, "2025-07-15T12:00:00", 40, 0)
+    _maintenance(client, motorcycle_id, "2025-08-25T12:00:00", 80, 0)
+
+    totals = client.portal.call(_summarize, motorcycle_id, datetime(2025, 6, 10), datetime(2025, 8, 20))
+    assert totals["oil_change"]["record_count"] == 2
+    assert totals["oil_change"]["total_cost"] == 60
@@ -0,0 +1,114 @@
+# backend/tests/test_dashboard.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.core.cache import FLEET_SCOPE, ResponseCache, cache_hits
+from app.core.database import SessionLocal, get_read_db
+from app.main import app
+from app.schemas.maintenance import MaintenanceCreate
+from app.services.maintenance_service import MaintenanceService
+
+
+class _UnreachableSession:
+    async def _fail(self, *args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("database is locked"))
+
+    execute = scalars = scalar = get = _fail
+
+
+async def _unreachable_db():
+    yield _UnreachableSession()
+
+
+@pytest.mark.parametrize("path", ["/api/v1/dashboard/stats", "/api/v1/dashboard/maintenance-due"])
+def test_failed_dashboard_query_is_not_cached(client, motorcycle, path):
+    app.dependency_overrides[get_read_db] = _unreachable_db
+    try:
+        with pytest.raises(OperationalError):
+            client.get(path)
+    finally:
+        del app.dependency_overrides[get_read_db]
+
+    response = client.get(path)
+    assert response.status_code == 200
+    if path.endswith("/stats"):
+        assert response.json()["total_motorcycles"] >= 1
+
+
+def _hits(endpoint: str) -> float:
+    return dict(cache_hits.samples()).get((endpoint,), 0)
+
+
+def _service(client, motorcycle_id: int):
+    client.post("/api/v1/maintenance/", json={
+        "motorcycle_id": motorcycle_id, "service_type": "oil_change", "service_name": "Oil",
+        "mileage_at_service": 1000, "performed_at": "2025-03-01T09:00:00", "labor_cost": 30
+    }).raise_for_status()
+
+
+def test_writes_invalidate_only_the_motorcycles_they_touch(client, motorcycle):
+    other = client.post("/api/v1/motorcycles/", json={
+        "name": "Other", "make": "Test", "model": "Mark", "year": 2021, "current_mileage": 0.0
+    }).json()
+    overview = f"/api/v1/dashboard/motorcycle/{motorcycle['id']}"
+    assert client.get(overview).json()["recent_maintenance"] == []
+
+    hits = _hits("motorcycle-overview")
+    _service(client, other["id"])
+    assert client.get(overview).json()["recent_maintenance"] == []
+    assert _hits("motorcycle-overview") == hits + 1
+
+    stats = client.get("/api/v1/dashboard/stats").json()
+    _service(client, motorcycle["id"])
+    assert len(client.get(overview).json()["recent_maintenance"]) == 1
+    assert _hits("motorcycle-overview") == hits + 1
+    assert len(client.get("/api/v1/dashboard/stats").json()["recent_activities"]) == min(
+        len(stats["recent_activities"]) + 1, 10
+    )
+
+
+def test_value_computed_across_an_invalidation_is_not_stored():
+    cache = ResponseCache(ttl=60)
+    generation = cache.generation(FLEET_SCOPE)
+    cache.invalidate(FLEET_SCOPE)  # A write commits while the response is computed
+    cache.set(FLEET_SCOPE, ("stats",), {"stale": True}, generation)
+    assert cache.get(FLEET_SCOPE, ("stats",)) == (False, None)
+
+    cache.set(FLEET_SCOPE, ("stats",), {"stale": False}, cache.generation(FLEET_SCOPE))
+    assert cache.get(FLEET_SCOPE, ("stats",)) == (True, {"stale": False})
+
+
+async def _record(motorcycle_id: int, days_ago: int, interval_months: int, labor_cost: float):
+    async with SessionLocal() as db:
+        await MaintenanceService(db).create_maintenance_record(MaintenanceCreate(
+            motorcycle_id=motorcycle_id, service_type="oil_change", service_name="Oil", mileage_at_service=0,
+            performed_at=datetime.utcnow() - timedelta(days=days_ago),
+            service_interval_months=interval_months, labor_cost=labor_cost
+        ))
+
+
+def test_stats_count_active_bikes_due_services_and_recent_costs(client):
+    before = client.get("/api/v1/dashboard/stats").json()
+    bikes = [
+        client.post("/api/v1/motorcycles/", json={
+            "name": f"Stats {number}", "make": "Test", "model": "Mark", "year": 2020, "current_mileage": 500.0
+        }).json()["id"]
+        for number in range(3)
+    ]
+    client.delete(f"/api/v1/motorcycles/{bikes[2]}").raise_for_status()  # Archived: counted, not active
+    # Only the last 30 days count towards the expenses
+    client.portal.call(_record, bikes[0], 40, 1, 25)  # Ten days overdue
+    client.portal.call(_record, bikes[1], 10, 1, 40)  # Due in twenty days
+    client.portal.call(_record, bikes[1], 20, 12, 15)  # Superseded by the one above
+
+    after = client.get("/api/v1/dashboard/stats").json()
+    changes = {key: after[key] - before[key] for key in (
+        "total_motorcycles", "active_motorcycles", "total_mileage",
+        "upcoming_services", "overdue_services", "monthly_expenses"
+    )}
+    assert changes == {
+        "total_motorcycles": 3, "active_motorcycles": 2, "total_mileage": 1000,
+        "upcoming_services": 1, "overdue_services": 1, "monthly_expenses": 55
+    }
@@ -0,0 +1,45 @@
+# backend/tests/test_database.py
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import build_engines
+
+
+async def _pragmas(url: str):
+    writer, reader = build_engines(url, "production")
+    try:
+        async with writer.begin() as connection:
+            await connection.execute(text("CREATE TABLE notes (body TEXT)"))
+            writer_pragmas = [
+                (await connection.execute(text(f"PRAGMA {name}"))).scalar()
+                for name in ("journal_mode", "foreign_keys", "query_only")
+            ]
+        async with reader.connect() as connection:
+            reader_pragmas = [
+                (await connection.execute(text(f"PRAGMA {name}"))).scalar()
+                for name in ("journal_mode", "foreign_keys", "query_only")
+            ]
+            with pytest.raises(OperationalError, match="readonly"):
+                await connection.execute(text("INSERT INTO notes VALUES ('x')"))
+        return writer_pragmas, reader_pragmas, writer.pool.size(), writer.pool._max_overflow
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+def test_production_profile_splits_a_single_writer_from_read_only_readers(client):
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='rideway-profile-'), 'profile.db')}"
+    writer_pragmas, reader_pragmas, pool_size, overflow = client.portal.call(_pragmas, url)
+    assert writer_pragmas == ["wal", 1, 0]
+    assert reader_pragmas == ["wal", 1, 1]
+    assert (pool_size, overflow) == (1, 0)
+
+
+def test_default_profile_shares_one_engine():
+    writer, reader = build_engines("sqlite:///:memory:")
+    assert writer is reader
+    assert writer.url.drivername == "sqlite+aiosqlite"
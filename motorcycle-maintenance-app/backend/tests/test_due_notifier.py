@@ -0,0 +1,58 @@
+# backend/tests/test_due_notifier.py
+from datetime import datetime, timedelta
+
+from app.core.database import SessionLocal
+from app.models.maintenance import MaintenanceRecord
+from app.schemas.maintenance import MaintenanceCreate
+from app.services.due_notifier import DueNotifier
+from app.services.maintenance_service import MaintenanceService
+from app.services.webhook_service import WebhookService
+
+
+async def _service(motorcycle_id: int, days_ago: int, interval_months: int) -> int:
+    async with SessionLocal() as db:
+        record = await MaintenanceService(db).create_maintenance_record(MaintenanceCreate(
+            motorcycle_id=motorcycle_id, service_type="brake_service", service_name="Brakes",
+            mileage_at_service=1000, performed_at=datetime.utcnow() - timedelta(days=days_ago),
+            service_interval_months=interval_months
+        ))
+        return record.id
+
+
+async def _bring_forward(record_id: int):
+    async with SessionLocal() as db:
+        record = await db.get(MaintenanceRecord, record_id)
+        record.next_service_date = datetime.utcnow() - timedelta(days=1)
+        await db.commit()
+
+
+async def _notify(motorcycle_id: int):
+    async with SessionLocal() as db:
+        return await DueNotifier(db).notify("scan", keys=[(motorcycle_id, "brake_service", "")])
+
+
+def test_each_due_point_is_notified_once(client, motorcycle, monkeypatch):
+    sent = []
+
+    async def trigger_maintenance_due(self, motorcycle_data, maintenance_data):
+        sent.append((maintenance_data["id"], maintenance_data["due_date"]))
+
+    monkeypatch.setattr(WebhookService, "trigger_maintenance_due", trigger_maintenance_due)
+    motorcycle_id = motorcycle["id"]
+
+    overdue = client.portal.call(_service, motorcycle_id, 40, 1)
+    assert client.portal.call(_notify, motorcycle_id) == (1, 1)
+    assert client.portal.call(_notify, motorcycle_id) == (1, 0)
+
+    # Serviced again: the new due point is a year out
+    latest = client.portal.call(_service, motorcycle_id, 0, 12)
+    assert client.portal.call(_notify, motorcycle_id) == (1, 0)
+
+    # A due point moved into the notice window goes out again
+    client.portal.call(_bring_forward, latest)
+    assert client.portal.call(_notify, motorcycle_id) == (1, 1)
+    assert client.portal.call(_notify, motorcycle_id) == (1, 0)
+    assert [record_id for record_id, _ in sent] == [overdue, latest]
+
+    client.delete(f"/api/v1/motorcycles/{motorcycle_id}").raise_for_status()  # Archived
+    assert client.portal.call(_notify, motorcycle_id) == (0, 0)
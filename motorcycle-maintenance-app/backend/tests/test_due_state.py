@@ -0,0 +1,55 @@
+# backend/tests/test_due_state.py
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.due_state import MaintenanceDueState
+from app.services.due_state_service import DueStateService
+
+
+def _maintenance(client, motorcycle_id: int, service_type: str, service_name: str, performed_at: str) -> dict:
+    response = client.post("/api/v1/maintenance/", json={
+        "motorcycle_id": motorcycle_id, "service_type": service_type, "service_name": service_name,
+        "mileage_at_service": 1000, "performed_at": performed_at
+    })
+    response.raise_for_status()
+    return response.json()
+
+
+async def _due_states(motorcycle_id: int) -> dict:
+    async with SessionLocal() as db:
+        rows = (await db.scalars(
+            select(MaintenanceDueState).where(MaintenanceDueState.motorcycle_id == motorcycle_id)
+        )).all()
+    return {(row.service_type, row.service_key): (row.record_id, row.service_name) for row in rows}
+
+
+async def _rebuild():
+    async with SessionLocal() as db:
+        await DueStateService(db).rebuild()
+
+
+def test_due_state_follows_the_latest_completed_record(client, motorcycle):
+    motorcycle_id = motorcycle["id"]
+    march = _maintenance(client, motorcycle_id, "oil_change", "Oil", "2025-03-01T09:00:00")
+    may = _maintenance(client, motorcycle_id, "oil_change", "Oil", "2025-05-01T09:00:00")
+    _maintenance(client, motorcycle_id, "custom", "Chain Lube", "2025-04-01T09:00:00")
+    lube = _maintenance(client, motorcycle_id, "custom", " chain lube", "2025-04-15T09:00:00")
+    seals = _maintenance(client, motorcycle_id, "custom", "Fork seals", "2025-04-20T09:00:00")
+    assert client.portal.call(_due_states, motorcycle_id) == {
+        ("oil_change", ""): (may["id"], "Oil"),
+        ("custom", "chain lube"): (lube["id"], " chain lube"),
+        ("custom", "fork seals"): (seals["id"], "Fork seals"),
+    }
+
+    client.delete(f"/api/v1/maintenance/{may['id']}").raise_for_status()
+    client.put(f"/api/v1/maintenance/{seals['id']}", json={"is_completed": False}).raise_for_status()
+    client.put(f"/api/v1/maintenance/{lube['id']}", json={"service_name": "Sprocket"}).raise_for_status()
+
+    incremental = client.portal.call(_due_states, motorcycle_id)
+    assert incremental[("oil_change", "")] == (march["id"], "Oil")
+    assert ("custom", "fork seals") not in incremental
+    assert incremental[("custom", "sprocket")] == (lube["id"], "Sprocket")
+    assert incremental[("custom", "chain lube")][1] == "Chain Lube"
+
+    client.portal.call(_rebuild)
+    assert client.portal.call(_due_states, motorcycle_id) == incremental
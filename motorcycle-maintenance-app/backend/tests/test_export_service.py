@@ -0,0 +1,44 @@
+# backend/tests/test_export_service.py
+import io
+
+import pytest
+
+from app.schemas.logs import LogCreate
+from app.services.export_service import format_decimal
+from app.services.ride_log_import import read_csv
+
+
+@pytest.mark.parametrize("value, decimal_separator, expected", [
+    (1234.5, ".", "1234.5"),
+    (1234.5, ",", "1234,5"),
+    (1e-05, ".", "0.00001"),
+    (1e20, ".", "100000000000000000000"),
+    (0.1 + 0.2, ",", "0,30000000000000004"),
+])
+def test_format_decimal_is_positional_without_grouping(value, decimal_separator, expected):
+    assert format_decimal(value, decimal_separator) == expected
+
+
+def test_exported_csv_reads_back_in(client, motorcycle):
+    client.post("/api/v1/logs/", json={
+        "motorcycle_id": motorcycle["id"], "start_date": "2025-06-01T08:00:00",
+        "start_mileage": 1234.5, "end_mileage": 21234.75, "fuel_consumed": 0.00001, "fuel_cost": 1e20
+    }).raise_for_status()
+
+    response = client.get("/api/v1/export/logs", params={"format": "csv", "motorcycle_id": motorcycle["id"]})
+    assert response.status_code == 200
+    assert response.text.startswith("id;")  # The default locale writes a decimal comma
+
+    rows = [LogCreate.model_validate(row.data) for row in read_csv(io.BytesIO(response.content))]
+    assert [(row.start_mileage, row.end_mileage, row.fuel_consumed, row.fuel_cost) for row in rows] == [
+        (1234.5, 21234.75, 0.00001, 1e20)
+    ]
+
+
+def test_comma_separated_csv_keeps_its_decimal_points():
+    content = b"motorcycle_id,start_date,start_mileage,end_mileage,notes\n1,2025-06-01T08:00:00,10.5,20.25,\"one, two\"\n"
+    [row] = read_csv(io.BytesIO(content))
+    assert row.data == {
+        "motorcycle_id": "1", "start_date": "2025-06-01T08:00:00",
+        "start_mileage": "10.5", "end_mileage": "20.25", "notes": "one, two"
+    }
@@ -0,0 +1,60 @@
+# backend/tests/test_fuel_stats.py
+import pytest
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.fuel_stats import MotorcycleFuelStats
+from app.services.fuel_stats_service import AMOUNT_FIELDS, FuelStatsService
+
+
+def _ride(client, motorcycle_id: int, end_mileage: float, fuel: float, cost=None) -> dict:
+    response = client.post("/api/v1/logs/", json={
+        "motorcycle_id": motorcycle_id, "start_date": "2025-06-01T08:00:00",
+        "start_mileage": 1000, "end_mileage": end_mileage, "fuel_consumed": fuel, "fuel_cost": cost
+    })
+    response.raise_for_status()
+    return response.json()
+
+
+async def _accumulator(motorcycle_id: int) -> tuple:
+    async with SessionLocal() as db:
+        row = await db.get(MotorcycleFuelStats, motorcycle_id)
+        return (
+            tuple(round(getattr(row, field), 6) for field in AMOUNT_FIELDS),
+            row.best_efficiency, row.best_ride_id, row.worst_efficiency, row.worst_ride_id
+        )
+
+
+async def _rebuild():
+    async with SessionLocal() as db:
+        await FuelStatsService(db).rebuild()
+
+
+def test_accumulator_follows_added_edited_and_deleted_rides(client, motorcycle):
+    motorcycle_id = motorcycle["id"]
+    _ride(client, motorcycle_id, 1200, 10, 20)
+    edited = _ride(client, motorcycle_id, 1150, 10, 15)
+    best = _ride(client, motorcycle_id, 1300, 10)
+    # Imported rides are written with Core and staged by hand
+    csv = f"motorcycle_id,start_date,start_mileage,end_mileage,fuel_consumed,fuel_cost\n{motorcycle_id},2025-06-02T08:00:00,1000,1100,10,18\n"
+    response = client.post("/api/v1/logs/import", files={"file": ("rides.csv", csv.encode())})
+    assert '"imported": 1' in response.text
+
+    client.delete(f"/api/v1/logs/{best['id']}").raise_for_status()  # The best ride goes
+    client.put(f"/api/v1/logs/{edited['id']}", json={"end_mileage": 1250}).raise_for_status()
+
+    stats = client.get("/api/v1/logs/fuel/statistics", params={"motorcycle_id": motorcycle_id}).json()
+    assert stats["total_fuel_consumed"] == 30
+    assert stats["total_fuel_cost"] == 53
+    assert stats["average_price_per_liter"] == pytest.approx((2 + 1.5 + 1.8) / 3)
+    assert stats["best_efficiency"]["value"] == 25
+    assert stats["worst_efficiency"]["value"] == 10
+    assert stats["average_efficiency"] == pytest.approx(55 / 3)
+    assert stats["efficiency_variance"] == pytest.approx((20 ** 2 + 25 ** 2 + 10 ** 2) / 3 - (55 / 3) ** 2)
+
+    incremental = client.portal.call(_accumulator, motorcycle_id)
+    assert incremental[1:3] == (25, edited["id"])
+    assert incremental[3] == 10
+
+    client.portal.call(_rebuild)
+    assert client.portal.call(_accumulator, motorcycle_id) == incremental
@@ -0,0 +1,72 @@
+# backend/tests/test_gps_track.py
+import numpy as np
+import pytest
+
+from app.services.gps_track import SCALE, _HEADER, decode_track, encode_track, simplify
+
+
+def _ride(count: int, seed: int = 1) -> np.ndarray:
+    """A 1 Hz recording at 72 km/h along a wandering road"""
+    rng = np.random.default_rng(seed)
+    heading = np.cumsum(rng.normal(0, 0.05, count))
+    step = 20 / 111_000  # Degrees of latitude in 20 meters
+    latitude = 52.0 + np.cumsum(np.cos(heading) * step)
+    longitude = 5.0 + np.cumsum(np.sin(heading) * step / np.cos(np.radians(52.0)))
+    return np.column_stack((latitude, longitude))
+
+
+@pytest.mark.parametrize("points, width", [
+    (_ride(1000), 1),
+    (_ride(1000) * [1, -1], 1),  # West of Greenwich
+    (np.array([[52.0, 5.0], [52.01, 5.0], [52.0, 5.01]]), 2),  # A kilometer between fixes
+    (np.array([[-33.9, 151.2], [52.0, 5.0]]), 4),
+    (np.array([[52.0, 5.0]]), 1),
+    (np.empty((0, 2)), 1),
+])
+def test_encoded_track_decodes_to_its_fixed_point_coordinates(points, width):
+    blob = encode_track(points)
+    assert _HEADER.unpack_from(blob)[1:] == (width, len(points))
+    decoded = decode_track(blob)
+    assert decoded.shape == points.shape
+    assert np.abs(decoded - points).max(initial=0) <= 0.5 / SCALE + 1e-12
+
+
+def test_simplify_keeps_corners_and_drops_what_the_tolerance_hides():
+    corner = np.array([[52.0, 5.0], [52.0005, 5.0], [52.001, 5.0], [52.001, 5.001], [52.001, 5.002]])
+    assert simplify(corner, 5).tolist() == [0, 2, 4]
+    wobble = np.column_stack((np.linspace(52.0, 52.01, 50), 5.0 + np.tile([0, 1e-5], 25)))  # 0.7 m sideways
+    assert simplify(wobble, 2).tolist() == [0, 49]
+
+
+def _gpx(points: np.ndarray) -> bytes:
+    trackpoints = "".join(f'<trkpt lat="{lat:.6f}" lon="{lon:.6f}"/>' for lat, lon in points)
+    return (
+        '<?xml version="1.0"?><gpx xmlns="http://www.topografix.com/GPX/1/1">'
+        f"<trk><trkseg>{trackpoints}</trkseg></trk></gpx>"
+    ).encode()
+
+
+def test_track_is_served_at_the_requested_level_of_detail(client, motorcycle):
+    ride = client.post("/api/v1/logs/", json={
+        "motorcycle_id": motorcycle["id"], "start_date": "2025-06-01T08:00:00", "start_mileage": 1000
+    }).json()
+    points = _ride(2000).round(6)  # As the GPX file holds them
+    response = client.put(f"/api/v1/logs/{ride['id']}/track", files={"file": ("ride.gpx", _gpx(points))})
+    assert response.status_code == 200
+    summary = response.json()
+    counts = [level["point_count"] for level in summary["levels"]]
+    assert counts[0] == 2000 and counts == sorted(counts, reverse=True)
+    assert summary["size"] < 2000 * 4  # All levels together, against 16 bytes a point as floats
+
+    path = f"/api/v1/logs/{ride['id']}/track"
+    full = client.get(path).json()
+    assert full["level"] == 0
+    assert np.abs(np.array(full["points"]) - points).max() <= 0.5 / SCALE + 1e-9
+
+    coarse = client.get(path, params={"resolution": 10}).json()
+    assert coarse["tolerance"] <= 10
+    assert coarse["point_count"] == counts[coarse["level"]] < 2000
+    assert client.get(path, params={"max_points": counts[-1]}).json()["level"] == len(counts) - 1
+
+    client.delete(f"/api/v1/logs/{ride['id']}").raise_for_status()
+    assert client.get(path).status_code == 404
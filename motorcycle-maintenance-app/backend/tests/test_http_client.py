@@ -0,0 +1,50 @@
+# backend/tests/test_http_client.py
+import asyncio
+import time
+
+from app.core.http_client import WebhookHttpClient
+
+
+async def _receiver(connections: list, active: list, peak: list):
+    """A keep-alive receiver that counts connections and requests handled at once"""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        while await reader.readuntil(b"\r\n\r\n"):
+            active.append(1)
+            peak[0] = max(peak[0], len(active))
+            await asyncio.sleep(0.2)
+            active.pop()
+            writer.write(b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def _post_concurrently(per_host_limit: int, calls: int):
+    connections, active, peak = [], [], [0]
+    server = await _receiver(connections, active, peak)
+    http = WebhookHttpClient(
+        max_connections=10, max_keepalive_connections=10, keepalive_expiry=30, per_host_limit=per_host_limit,
+        connect_timeout=1, read_timeout=5, timeout=5
+    )
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/hook"
+    try:
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(http.post(url, b"{}", {}) for _ in range(calls)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await http.close()
+        server.close()
+    return [response.status_code for response in responses], peak[0], len(connections), elapsed
+
+
+def test_calls_to_one_host_are_capped_and_reuse_their_connection(client):
+    statuses, peak, connections, elapsed = client.portal.call(_post_concurrently, 1, 4)
+    assert statuses == [204] * 4
+    assert peak == 1
+    assert connections == 1  # Kept alive between calls
+    assert elapsed >= 0.8
+
+    statuses, peak, connections, elapsed = client.portal.call(_post_concurrently, 4, 4)
+    assert peak == 4
+    assert elapsed < 0.6
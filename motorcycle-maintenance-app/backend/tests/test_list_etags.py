@@ -0,0 +1,47 @@
+# backend/tests/test_list_etags.py
+
+
+def _ride(client, motorcycle_id: int):
+    client.post("/api/v1/logs/", json={
+        "motorcycle_id": motorcycle_id, "start_date": "2025-06-01T08:00:00", "start_mileage": 1000, "end_mileage": 1100
+    }).raise_for_status()
+
+
+def test_unchanged_list_revalidates_with_a_304(client, motorcycle):
+    params = {"motorcycle_id": motorcycle["id"]}
+    first = client.get("/api/v1/logs/", params=params)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    revalidated = client.get("/api/v1/logs/", params=params, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.content == b""
+
+    # Weak comparison, and any of a list of tags
+    strong = etag[2:]
+    assert client.get("/api/v1/logs/", params=params, headers={"If-None-Match": f'"other", {strong}'}).status_code == 304
+
+    other_query = client.get("/api/v1/logs/", params={**params, "limit": 5}, headers={"If-None-Match": etag})
+    assert other_query.status_code == 200
+    assert other_query.headers["ETag"] != etag
+
+
+def test_writes_change_the_etag_of_the_lists_they_touch(client, motorcycle):
+    other = client.post("/api/v1/motorcycles/", json={
+        "name": "Other", "make": "Test", "model": "Mark", "year": 2021, "current_mileage": 0.0
+    }).json()
+    params = {"motorcycle_id": motorcycle["id"]}
+    etag = client.get("/api/v1/logs/", params=params).headers["ETag"]
+    fleet_etag = client.get("/api/v1/logs/").headers["ETag"]
+
+    _ride(client, other["id"])
+    assert client.get("/api/v1/logs/", params=params, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/v1/logs/", headers={"If-None-Match": fleet_etag}).status_code == 200
+
+    _ride(client, motorcycle["id"])
+    response = client.get("/api/v1/logs/", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 1
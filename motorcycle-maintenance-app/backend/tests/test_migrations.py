@@ -0,0 +1,37 @@
+# backend/tests/test_migrations.py
+import os
+import tempfile
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import inspect
+
+import app.models  # noqa: F401 - register all tables on Base.metadata
+from app.core.database import Base, build_engines
+from app.core.migrations import get_alembic_config
+
+
+def _migrate_and_compare(connection) -> list:
+    config = get_alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
+    assert inspect(connection).get_table_names() == ["alembic_version"]
+    command.upgrade(config, "head")
+    context = MigrationContext.configure(connection, opts={"render_as_batch": True})
+    return compare_metadata(context, Base.metadata)
+
+
+async def _schema_differences(url: str) -> list:
+    writer, _ = build_engines(url)
+    try:
+        async with writer.begin() as connection:
+            return await connection.run_sync(_migrate_and_compare)
+    finally:
+        await writer.dispose()
+
+
+def test_migrations_build_the_models_schema_and_downgrade_cleanly(client):
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='rideway-migrations-'), 'migrations.db')}"
+    assert client.portal.call(_schema_differences, url) == []
@@ -0,0 +1,61 @@
+# backend/tests/test_mileage_index.py
+from app.core.database import SessionLocal
+from app.models.maintenance import MaintenanceRecord
+from app.models.motorcycle import Motorcycle
+from app.services import mileage_index as mileage_index_module
+from app.services.mileage_index import MileageThresholdIndex, mileage_index
+
+
+def test_thresholds_are_crossed_once_reached():
+    index = MileageThresholdIndex()
+    index.set_threshold((1, "oil_change", ""), 5000)
+    index.set_threshold((1, "custom", "chain lube"), 5500)
+    index.set_threshold((2, "oil_change", ""), 5200)
+
+    assert index.crossed(1, 4000, 4999) == []
+    assert index.crossed(1, 4000, 5000) == [((1, "oil_change", ""), 5000)]
+    assert index.crossed(1, 5000, 6000) == [((1, "custom", "chain lube"), 5500)]
+    assert index.crossed(1, 6000, 5000) == []
+
+    index.set_threshold((1, "oil_change", ""), 8000)
+    index.set_threshold((1, "custom", "chain lube"), None)
+    assert index.crossed(1, 4000, 7000) == []
+    assert index.crossed(1, 7000, 8000) == [((1, "oil_change", ""), 8000)]
+    assert len(index) == 2
+
+
+async def _set_next_service_mileage(record_id: int, mileage: float):
+    async with SessionLocal() as db:
+        record = await db.get(MaintenanceRecord, record_id)
+        record.next_service_mileage = mileage
+        await db.commit()
+
+
+async def _move_and_roll_back(motorcycle_id: int, mileage: float):
+    async with SessionLocal() as db:
+        motorcycle = await db.get(Motorcycle, motorcycle_id)
+        motorcycle.current_mileage = mileage
+        await db.flush()
+        await db.rollback()
+
+
+def test_committed_mileage_writes_report_crossed_thresholds(client, motorcycle, monkeypatch):
+    crossings = []
+    monkeypatch.setattr(mileage_index_module, "_emit", crossings.extend)
+    motorcycle_id = motorcycle["id"]
+    response = client.post("/api/v1/maintenance/", json={
+        "motorcycle_id": motorcycle_id, "service_type": "oil_change", "service_name": "Oil",
+        "mileage_at_service": 1000, "performed_at": "2025-03-01T09:00:00"
+    })
+    response.raise_for_status()
+    client.portal.call(_set_next_service_mileage, response.json()["id"], 1500)
+    key = (motorcycle_id, "oil_change", "")
+    assert mileage_index.crossed(motorcycle_id, 1000, 1500) == [(key, 1500)]
+
+    client.portal.call(_move_and_roll_back, motorcycle_id, 2000)
+    client.post(f"/api/v1/motorcycles/{motorcycle_id}/mileage?new_mileage=1499").raise_for_status()
+    assert crossings == []
+
+    client.post(f"/api/v1/motorcycles/{motorcycle_id}/mileage?new_mileage=1500").raise_for_status()
+    client.post(f"/api/v1/motorcycles/{motorcycle_id}/mileage?new_mileage=1600").raise_for_status()
+    assert crossings == [(key, 1500)]
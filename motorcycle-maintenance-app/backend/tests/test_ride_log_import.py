@@ -0,0 +1,83 @@
+# backend/tests/test_ride_log_import.py
+import json
+
+GPX = b"""<?xml version="1.0"?>
+<gpx xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><name>Loop</name><trkseg>
+    <trkpt lat="52.0" lon="5.0"><time>2025-05-01T08:00:00Z</time></trkpt>
+    <trkpt lat="52.1" lon="5.0"><time>2025-05-01T08:20:00Z</time></trkpt>
+  </trkseg></trk>
+</gpx>"""
+
+
+def _import(client, filename: str, content: bytes, motorcycle_id=None) -> dict:
+    data = {"motorcycle_id": str(motorcycle_id)} if motorcycle_id is not None else {}
+    response = client.post("/api/v1/logs/import", data=data, files={"file": (filename, content)})
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1]["done"]
+    return lines[-1]
+
+
+def _same_day_csv(motorcycle_id: int) -> bytes:
+    rows = ["motorcycle_id,start_date,start_mileage,end_mileage"]
+    rows += [
+        f"{motorcycle_id},2025-05-01T00:00:00,{start},{end}"
+        for start, end in ((1000, 1050), (1050, 1120), (1120, 1200))
+    ]
+    return "\n".join(rows).encode()
+
+
+def _current_mileage(client, motorcycle_id: int) -> float:
+    return client.get(f"/api/v1/motorcycles/{motorcycle_id}").json()["current_mileage"]
+
+
+def test_csv_rides_on_the_same_day_are_all_imported(client, motorcycle):
+    totals = _import(client, "rides.csv", _same_day_csv(motorcycle["id"]))
+
+    assert totals["imported"] == 3
+    assert totals["duplicates"] == 0
+    assert _current_mileage(client, motorcycle["id"]) == 1200
+
+
+def test_reimported_csv_rides_are_duplicates(client, motorcycle):
+    _import(client, "rides.csv", _same_day_csv(motorcycle["id"]))
+    totals = _import(client, "rides.csv", _same_day_csv(motorcycle["id"]))
+
+    assert totals["imported"] == 0
+    assert totals["duplicates"] == 3
+
+
+def test_reimported_gpx_track_is_a_duplicate_after_the_odometer_moved(client, motorcycle):
+    assert _import(client, "loop.gpx", GPX, motorcycle["id"])["imported"] == 1
+    moved = _current_mileage(client, motorcycle["id"])
+    assert moved > 1000
+
+    totals = _import(client, "loop.gpx", GPX, motorcycle["id"])
+    assert totals["imported"] == 0
+    assert totals["duplicates"] == 1
+    assert _current_mileage(client, motorcycle["id"]) == moved
+
+
+def test_import_never_lowers_a_higher_mileage(client, motorcycle):
+    client.post(f"/api/v1/motorcycles/{motorcycle['id']}/mileage?new_mileage=5000").raise_for_status()
+    totals = _import(client, "rides.csv", _same_day_csv(motorcycle["id"]))
+
+    assert totals["imported"] == 3
+    assert _current_mileage(client, motorcycle["id"]) == 5000
+
+
+def test_gpx_track_on_a_new_motorcycle_has_a_distance(client):
+    response = client.post("/api/v1/motorcycles/", json={
+        "name": "New", "make": "Test", "model": "Mark", "year": 2025, "current_mileage": 0.0
+    })
+    response.raise_for_status()
+    motorcycle_id = response.json()["id"]
+    assert _import(client, "loop.gpx", GPX, motorcycle_id)["imported"] == 1
+    rows = f"motorcycle_id,start_date,start_mileage,end_mileage\n{motorcycle_id},2025-04-01T08:00:00,0,30\n"
+    assert _import(client, "rides.csv", rows.encode())["imported"] == 1
+
+    rides = client.get("/api/v1/logs/", params={"motorcycle_id": motorcycle_id}).json()
+    distances = {ride["start_date"][:10]: ride["distance"] for ride in rides}
+    assert distances["2025-04-01"] is None  # A CSV mileage of 0 is still missing
+    assert round(distances["2025-05-01"], 1) == 11.1
@@ -0,0 +1,43 @@
+# backend/tests/test_ride_stats.py
+import pytest
+
+
+def _ride(client, motorcycle_id: int, start_date: str, distance: float, fuel=None, cost=None, trip_type=None):
+    client.post("/api/v1/logs/", json={
+        "motorcycle_id": motorcycle_id, "start_date": start_date, "start_mileage": 1000,
+        "end_mileage": 1000 + distance, "fuel_consumed": fuel, "fuel_cost": cost, "trip_type": trip_type
+    }).raise_for_status()
+
+
+def _stats(client, motorcycle_id: int, **params) -> list:
+    response = client.get("/api/v1/logs/stats", params={"motorcycle_id": motorcycle_id, **params})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_rides_are_aggregated_per_bucket_and_group(client, motorcycle):
+    motorcycle_id = motorcycle["id"]
+    assert _stats(client, motorcycle_id)[0]["rides"] == 0  # The single row, even without rides
+
+    _ride(client, motorcycle_id, "2025-06-01T18:00:00", 100, 5, 10, "leisure")  # A Sunday
+    _ride(client, motorcycle_id, "2025-06-02T07:30:00", 40, 2, 3, "commute")  # The Monday after
+    _ride(client, motorcycle_id, "2025-06-08T09:00:00", 60, trip_type="commute")
+    _ride(client, motorcycle_id, "2025-07-01T09:00:00", 30, 1, 2, "commute")
+
+    weekly = _stats(client, motorcycle_id, interval="weekly")
+    assert [(bucket["period"], bucket["rides"], bucket["distance"]) for bucket in weekly] == [
+        ("2025-05-26", 1, 100), ("2025-06-02", 2, 100), ("2025-06-30", 1, 30)
+    ]
+
+    monthly = _stats(client, motorcycle_id, interval="monthly", group_by="trip_type")
+    assert [(bucket["period"], bucket["group"], bucket["rides"]) for bucket in monthly] == [
+        ("2025-06", "commute", 2), ("2025-06", "leisure", 1), ("2025-07", "commute", 1)
+    ]
+    june_commutes = monthly[0]
+    assert june_commutes["fuel"] == 2 and june_commutes["fuel_cost"] == 3
+    assert june_commutes["average_efficiency"] == 20  # The ride without fuel has no efficiency to average
+    assert june_commutes["average_price_per_liter"] == 1.5
+
+    [total] = _stats(client, motorcycle_id, start_date="2025-06-02T00:00:00", end_date="2025-06-30T23:59:59")
+    assert (total["rides"], total["distance"], total["fuel"]) == (2, 100, 2)
+    assert total["average_efficiency"] == pytest.approx(20)
@@ -0,0 +1,86 @@
+# backend/tests/test_telemetry.py
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.telemetry import OdometerReading
+from app.services.telemetry import downsample, odometer_log
+
+
+def _samples(start: datetime, mileages) -> dict:
+    return {"samples": [
+        {"recorded_at": (start + timedelta(seconds=second)).isoformat(), "mileage": mileage}
+        for second, mileage in enumerate(mileages)
+    ]}
+
+
+async def _readings(motorcycle_id: int) -> list:
+    async with SessionLocal() as db:
+        return (await db.execute(
+            select(OdometerReading.recorded_at, OdometerReading.mileage)
+            .where(OdometerReading.motorcycle_id == motorcycle_id)
+            .order_by(OdometerReading.recorded_at)
+        )).all()
+
+
+def test_flush_writes_the_samples_and_moves_current_mileage(client, motorcycle):
+    path = f"/api/v1/motorcycles/{motorcycle['id']}/telemetry"
+    start = datetime(2026, 3, 1, 8)
+    response = client.post(path, json=_samples(start, [1000.5, 1001.0, 1001.5]))
+    assert response.status_code == 202
+    client.post(path, json=_samples(start + timedelta(minutes=1), [1002.0, 1001.9])).raise_for_status()
+    client.portal.call(odometer_log.flush)
+
+    assert [mileage for _, mileage in client.portal.call(_readings, motorcycle["id"])] == [
+        1000.5, 1001.0, 1001.5, 1002.0, 1001.9
+    ]
+    assert client.get(f"/api/v1/motorcycles/{motorcycle['id']}").json()["current_mileage"] == 1002.0
+
+    # Samples behind a mileage entered by hand never move it back
+    client.post(f"/api/v1/motorcycles/{motorcycle['id']}/mileage?new_mileage=1500").raise_for_status()
+    client.post(path, json=_samples(start + timedelta(minutes=2), [1003.0])).raise_for_status()
+    client.portal.call(odometer_log.flush)
+    assert client.get(f"/api/v1/motorcycles/{motorcycle['id']}").json()["current_mileage"] == 1500
+
+
+def test_oversized_batches_and_a_full_buffer_are_refused(client, motorcycle, monkeypatch):
+    path = f"/api/v1/motorcycles/{motorcycle['id']}/telemetry"
+    start = datetime(2026, 3, 1, 8)
+    monkeypatch.setattr(settings, "TELEMETRY_MAX_SAMPLES", 2)
+    assert client.post(path, json=_samples(start, [1, 2, 3])).status_code == 413
+    assert client.post("/api/v1/motorcycles/999999/telemetry", json=_samples(start, [1])).status_code == 404
+
+    monkeypatch.setattr(odometer_log, "max_buffered", odometer_log.buffered + 1)
+    assert client.post(path, json=_samples(start, [1])).status_code == 202
+    full = client.post(path, json=_samples(start, [2]))
+    assert full.status_code == 503
+    assert full.headers["Retry-After"] == str(settings.TELEMETRY_FLUSH_INTERVAL)
+
+
+async def _store(motorcycle_id: int, moments: list):
+    async with SessionLocal() as db:
+        await db.execute(insert(OdometerReading), [
+            {"motorcycle_id": motorcycle_id, "recorded_at": moment, "mileage": float(number)}
+            for number, moment in enumerate(moments)
+        ])
+        await db.commit()
+
+
+async def _downsample(before: datetime, interval: int) -> int:
+    async with SessionLocal() as db:
+        return await downsample(db, before, interval)
+
+
+def test_downsampling_keeps_the_last_reading_per_interval(client, motorcycle):
+    hour = datetime(2020, 1, 1, 10)
+    moments = [hour + timedelta(minutes=minute) for minute in (0, 20, 59, 60, 61, 200)]
+    client.portal.call(_store, motorcycle["id"], moments)
+    cutoff = hour + timedelta(minutes=150)
+
+    client.portal.call(_downsample, cutoff, 3600)
+    kept = [recorded_at for recorded_at, _ in client.portal.call(_readings, motorcycle["id"])]
+    # 10:59 and 11:01 end their hours; 13:20 is after the cutoff and stays raw
+    assert kept == [moments[2], moments[4], moments[5]]
+    assert client.portal.call(_downsample, cutoff, 3600) == 0
@@ -0,0 +1,46 @@
+# backend/tests/test_upcoming_maintenance.py
+from datetime import datetime, timedelta
+
+from app.core.database import SessionLocal
+from app.schemas.maintenance import MaintenanceCreate
+from app.services.maintenance_service import MaintenanceService
+
+
+async def _service(motorcycle_id: int, service_type: str, days_ago: int, mileage: float, intervals: dict) -> int:
+    async with SessionLocal() as db:
+        record = await MaintenanceService(db).create_maintenance_record(MaintenanceCreate(
+            motorcycle_id=motorcycle_id, service_type=service_type, service_name=service_type.replace("_", " "),
+            mileage_at_service=mileage, performed_at=datetime.utcnow() - timedelta(days=days_ago), **intervals
+        ))
+        return record.id
+
+
+def test_upcoming_and_overdue_read_the_latest_service_only(client, motorcycle):
+    motorcycle_id = motorcycle["id"]
+    ids = {}
+    for service_type, days_ago, mileage, intervals in (
+        ("oil_change", 400, 200, {"service_interval_months": 1}),  # Superseded by the next one
+        ("oil_change", 50, 900, {"service_interval_months": 2}),  # Due in about ten days
+        ("brake_service", 40, 500, {"service_interval_months": 1}),  # Ten days overdue
+        ("spark_plug", 10, 300, {"service_interval_km": 600}),  # Due at 900, the bike is at 1000
+        ("chain_maintenance", 0, 1000, {"service_interval_km": 500}),  # Due at 1500, within 1000 km
+        ("air_filter", 0, 1000, {"service_interval_months": 12, "service_interval_km": 10000}),
+    ):
+        ids[service_type] = client.portal.call(_service, motorcycle_id, service_type, days_ago, mileage, intervals)
+
+    upcoming = client.get("/api/v1/maintenance/upcoming", params={"motorcycle_id": motorcycle_id}).json()
+    by_type = {item["service_type"]: item for item in upcoming}
+    assert set(by_type) == {"oil_change", "brake_service", "spark_plug", "chain_maintenance"}
+    assert by_type["oil_change"]["id"] == ids["oil_change"]
+    assert (by_type["oil_change"]["priority"], by_type["oil_change"]["is_overdue"]) == ("medium", False)
+    assert by_type["brake_service"]["days_overdue"] == 10
+    assert by_type["spark_plug"]["mileage_overdue"] == 100
+    assert by_type["chain_maintenance"]["priority"] == "medium"
+    # Overdue first, then by due date
+    assert [item["priority"] for item in upcoming] == sorted(
+        (item["priority"] for item in upcoming), key=("high", "medium", "low").index
+    )
+
+    overdue = client.get("/api/v1/maintenance/overdue", params={"motorcycle_id": motorcycle_id}).json()
+    assert {item["service_type"] for item in overdue} == {"brake_service", "spark_plug"}
+    assert all(item["priority"] == "high" for item in overdue)
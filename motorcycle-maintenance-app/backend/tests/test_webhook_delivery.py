@@ -0,0 +1,193 @@
+# backend/tests/test_webhook_delivery.py
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import SessionLocal, build_engines
+from app.models.motorcycle import Motorcycle
+from app.models.webhook import WebhookEvent, WebhookOutbox
+from app.services import webhook_delivery
+from app.services.webhook_delivery import DELIVERED, FAILED, PENDING, WebhookDispatcher, _Batch, webhook_dispatcher
+from app.services.webhook_health import webhook_health
+from app.services.webhook_registry import webhook_registry
+from app.services.webhook_service import WebhookService
+
+
+@pytest.fixture
+def dispatcher(client):
+    """A dispatcher claimed by hand, with the app's own one stopped meanwhile"""
+    client.portal.call(webhook_dispatcher.stop)
+    yield WebhookDispatcher(workers=4, poll_interval=60, drain_timeout=1)
+    client.portal.call(_start_app_dispatcher)
+
+
+async def _start_app_dispatcher():
+    webhook_dispatcher.start()
+
+
+async def _queue(webhook_id: int, rows: dict) -> dict:
+    """Outbox rows by name, from (attempts, next_attempt_at, leased_until)"""
+    async with SessionLocal() as db:
+        ids = {}
+        for name, (attempts, next_attempt_at, leased_until) in rows.items():
+            event = WebhookEvent(event_type="maintenance_due", payload=b'{"name": "%s"}' % name.encode())
+            db.add(event)
+            await db.flush()
+            delivery = WebhookOutbox(
+                webhook_id=webhook_id,
+                event_id=event.id,
+                status=PENDING,
+                attempts=attempts,
+                next_attempt_at=next_attempt_at,
+                leased_until=leased_until
+            )
+            db.add(delivery)
+            await db.flush()
+            ids[name] = delivery.id
+        await db.commit()
+    return ids
+
+
+def _webhook(client, url: str = "http://127.0.0.1:9/hook", **fields) -> int:
+    response = client.post("/api/v1/webhooks/", json={
+        "name": "Test", "url": url, "event_types": ["maintenance_due"], **fields
+    })
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def test_coalescing_leaves_in_flight_and_backing_off_deliveries_alone(client, dispatcher):
+    webhook_id = _webhook(client, coalesce_window=3600)
+
+    now = datetime.utcnow()
+    lease = now + dispatcher.lease
+    ids = client.portal.call(_queue, webhook_id, {
+        "due": (0, now - timedelta(seconds=1), None),
+        "in_flight": (0, lease, lease),
+        "backing_off": (1, now + timedelta(seconds=600), None),
+        "waiting": (0, now + timedelta(seconds=1800), None),
+    })
+
+    batches, _ = client.portal.call(dispatcher._claim, 10)
+
+    assert [sorted(batch.ids) for batch in batches] == [sorted([ids["due"], ids["waiting"]])]
+
+
+async def _slow_receiver(delay: float):
+    """A local receiver answering every request after delay seconds"""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.readuntil(b"\r\n\r\n")
+        await asyncio.sleep(delay)
+        writer.write(b"HTTP/1.1 204 No Content\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def _write_during_delivery(dispatcher: WebhookDispatcher, batch: _Batch, motorcycle_id: int):
+    """Seconds a write takes while the delivery is in flight, and whether the delivery was still sending"""
+    delivery = asyncio.create_task(dispatcher._deliver(batch))
+    await asyncio.sleep(0.3)  # The call is waiting on the receiver by now
+    started = time.perf_counter()
+    async with webhook_delivery.SessionLocal() as db:
+        await db.execute(update(Motorcycle).where(Motorcycle.id == motorcycle_id).values(notes="written"))
+        await db.commit()
+    elapsed = time.perf_counter() - started
+    sending = not delivery.done()
+    await delivery
+    return elapsed, sending
+
+
+def test_slow_delivery_does_not_hold_the_writer_connection(client, dispatcher, motorcycle, monkeypatch):
+    # The production profile's writer pool has a single connection
+    writer, reader = build_engines(settings.DATABASE_URL, "production")
+    monkeypatch.setattr(webhook_delivery, "SessionLocal", async_sessionmaker(
+        bind=writer, autoflush=False, expire_on_commit=False
+    ))
+    server = client.portal.call(_slow_receiver, 1.5)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        webhook_id = _webhook(client, url=f"http://127.0.0.1:{port}/hook")
+        ids = client.portal.call(_queue, webhook_id, {"slow": (0, datetime.utcnow(), None)})
+        batch = _Batch([ids["slow"]], webhook_id, 0, b"{}")
+
+        elapsed, sending = client.portal.call(_write_during_delivery, dispatcher, batch, motorcycle["id"])
+    finally:
+        server.close()
+        client.portal.call(writer.dispose)
+        client.portal.call(reader.dispose)
+
+    assert sending
+    assert elapsed < 0.5
+
+
+async def _outbox_row(outbox_id: int):
+    async with SessionLocal() as db:
+        return (await db.execute(
+            select(WebhookOutbox.status, WebhookOutbox.attempts, WebhookOutbox.next_attempt_at)
+            .where(WebhookOutbox.id == outbox_id)
+        )).one()
+
+
+def test_open_circuit_does_not_spend_the_retry_budget(client, dispatcher):
+    # Nothing listens on port 9, so every call that is made fails
+    webhook_id = _webhook(client, max_retries=1, retry_delay=1)
+    ids = client.portal.call(_queue, webhook_id, {"held": (0, datetime.utcnow(), None)})
+    breaker = webhook_health.breaker(webhook_id)
+    breaker._open(datetime.utcnow())
+
+    # Far more short-circuits than max_retries allows attempts
+    for _ in range(5):
+        client.portal.call(dispatcher._deliver, _Batch([ids["held"]], webhook_id, 0, b"{}"))
+        status, attempts, next_attempt_at = client.portal.call(_outbox_row, ids["held"])
+        assert (status, attempts) == (PENDING, 0)
+        assert next_attempt_at == breaker.open_until
+
+    # Once the circuit lets calls through again, the budget is intact
+    webhook_health.forget(webhook_id)
+    client.portal.call(dispatcher._deliver, _Batch([ids["held"]], webhook_id, 0, b"{}"))
+    assert client.portal.call(_outbox_row, ids["held"])[:2] == (PENDING, 1)
+    client.portal.call(dispatcher._deliver, _Batch([ids["held"]], webhook_id, 1, b"{}"))
+    assert client.portal.call(_outbox_row, ids["held"])[:2] == (FAILED, 2)
+
+
+async def _raise_event(webhook_ids: List[int]) -> List[int]:
+    async with SessionLocal() as db:
+        targets = [await webhook_registry.get(db, webhook_id) for webhook_id in webhook_ids]
+        deliveries = await WebhookService(db).send_webhook("fan_out_test", {"n": 1}, webhooks=targets)
+        await db.commit()
+        return [delivery.id for delivery in deliveries]
+
+
+async def _claim_and_send(dispatcher: WebhookDispatcher, outbox_ids: List[int]):
+    batches, _ = await dispatcher._claim(dispatcher.capacity)
+    mine = [batch for batch in batches if batch.ids[0] in outbox_ids]
+    started = time.perf_counter()
+    await asyncio.gather(*(dispatcher._run(batch) for batch in mine))
+    return mine, time.perf_counter() - started
+
+
+def test_subscribers_of_an_event_share_its_body_and_are_sent_concurrently(client, dispatcher):
+    servers = [client.portal.call(_slow_receiver, 1) for _ in range(3)]
+    try:
+        webhook_ids = [
+            _webhook(client, url=f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/hook")
+            for server in servers
+        ]
+        outbox_ids = client.portal.call(_raise_event, webhook_ids)
+        batches, elapsed = client.portal.call(_claim_and_send, dispatcher, outbox_ids)
+    finally:
+        for server in servers:
+            server.close()
+
+    assert sorted(batch.webhook_id for batch in batches) == webhook_ids
+    assert all(batch.body is batches[0].body for batch in batches)
+    assert elapsed < 2  # Three receivers taking a second each
+    assert [client.portal.call(_outbox_row, outbox_id)[0] for outbox_id in outbox_ids] == [DELIVERED] * 3
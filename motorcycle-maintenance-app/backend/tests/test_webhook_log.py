@@ -0,0 +1,33 @@
+# backend/tests/test_webhook_log.py
+import asyncio
+
+import pytest
+
+from app.services import webhook_log
+from app.services.webhook_log import DELIVERED, DeliveryLog
+
+
+class _Unavailable:
+    async def __aenter__(self):
+        raise ConnectionError("database unavailable")
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def test_buffer_keeps_the_newest_attempts_while_writes_fail(monkeypatch):
+    monkeypatch.setattr(webhook_log, "SessionLocal", _Unavailable)
+    log = DeliveryLog(flush_interval=60, batch_size=100, max_buffered=5)
+    dropped = webhook_log.log_dropped.samples()[0][1] if webhook_log.log_dropped.samples() else 0
+
+    for outbox_id in range(4):
+        log.record(webhook_id=1, outbox_id=outbox_id, attempt=1, status=DELIVERED)
+    with pytest.raises(ConnectionError):
+        asyncio.run(log.flush())
+    for outbox_id in range(4, 8):
+        log.record(webhook_id=1, outbox_id=outbox_id, attempt=1, status=DELIVERED)
+    with pytest.raises(ConnectionError):
+        asyncio.run(log.flush())
+
+    assert [entry["outbox_id"] for entry in log._buffer] == [3, 4, 5, 6, 7]
+    assert webhook_log.log_dropped.samples()[0][1] - dropped == 3
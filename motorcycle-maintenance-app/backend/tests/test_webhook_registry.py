@@ -0,0 +1,46 @@
+# backend/tests/test_webhook_registry.py
+from app.core.database import SessionLocal
+from app.services.webhook_registry import registry_loads, webhook_registry
+
+
+async def _routes(ids: set) -> dict:
+    async with SessionLocal() as db:
+        return {
+            event_type: [target.id for target in await webhook_registry.subscribers(db, event_type) if target.id in ids]
+            for event_type in ("maintenance_due", "motorcycle_created")
+        }
+
+
+def _loads() -> float:
+    return dict(registry_loads.samples()).get((), 0)
+
+
+def test_events_route_to_their_subscribers_and_catch_all_webhooks(client):
+    ids = {}
+    for name, event_types in (("due", ["maintenance_due", "maintenance_due"]), ("all", None), ("created", ["motorcycle_created"])):
+        response = client.post("/api/v1/webhooks/", json={
+            "name": name, "url": "http://127.0.0.1:9/hook", "event_types": event_types
+        })
+        response.raise_for_status()
+        ids[name] = response.json()["id"]
+    try:
+        mine = set(ids.values())
+        assert client.portal.call(_routes, mine) == {
+            "maintenance_due": sorted((ids["due"], ids["all"])),
+            "motorcycle_created": sorted((ids["all"], ids["created"])),
+        }
+
+        loads = _loads()
+        client.portal.call(_routes, mine)
+        assert _loads() == loads  # Served from the index
+
+        client.put(f"/api/v1/webhooks/{ids['due']}", json={"event_types": ["motorcycle_created"]}).raise_for_status()
+        client.put(f"/api/v1/webhooks/{ids['all']}", json={"is_active": False}).raise_for_status()
+        assert client.portal.call(_routes, mine) == {
+            "maintenance_due": [],
+            "motorcycle_created": sorted((ids["due"], ids["created"])),
+        }
+        assert _loads() == loads + 1
+    finally:
+        for webhook_id in ids.values():
+            client.delete(f"/api/v1/webhooks/{webhook_id}").raise_for_status()